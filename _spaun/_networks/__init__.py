@@ -1,3 +1,5 @@
+from .neuron_inhibit import NeuronInhibition
+from .batched_ensarray import BatchedEnsembleArray
 from .workingmemory import InputGatedMemory
 from .workingmemory import InputGatedCleanupMemory
 from .workingmemory import InputGatedCleanupPlusMemory
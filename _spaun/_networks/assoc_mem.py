@@ -3,12 +3,13 @@ import warnings
 import numpy as np
 
 import nengo
-from nengo.networks import EnsembleArray
 from nengo.dists import Choice, Exponential, Uniform
 from nengo.exceptions import ValidationError
-from nengo.utils.compat import is_iterable, range
+from nengo.utils.compat import is_iterable
 from nengo.utils.network import with_self
 
+from .batched_ensarray import BatchedEnsembleArray
+
 
 class AssociativeMemory(nengo.Network):
     """Associative memory network.
@@ -108,24 +109,23 @@ class AssociativeMemory(nengo.Network):
         self._default_output_vectors = {}
 
         # -- Create the core network
+        #    Note: The item ensembles are the sub-ensembles of a single
+        #          (batched) EnsembleArray, so that the decoders of all of the
+        #          item ensembles are solved in batches, and all of the item
+        #          thresholds and inputs are applied with one connection each.
         with self, self.am_ens_config:
             self.bias_node = nengo.Node(output=1)
-            self.elem_input = nengo.Node(
-                size_in=self.n_items, label="element input")
-            self.elem_utilities = nengo.Node(
-                size_in=self.n_items, label="element utilities")
 
-            self.am_ensembles = []
-            label_prefix = "" if label is None else label + "_"
+            self.am_ensarray = BatchedEnsembleArray(
+                n_neurons, self.n_items, label=label)
+            self.am_ensembles = self.am_ensarray.ea_ensembles
 
-            for i in range(self.n_items):
-                e = nengo.Ensemble(n_neurons, 1, label=label_prefix + str(i))
-                self.am_ensembles.append(e)
+            self.elem_input = self.am_ensarray.input
+            self.elem_utilities = self.am_ensarray.output
 
-                # Connect input and output nodes
-                nengo.Connection(self.bias_node, e, transform=-threshold[i])
-                nengo.Connection(self.elem_input[i], e, synapse=None)
-                nengo.Connection(e, self.elem_utilities[i], synapse=None)
+            # Connect the (per item) thresholds
+            nengo.Connection(self.bias_node, self.elem_input,
+                             transform=-threshold[:, None])
 
             if inhibitable:
                 # Input node for inhibitory gating signal (if enabled)
@@ -372,20 +372,19 @@ class AssociativeMemory(nengo.Network):
         # --- Make the output node, and output utilities node and connect them
         #     Note: The output utilities make it easy to probe the raw output
         #           utilities and make it handy to do the appropriate
-        #           connections in add_default_output_vector
+        #           connections in add_default_output_vector. The output
+        #           vectors are then produced from the output utilities with
+        #           a single transform.
         output = nengo.Node(size_in=output_vectors.shape[1], label=name)
         setattr(self, name, output)
 
         utility_node_name = '_'.join([name, self.utility_output_suffix])
-        utility = nengo.Node(size_in=self.n_items, label=utility_node_name)
+        utility = self.am_ensarray.add_output(utility_node_name,
+                                              utility_map_funcs)
         setattr(self, utility_node_name, utility)
 
-        for i, am_ens in enumerate(self.am_ensembles):
-            nengo.Connection(am_ens, output, synapse=None,
-                             transform=output_vectors[i, :, None],
-                             function=utility_map_funcs[i])
-            nengo.Connection(am_ens, utility[i], synapse=None,
-                             function=utility_map_funcs[i])
+        nengo.Connection(utility, output, synapse=None,
+                         transform=output_vectors.T)
 
     @with_self
     def add_default_output_vector(self, output_vector, output_name='output',
@@ -477,10 +476,20 @@ class AssociativeMemory(nengo.Network):
             Mutual inhibition synapse time constant.
         """
         if not self.is_wta:
-            nengo.Connection(self.elem_utilities, self.elem_input,
+            # Note: The mutual inhibition ((eye - 1) * inhibit_scale) is
+            #       implemented as the sum of all of the utilities (inhibiting
+            #       every item) and the (elementwise) self-excitation of each
+            #       item, so the number of weights is linear (and not
+            #       quadratic) in the number of items.
+            self.wta_sum = nengo.Node(size_in=1, label="wta sum")
+            nengo.Connection(self.elem_utilities, self.wta_sum,
                              synapse=inhibit_synapse,
-                             transform=((np.eye(self.n_items) - 1) *
-                                        inhibit_scale))
+                             transform=np.ones((1, self.n_items)))
+            nengo.Connection(self.wta_sum, self.elem_input, synapse=None,
+                             transform=-np.ones((self.n_items, 1)) *
+                             inhibit_scale)
+            nengo.Connection(self.elem_utilities, self.elem_input,
+                             synapse=inhibit_synapse, transform=inhibit_scale)
             self.is_wta = True
         else:
             warnings.warn("AssociativeMemory network is already configured "
@@ -544,9 +553,9 @@ class AssociativeMemory(nengo.Network):
         with self.cleanup_ens_config:
             # --- Set up the double inhibited ensembles, and make the
             #     appropriate connections.
-            self.bias_ens1 = EnsembleArray(
+            self.bias_ens1 = BatchedEnsembleArray(
                 n_neurons, self.n_items, label=output_name + '_bias_ens1')
-            self.bias_ens2 = EnsembleArray(
+            self.bias_ens2 = BatchedEnsembleArray(
                 n_neurons, self.n_items, label=output_name + '_bias_ens2')
 
             utility = getattr(self, output_utilities_name)
@@ -578,10 +587,9 @@ class AssociativeMemory(nengo.Network):
 
             # --- Make inhibitory connection if inhibit option is set
             if self.inhibit is not None:
-                for e in self.bias_ens2.ensembles:
-                    nengo.Connection(
-                        self.inhibit, e, transform=-self._inhib_scale,
-                        synapse=None)
+                nengo.Connection(self.inhibit, self.bias_ens2.input,
+                                 transform=-np.ones((self.n_items, 1)) *
+                                 self._inhib_scale, synapse=None)
 
             # --- Connect default output vector to cleaned outputs
             #     (if available)
@@ -0,0 +1,166 @@
+import numpy as np
+
+import nengo
+from nengo.builder import Builder, Signal
+from nengo.builder.network import build_network
+from nengo.builder.operator import DotInc
+from nengo.exceptions import BuildError, ValidationError
+from nengo.networks import EnsembleArray
+from nengo.utils.compat import is_iterable
+
+
+class BatchedEnsembleArray(EnsembleArray):
+    """An EnsembleArray whose decoded outputs are solved in batches.
+
+    Instead of one decoded connection (and one decoder solve) per
+    sub-ensemble for every output, the decoders of all of the (unfiltered)
+    outputs are solved by the network builder:
+        - All of the sub-ensembles use the evaluation points of the first
+          sub-ensemble (the sub-ensembles share their ensemble parameters), so
+          each output function is evaluated only once per output, and not
+          once per sub-ensemble.
+        - The decoders for all of the outputs of a sub-ensemble are solved
+          with one solve (one activity matrix for all of the output targets).
+        - Sub-ensembles with identical encoders, gains and biases share their
+          solved decoders.
+    The decoded outputs are then built as one DotInc operator per output and
+    sub-ensemble. Build time is thus linear in the number of sub-ensembles.
+
+    Outputs with a synapse, or with connection parameters other than the
+    solver are built as regular connections.
+
+    Parameters
+    ----------
+    use_connections: bool, optional
+        Build all of the outputs as regular (per sub-ensemble) connections
+        (for backends that do not use the nengo reference builder). Defaults
+        to `BatchedEnsembleArray.default_use_connections`.
+
+    Other parameters are as for nengo.networks.EnsembleArray.
+    """
+
+    default_use_connections = False
+
+    def __init__(self, n_neurons, n_ensembles, ens_dimensions=1,
+                 neuron_nodes=False, label=None, seed=None,
+                 add_to_container=None, use_connections=None, **ens_kwargs):
+        if use_connections is None:
+            use_connections = self.default_use_connections
+
+        # Note: Has to be set before the EnsembleArray constructor creates
+        #       the default output
+        self.use_connections = use_connections
+        self.batched_outputs = []
+
+        super(BatchedEnsembleArray, self).__init__(
+            n_neurons, n_ensembles, ens_dimensions, neuron_nodes, label, seed,
+            add_to_container, **ens_kwargs)
+
+    def add_output(self, name, function, synapse=None, **conn_kwargs):
+        if self.use_connections or synapse is not None or \
+           any([key != 'solver' for key in conn_kwargs]):
+            return super(BatchedEnsembleArray, self).add_output(
+                name, function, synapse=synapse, **conn_kwargs)
+
+        if is_iterable(function):
+            functions = list(function)
+            if len(functions) != self.n_ensembles:
+                raise ValidationError(
+                    "Must have one function per ensemble (%d != %d)" %
+                    (len(functions), self.n_ensembles), attr='function')
+        else:
+            functions = [function] * self.n_ensembles
+
+        sizes = [self.dimensions_per_ensemble if func is None else
+                 np.asarray(func(np.zeros(self.dimensions_per_ensemble))).size
+                 for func in functions]
+        solver = conn_kwargs.get('solver',
+                                 nengo.Config.default(nengo.Connection,
+                                                      'solver'))
+
+        with self:
+            output = nengo.Node(size_in=sum(sizes), label=name)
+        setattr(self, name, output)
+
+        self.batched_outputs.append((output, functions, sizes, solver))
+        return output
+
+
+def get_batched_targets(functions, eval_points):
+    # Evaluates every (distinct) output function once on the shared
+    # evaluation points
+    targets = {}
+    for func in functions:
+        if id(func) in targets:
+            continue
+        if func is None:
+            func_targets = eval_points
+        else:
+            func_targets = np.array([func(ep) for ep in eval_points],
+                                    dtype=np.float64)
+        targets[id(func)] = func_targets.reshape(len(eval_points), -1)
+    return targets
+
+
+@Builder.register(BatchedEnsembleArray)
+def build_batched_ensemble_array(model, ea):
+    build_network(model, ea)
+
+    if len(ea.batched_outputs) == 0:
+        return
+
+    eval_points = model.params[ea.ea_ensembles[0]].eval_points
+    output_targets = [get_batched_targets(functions, eval_points)
+                      for _, functions, _, _ in ea.batched_outputs]
+    output_starts = [np.cumsum([0] + sizes)
+                     for _, _, sizes, _ in ea.batched_outputs]
+
+    shared_decoders = {}
+    for i, ens in enumerate(ea.ea_ensembles):
+        built_ens = model.params[ens]
+        out_funcs = [(id(functions[i]), solver)
+                     for _, functions, _, solver in ea.batched_outputs]
+
+        key = (ens.neuron_type, ens.radius, built_ens.encoders.tobytes(),
+               built_ens.gain.tobytes(), built_ens.bias.tobytes(),
+               tuple(out_funcs))
+        if key not in shared_decoders:
+            x = np.dot(eval_points, built_ens.encoders.T / ens.radius)
+            activities = ens.neuron_type.rates(x, built_ens.gain,
+                                               built_ens.bias)
+            if np.count_nonzero(activities) == 0:
+                raise BuildError(
+                    "Building %s: 'activities' matrix is all zero for %s. "
+                    "This is because no evaluation points fall in the firing "
+                    "ranges of any neurons." % (ea, ens))
+
+            # Outputs using the same solver are solved for together
+            decoders = [None] * len(out_funcs)
+            rng = np.random.RandomState(model.seeds[ens])
+            solvers = []
+            for _, solver in out_funcs:
+                if not any([solver is s for s in solvers]):
+                    solvers.append(solver)
+
+            for solver in solvers:
+                inds = [n for n, (_, s) in enumerate(out_funcs)
+                        if s is solver]
+                targets = np.hstack([output_targets[n][out_funcs[n][0]]
+                                     for n in inds])
+                solved, _ = solver(activities, targets, rng=rng)
+
+                col = 0
+                for n in inds:
+                    n_cols = output_targets[n][out_funcs[n][0]].shape[1]
+                    decoders[n] = solved[:, col:col + n_cols].T
+                    col += n_cols
+            shared_decoders[key] = decoders
+
+        for n, (output, _, _, _) in enumerate(ea.batched_outputs):
+            start, stop = output_starts[n][i:i + 2]
+            model.add_op(DotInc(
+                Signal(shared_decoders[key][n],
+                       name='%s.%s.decoders' % (output, ens)),
+                model.sig[ens.neurons]['out'],
+                model.sig[output]['in'][start:stop],
+                tag='%s.%s' % (output, ens)))
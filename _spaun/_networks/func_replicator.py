@@ -5,6 +5,8 @@ from nengo.networks import EnsembleArray as EA
 from nengo.utils.network import with_self
 from nengo.dists import Choice, Uniform
 
+from .neuron_inhibit import NeuronInhibition
+
 
 class DifferenceFunctionEvaluator(nengo.Network):
     def __init__(self, num_func_points, func_value_range=1.0,
@@ -62,13 +64,10 @@ class DifferenceFunctionEvaluator(nengo.Network):
 
     @with_self
     def make_inhibitable(self, inhibit_scale=3.0):
-        self.inhibit = nengo.Node(size_in=1)
-
+        gates = []
         for n in range(self.func_output_dimensions):
-            for gate in self.func_gate_eas[n].all_ensembles:
-                nengo.Connection(self.inhibit, gate.neurons,
-                                 transform=[[-5]] * gate.n_neurons,
-                                 synapse=None)
+            gates.extend(self.func_gate_eas[n].all_ensembles)
+        self.inhibit = NeuronInhibition(gates, 5, label='inhibit').input
 
 
 def convert_func_2_diff_func(func_points):
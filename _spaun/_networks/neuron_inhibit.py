@@ -0,0 +1,78 @@
+import nengo
+from nengo.builder import Builder, Signal
+from nengo.builder.network import build_network
+from nengo.builder.operator import DotInc
+from nengo.exceptions import BuildError
+
+
+class NeuronInhibition(nengo.Network):
+    """Inhibits all of the neurons of a set of ensembles from a scalar input.
+
+    Instead of one `[[-inhib_scale]] * n_neurons` connection per ensemble,
+    the inhibition is built as one DotInc operator per ensemble, all reading
+    the (unfiltered) scalar input (scaled by the neuron gains, as a connection
+    to the ensemble's neurons would be). This saves the connection objects and
+    their build time. It does not change the simulation step time: the
+    simulator's operator merging combines the DotIncs (which share their
+    input signal) into one operator, as it does with the connections'
+    operators. The input is a passthrough node, so any synapse on the
+    inhibitory signal should be put on the connection into `input` (and is
+    then only applied once, instead of once per ensemble).
+
+    Note: The inhibited ensembles have to be built before this network. This
+          is the case for ensembles in the same network (or in subnetworks
+          added before this network).
+
+    Parameters
+    ----------
+    ensembles: list of nengo.Ensemble
+        The ensembles to inhibit.
+    inhib_scale: float, optional
+        Scaling factor of the inhibitory input (applied to every neuron).
+    use_connections: bool, optional
+        Build the inhibition as one connection per ensemble instead (for
+        backends that do not use the nengo reference builder). Defaults to
+        `NeuronInhibition.default_use_connections`.
+    """
+
+    default_use_connections = False
+
+    def __init__(self, ensembles, inhib_scale=3, use_connections=None,
+                 label=None, seed=None, add_to_container=None):
+        super(NeuronInhibition, self).__init__(label, seed, add_to_container)
+
+        if use_connections is None:
+            use_connections = self.default_use_connections
+
+        self.inhib_ensembles = list(ensembles)
+        self.inhib_scale = inhib_scale
+        self.use_connections = use_connections
+
+        with self:
+            self.input = nengo.Node(size_in=1, label='inhibit')
+
+            if self.use_connections:
+                for e in self.inhib_ensembles:
+                    nengo.Connection(self.input, e.neurons,
+                                     transform=[[-inhib_scale]] * e.n_neurons,
+                                     synapse=None)
+
+
+@Builder.register(NeuronInhibition)
+def build_neuron_inhibition(model, inhib):
+    build_network(model, inhib)
+
+    if inhib.use_connections:
+        return
+
+    inhib_in = model.sig[inhib.input]['out']
+
+    for e in inhib.inhib_ensembles:
+        if e.neurons not in model.sig:
+            raise BuildError('NeuronInhibition: Ensemble %s has to be built '
+                             'before the inhibition network %s.' % (e, inhib))
+
+        gain = Signal(-inhib.inhib_scale * model.params[e].gain[:, None],
+                      name='%s.%s.gain' % (inhib, e))
+        model.add_op(DotInc(gain, inhib_in, model.sig[e.neurons]['in'],
+                            tag='%s.%s' % (inhib, e)))
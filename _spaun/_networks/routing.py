@@ -2,6 +2,8 @@ import nengo
 from nengo.networks import EnsembleArray
 from nengo.dists import Choice, Exponential
 
+from .neuron_inhibit import NeuronInhibition
+
 
 def make_ensarray_func(n_neurons, dimensions, **ens_args):
     n_ensembles = ens_args.get('n_ensembles', dimensions)
@@ -17,6 +19,14 @@ def make_route_connections_common(net, n_neurons, dimensions, num_items,
         net.sel_none = nengo.Ensemble(20, 1)
         nengo.Connection(bias_node, net.sel_none, synapse=None)
 
+        # Each item is inhibited by the selection signals of all of the other
+        # items (and by sel_none if it is not the default selection). Rather
+        # than connecting every selection signal to the neurons of every
+        # other item, the inhibition of each item is summed on an inhibition
+        # bus (sel_sum - sel_n [+ sel_none]), so that each ensemble only
+        # needs one inhibitory connection.
+        net.sel_sum = nengo.Node(size_in=1, label='Sel Sum')
+
         for n in range(num_items):
             sel_node = nengo.Node(size_in=1)
             sel_in = sel_node
@@ -34,36 +44,25 @@ def make_route_connections_common(net, n_neurons, dimensions, num_items,
             nengo.Connection(sel_node, net.sel_none.neurons,
                              transform=([[-gate_gain]] *
                                         net.sel_none.n_neurons))
+            nengo.Connection(sel_node, net.sel_sum, synapse=None)
+
+            inhib_bus = nengo.Node(size_in=1, label='Gate Inhib %d' % n)
+            nengo.Connection(net.sel_sum, inhib_bus, synapse=None)
+            nengo.Connection(sel_node, inhib_bus, transform=-1, synapse=None)
+            if n != default_sel:
+                nengo.Connection(net.sel_none, inhib_bus, synapse=None)
 
             if isinstance(ens, nengo.Network):
-                if n != default_sel:
-                    for e in ens.all_ensembles:
-                        nengo.Connection(
-                            net.sel_none, e.neurons,
-                            transform=[[-gate_gain]] * e.n_neurons)
-                for sn in net.sel_nodes:
-                    for e in ens.all_ensembles:
-                        nengo.Connection(
-                            sn, e.neurons,
-                            transform=[[-gate_gain]] * e.n_neurons)
-                for ee in net.ens_elements:
-                    for e in ee.all_ensembles:
-                        nengo.Connection(
-                            sel_node, e.neurons,
-                            transform=[[-gate_gain]] * e.n_neurons)
+                inhib_ens_list = ens.all_ensembles
             else:
-                if n != default_sel:
-                    nengo.Connection(net.sel_none, ens.neurons,
-                                     transform=[[-gate_gain]] * ens.n_neurons)
-                for sn in net.sel_nodes:
-                    nengo.Connection(sn, ens.neurons,
-                                     transform=[[-gate_gain]] * ens.n_neurons)
-                for ee in net.ens_elements:
-                    nengo.Connection(sel_node, ee.neurons,
-                                     transform=[[-gate_gain]] * ee.n_neurons)
+                inhib_ens_list = [ens]
+            inhib = NeuronInhibition(inhib_ens_list, gate_gain,
+                                     label='Gate Inhib %d' % n)
+            nengo.Connection(inhib_bus, inhib.input)
 
             net.ens_elements.append(ens)
             net.sel_nodes.append(sel_node)
+            net.inhib_buses.append(inhib_bus)
 
             setattr(net, 'sel%i' % n, sel_in)
             setattr(net, 'ens%i' % n, ens)
@@ -79,6 +78,7 @@ class Selector(nengo.Network):
 
         self.ens_elements = []
         self.sel_nodes = []
+        self.inhib_buses = []
 
         self.dimensions = dimensions
 
@@ -109,6 +109,7 @@ class Router(nengo.Network):
 
         self.ens_elements = []
         self.sel_nodes = []
+        self.inhib_buses = []
 
         self.dimensions = dimensions
 
@@ -6,6 +6,7 @@ from nengo.dists import Choice
 from nengo.dists import Exponential
 
 from .assoc_mem import AssociativeMemory
+from .neuron_inhibit import NeuronInhibition
 
 
 def make_ensarray_func(n_neurons, dimensions, **ens_args):
@@ -69,12 +70,12 @@ def make_mem_network(net, n_neurons, dimensions, make_mem_func, make_mem_args,
                                   label='Gate')
 
         if isinstance(net.diff, nengo.Network):
-            for e in net.diff.ensembles:
-                nengo.Connection(net.gate, e.neurons,
-                                 transform=[[-gate_gain]] * e.n_neurons)
+            diff_ensembles = net.diff.ensembles
         else:
-            nengo.Connection(net.gate, net.diff.neurons,
-                             transform=[[-gate_gain]] * e.n_neurons)
+            diff_ensembles = [net.diff]
+        net.gate_inhibit = NeuronInhibition(diff_ensembles, gate_gain,
+                                            label='Gate inhibit')
+        nengo.Connection(net.gate, net.gate_inhibit.input)
 
         # Make output
         net.output = net.mem.output
@@ -145,12 +146,12 @@ def make_resettable(net, n_neurons, dimensions, reset_value,
 
         # Disable the reset gate when reset signal is not active.
         if isinstance(reset_gate, nengo.Network):
-            for e in reset_gate.ensembles:
-                nengo.Connection(resetN_delay, e.neurons,
-                                 transform=[[-gate_gain]] * e.n_neurons)
+            reset_gate_ensembles = reset_gate.ensembles
         else:
-            nengo.Connection(resetN_delay, reset_gate.neurons,
-                             transform=[[-gate_gain]] * e.n_neurons)
+            reset_gate_ensembles = [reset_gate]
+        reset_gate_inhibit = NeuronInhibition(reset_gate_ensembles, gate_gain,
+                                              label='Reset gate inhibit')
+        nengo.Connection(resetN_delay, reset_gate_inhibit.input)
 
 
 class InputGatedMemory(nengo.Network):
@@ -93,6 +93,43 @@ class Arm:
 
         return Mx
 
+    def gen_jacEE_batch(self, sinq, cosq, **kwargs):
+        """Generates the Jacobians from end-effector to the origin frame for
+        a stack of arm configurations (given as the sin and cos of the
+        cumulative joint angles)"""
+        raise NotImplementedError
+
+    def gen_Mq_batch(self, sinq, cosq, **kwargs):
+        """Generates the mass matrices for the arm in joint space for a stack
+        of arm configurations"""
+        raise NotImplementedError
+
+    def gen_Mx_batch(self, sinq, cosq, Mq=None, JEE=None, **kwargs):
+        """Generate the mass matrices in operational space for a stack of
+        arm configurations (see gen_Mx_sinq_cosq)"""
+
+        if Mq is None:
+            Mq = self.gen_Mq_batch(sinq=sinq, cosq=cosq, **kwargs)
+        if JEE is None:
+            JEE = self.gen_jacEE_batch(sinq=sinq, cosq=cosq)
+
+        Mx_inv = np.einsum('nij,njk,nlk->nil', JEE, np.linalg.inv(Mq), JEE)
+        u, s, v = np.linalg.svd(Mx_inv)
+        singular = np.any(abs(s) < self.singularity_thresh, axis=1)
+
+        Mx = np.zeros(Mx_inv.shape)
+        # if we're not near a singularity
+        Mx[~singular] = np.linalg.inv(Mx_inv[~singular])
+        # in the case that the robot is near a singularity
+        s = s[singular]
+        s_inv = np.zeros(s.shape)
+        s_inv[s >= self.singularity_thresh] = \
+            1.0 / s[s >= self.singularity_thresh]
+        Mx[singular] = np.einsum('nij,nj,nkj->nik', v[singular], s_inv,
+                                 u[singular])
+
+        return Mx
+
     def position(self, q=None, ee_only=False):
         """Compute x,y position of the hand
 
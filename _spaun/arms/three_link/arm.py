@@ -20,25 +20,45 @@ import os
 import numpy as np
 
 from ..Arm import Arm
+from .numpy_sim import NumpySim
 
+# Note: Without the py3LinkArm dll, the arm can only be simulated with the
+#       numpy integrators (see numpy_sim)
 try:
     from . import py3LinkArm
 except ImportError:
-    raise ImportError(
-        'Error importing py3LinkArm python dll. Please read the README.txt' +
-        ' in %s and recompile the dll.' % os.path.dirname(__file__))
+    py3LinkArm = None
 
 
 class Arm3Link(Arm):
     """A wrapper around a MapleSim generated C simulation
     of a three link arm."""
 
-    def __init__(self, **kwargs):
+    def __init__(self, integrator='maplesim', n_substeps=None, **kwargs):
+        """
+        integrator string: the arm simulation to use. 'maplesim' for the
+                           compiled MapleSim simulation (py3LinkArm dll), or
+                           'semi_implicit_euler' or 'rk4' for the numpy
+                           implementation of the same dynamics
+        n_substeps int: the number of integration steps per timestep for
+                        the numpy integrators. If None, the integrator's
+                        default (NumpySim.default_substeps) is used. The
+                        MapleSim simulation always uses 1e-5s steps.
+        """
 
         self.DOF = 3
         Arm.__init__(self, **kwargs)
 
-        pyArm = py3LinkArm
+        if integrator != 'maplesim' and \
+           integrator not in NumpySim.integrators:
+            raise ValueError('Unknown arm integrator "%s"' % integrator)
+        if integrator == 'maplesim' and n_substeps is not None:
+            raise ValueError('The number of integration steps can only be ' +
+                             'set for the numpy arm integrators.')
+        if integrator != 'maplesim' and n_substeps is None:
+            n_substeps = NumpySim.default_substeps[integrator]
+        self.integrator = integrator
+        self.n_substeps = n_substeps
 
         # self.u = np.zeros(3)
 
@@ -81,11 +101,42 @@ class Arm3Link(Arm):
 
         # stores information returned from maplesim
         self.state = np.zeros(7)
-        # maplesim arm simulation
-        self.sim = pyArm.pySim(dt=1e-5)
+        # maplesim (or numpy) arm simulation
+        self.sim = self.make_sim()
         self.sim.reset(self.state)
         self.update_state()
 
+    def make_sim(self):
+        """Creates the arm simulation object (for the arm integrator)"""
+        if self.integrator != 'maplesim':
+            return NumpySim(dt=1e-5, integrator=self.integrator)
+
+        if py3LinkArm is None:
+            raise ImportError(
+                'Error importing py3LinkArm python dll. Please read the ' +
+                'README.txt in %s and recompile the dll, ' %
+                os.path.dirname(__file__) + 'or use one of the numpy arm ' +
+                'integrators (e.g. the mtr_arm_integrator=\'rk4\' config).')
+        return py3LinkArm.pySim(dt=1e-5)
+
+    def __getstate__(self):
+        """The compiled MapleSim simulation object can't be pickled, so it
+        is dropped here and rebuilt from the arm state in __setstate__."""
+        state = self.__dict__.copy()
+        del state['sim']
+        return state
+
+    def __setstate__(self, state):
+        # Arms pickled before the numpy integrators were added
+        state.setdefault('integrator', 'maplesim')
+        state.setdefault('n_substeps', None)
+
+        self.__dict__.update(state)
+        if self.integrator != 'maplesim' and self.n_substeps is None:
+            self.n_substeps = NumpySim.default_substeps[self.integrator]
+        self.sim = self.make_sim()
+        self.reset(q=self.q, dq=self.dq)
+
     def apply_torque(self, u, dt):
         """Takes in a torque and timestep and updates the
         arm simulation accordingly.
@@ -94,9 +145,18 @@ class Arm3Link(Arm):
         dt float: the timestep
         """
         u = -1 * np.array(u, dtype='float')
+        if self.n_substeps is None:
+            n_steps = int(np.ceil(dt / 1e-5))
+        else:
+            n_steps = self.n_substeps
+            self.sim.dt = dt / n_steps
 
-        for ii in range(int(np.ceil(dt / 1e-5))):
-            self.sim.step(self.state, u)
+        if hasattr(self.sim, 'step_n'):
+            self.sim.step_n(self.state, u, n_steps)
+        else:
+            # py3LinkArm dlls compiled before step_n was added
+            for ii in range(n_steps):
+                self.sim.step(self.state, u)
         self.update_state()
         return [0]
 
@@ -267,6 +327,47 @@ class Arm3Link(Arm):
 
         return JEE
 
+    def gen_jac_batch(self, sinq, cosq, lengths):
+        """Generates the (x, y) rows of the Jacobian from a point on the arm
+        (given by the link lengths up to the point) to the origin frame, for
+        a stack of arm configurations
+
+        sinq np.array: (n, 3) sin of the cumulative joint angles
+        cosq np.array: (n, 3) cos of the cumulative joint angles
+        lengths np.array: the length of each link up to the point
+        """
+        jac = np.zeros((len(sinq), 2, 3))
+        # column entries are summed right to left
+        jac[:, 0] = np.cumsum((lengths * -sinq)[:, ::-1], axis=1)[:, ::-1]
+        jac[:, 1] = np.cumsum((lengths * cosq)[:, ::-1], axis=1)[:, ::-1]
+        return jac
+
+    def gen_jacEE_batch(self, sinq, cosq, use_incorrect_values=False):
+        """Generates the Jacobians from end-effector to the origin frame
+        (see gen_jacEE_sinq_cosq), for a stack of arm configurations"""
+        if use_incorrect_values:
+            lengths = np.array([1., 2., 3.])
+        else:
+            lengths = self.L
+        return self.gen_jac_batch(sinq, cosq, lengths)
+
+    def gen_Mq_batch(self, sinq, cosq, use_incorrect_values=False):
+        """Generates the mass matrices of the arm in joint space, for a
+        stack of arm configurations"""
+        Mq = np.zeros((len(sinq), 3, 3))
+        for ii, M in enumerate([self.M1, self.M2, self.M3]):
+            # Jacobian from the COM of link ii to the origin frame
+            lengths = np.copy(self.L)
+            lengths[ii] /= 2.
+            lengths[ii + 1:] = 0
+
+            JCOM = np.zeros((len(sinq), 6, 3))
+            JCOM[:, :2] = self.gen_jac_batch(sinq, cosq, lengths)
+            JCOM[:, 5, :ii + 1] = 1.0
+
+            Mq += np.einsum('nji,jk,nkl->nil', JCOM, M, JCOM)
+        return Mq
+
     def gen_djacEE(self):
         """Generates the Jacobian from end-effector to
         the origin frame"""
@@ -0,0 +1,237 @@
+'''
+Numpy implementation of the MapleSim three link arm simulation (see
+threelinkarm.cpp), for when the py3LinkArm dll is not available.
+'''
+import math
+
+import numpy as np
+
+
+def gen_ddq(q0, q1, q2, dq0, dq1, dq2, u0, u1, u2):
+    """Computes the joint accelerations of the arm (the dynamics of the
+    MapleSim generated simulation, see fp in threelinkarm.cpp).
+
+    The arguments can either be floats (for a single arm configuration), or
+    arrays of the same shape (for a stack of arm configurations).
+
+    q float/np.array: the joint angles
+    dq float/np.array: the joint velocities
+    u float/np.array: the control signal
+    """
+    if isinstance(q0, np.ndarray):
+        sin, cos = np.sin, np.cos
+    else:
+        sin, cos = math.sin, math.cos
+
+    # Note: Ported from the generated code (as is)
+    z0 = sin(q0)
+    z1 = cos(q1)
+    z2 = cos(q2)
+    z3 = sin(q1)
+    z4 = sin(q2)
+    z5 = z1 * z2 - z3 * z4
+    z6 = cos(q0)
+    z2 = -(z3 * z2 + z1 * z4)
+    z4 = 0.35 * (z6 * z2 - z0 * z5)
+    z7 = 0.35 * z5
+    z8 = 1.2 * z1
+    z9 = -(z8 + z7) - 2.0
+    z10 = 0.35 * z2
+    z11 = z10 - 1.2 * z3
+    z12 = z11 * z6
+    z13 = z9 * z0 + z12
+    z2 = 0.35 * (z6 * z5 + z0 * z2)
+    z5 = z9 * z6 - z11 * z0
+    z9 = z4 * z13
+    z11 = z2 * z5
+    m0 = 1.0 + z9 - z11
+    z8 = -(z8 + z7) * z0 + z12
+    z12 = z0 * z3 - z6 * z1
+    z14 = -z2 + 1.2 * z12
+    z15 = z4 * z8
+    z16 = z2 * z14
+    m1 = 1.0 + z15 - z16
+    z17 = -z2
+    z18 = z4 * z4
+    m2 = 1.0 + z18 - z2 * z17
+    z19 = u2
+    z20 = dq0 + dq1
+    z21 = -0.6 * z12
+    z22 = dq0 + dq1 + dq2
+    z23 = dq0 * dq0
+    z22 = z22 * z22
+    z20 = z20 * z20
+    z24 = z20 * z21
+    z25 = z23 * z6
+    z26 = z22 * z2
+    z27 = -z26 - 2.0 * (z25 + z24)
+    z28 = -0.6 * (z0 * z1 + z6 * z3)
+    z20 = z20 * z28
+    z23 = z23 * z0
+    z22 = z22 * z4
+    z29 = -z22 + 2.0 * (z23 - z20)
+    z30 = z4 * z27
+    z31 = z2 * z29
+    v0 = z31 - z19 - z30
+    z1 = 1.8 * z1
+    z32 = -(z1 + z7) - 4.0
+    z3 = z10 - 1.8 * z3
+    z10 = z6 * z3
+    z33 = z32 * z0 + z10
+    z3 = z0 * z3
+    z32 = z32 * z6 - z3
+    z5 = -(z5 + z32) * z21
+    z13 = (z33 + z13) * z28
+    m3 = z5 + z13 + z9 - z11 + 2.0
+    z34 = -(z1 + z7) * z0 + z10
+    z12 = -z2 + 1.8 * z12
+    z8 = (z34 + z8) * z28
+    z14 = -(z14 + z12) * z21
+    m4 = z14 + z8 + z15 - z16 + 2.0
+    m5 = z18 - (z2 + 2.0 * z21) * z17 + 1.0 + 2.0 * z28 * z4
+    z35 = u1
+    z24 = 3.0 * z24
+    z36 = -(z24 + z26) - 4.0 * z25
+    z20 = 3.0 * z20
+    z37 = -(z20 + z22) + 4.0 * z23
+    z29 = (z29 + z37) * z21
+    z27 = -(z36 + z27) * z28
+    v1 = z29 + z27 + z31 - z30 - z35 - z19
+    z1 = -(z1 + z7) - 5.0
+    m6 = (-(z32 + z6 * z1 - z3) * z6 + z5 - (z33 + z0 * z1 + z10) * z0 +
+          z13 + z9 - z11 + 3.0)
+    m7 = z14 + z8 + z15 - z16 + 2.0 * (1.0 - z0 * z34 - z6 * z12)
+    m8 = z18 - 2.0 * (z0 - z28) * z4 - (z2 + 2.0 * (z6 + z21)) * z17 + 1.0
+    v2 = (z29 + z27 - (z24 + z26 - z36 + 5.0 * z25) * z0 -
+          (z20 + z22 - z37 - 5.0 * z23) * z6 + z31 - z30 - u0 - z35 - z19)
+
+    # Solve M ddq = v (Cramer's rule, so that stacks of configurations are
+    # solved elementwise)
+    c0 = m4 * m8 - m5 * m7
+    c1 = m5 * m6 - m3 * m8
+    c2 = m3 * m7 - m4 * m6
+    det = m0 * c0 + m1 * c1 + m2 * c2
+
+    ddq0 = (v0 * c0 + m1 * (v2 * m5 - v1 * m8) +
+            m2 * (v1 * m7 - v2 * m4)) / det
+    ddq1 = (m0 * (v1 * m8 - v2 * m5) + v0 * c1 +
+            m2 * (v2 * m3 - v1 * m6)) / det
+    ddq2 = (m0 * (v2 * m4 - v1 * m7) + m1 * (v1 * m6 - v2 * m3) +
+            v0 * c2) / det
+    return ddq0, ddq1, ddq2
+
+
+def step_semi_implicit_euler(q, dq, u, dt):
+    """Steps the arm state forward by dt (semi-implicit Euler)"""
+    ddq = gen_ddq(*(q + dq + u))
+    dq = tuple([dq[ii] + dt * ddq[ii] for ii in range(3)])
+    q = tuple([q[ii] + dt * dq[ii] for ii in range(3)])
+    return q, dq
+
+
+def step_rk4(q, dq, u, dt):
+    """Steps the arm state forward by dt (4th order Runge-Kutta)"""
+    k1_q = dq
+    k1_dq = gen_ddq(*(q + dq + u))
+
+    q2 = tuple([q[ii] + 0.5 * dt * k1_q[ii] for ii in range(3)])
+    k2_q = tuple([dq[ii] + 0.5 * dt * k1_dq[ii] for ii in range(3)])
+    k2_dq = gen_ddq(*(q2 + k2_q + u))
+
+    q3 = tuple([q[ii] + 0.5 * dt * k2_q[ii] for ii in range(3)])
+    k3_q = tuple([dq[ii] + 0.5 * dt * k2_dq[ii] for ii in range(3)])
+    k3_dq = gen_ddq(*(q3 + k3_q + u))
+
+    q4 = tuple([q[ii] + dt * k3_q[ii] for ii in range(3)])
+    k4_q = tuple([dq[ii] + dt * k3_dq[ii] for ii in range(3)])
+    k4_dq = gen_ddq(*(q4 + k4_q + u))
+
+    q = tuple([q[ii] + dt / 6. * (k1_q[ii] + 2 * k2_q[ii] + 2 * k3_q[ii] +
+                                  k4_q[ii]) for ii in range(3)])
+    dq = tuple([dq[ii] + dt / 6. * (k1_dq[ii] + 2 * k2_dq[ii] +
+                                    2 * k3_dq[ii] + k4_dq[ii])
+                for ii in range(3)])
+    return q, dq
+
+
+class NumpySim(object):
+    """A numpy implementation of the MapleSim arm simulation, with the same
+    interface (and state layout) as py3LinkArm.pySim.
+
+    dt float: simulation timestep
+    integrator string: the integration scheme, one of 'semi_implicit_euler'
+                       or 'rk4'
+
+    Note: The arm state is stepped with scalar (math module) operations
+          rather than numpy arrays. For a single three-link arm, the numpy
+          call overhead outweighs the arithmetic (gen_ddq is about 40x
+          slower with 1-element arrays), so numpy arrays only pay off when
+          gen_ddq is evaluated for stacks of arm configurations.
+    """
+
+    integrators = {'semi_implicit_euler': step_semi_implicit_euler,
+                   'rk4': step_rk4}
+    # Default number of integration steps per (1ms) Spaun timestep of each
+    # integrator (see benchmarks/bench_arm_integrators.py for the accuracy)
+    default_substeps = {'semi_implicit_euler': 20, 'rk4': 1}
+
+    def __init__(self, dt=.00001, integrator='rk4'):
+        if integrator not in self.integrators:
+            raise ValueError('Unknown arm integrator "%s" (must be one of: '
+                             '%s)' % (integrator,
+                                      ', '.join(sorted(self.integrators))))
+        self.dt = dt
+        self.integrator = integrator
+        self._step = self.integrators[integrator]
+
+        self.t = 0.0
+        self.q = (np.pi / 4.0,) * 3
+        self.dq = (0.0,) * 3
+
+    def _update_output(self, out):
+        out[0] = self.t
+        out[1:4] = self.q
+        out[4:7] = self.dq
+
+    def reset(self, out, ic=None):
+        """
+        Reset the state of the simulation.
+        param np.ndarray out: where to store the system output
+            NOTE: output is of form [time, output]
+        param np.ndarray ic: the initial conditions of the system
+            NOTE: of form [q0, dq0, q1, dq1, q2, dq2]
+        """
+        self.t = 0.0
+        if ic is None:
+            self.q = (np.pi / 4.0,) * 3
+            self.dq = (0.0,) * 3
+        else:
+            self.q = tuple([float(x) for x in ic[::2]])
+            self.dq = tuple([float(x) for x in ic[1::2]])
+        self._update_output(out)
+
+    def step(self, out, u):
+        """
+        Step the simulation forward one timestep.
+        param np.ndarray out: where to store the system output
+            NOTE: output is of form [time, output]
+        param np.ndarray u: the control signal
+        """
+        self.step_n(out, u, 1)
+
+    def step_n(self, out, u, n_steps):
+        """
+        Step the simulation forward n_steps timesteps, with the same
+        control signal applied for each step.
+        param np.ndarray out: where to store the system output
+            NOTE: output is of form [time, output]
+        param np.ndarray u: the control signal
+        param int n_steps: the number of timesteps to step
+        """
+        u = tuple([float(x) for x in u])
+        q, dq = self.q, self.dq
+        for ii in range(n_steps):
+            q, dq = self._step(q, dq, u, self.dt)
+        self.q, self.dq = q, dq
+        self.t += n_steps * self.dt
+        self._update_output(out)
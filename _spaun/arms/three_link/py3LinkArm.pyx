@@ -41,3 +41,18 @@ cdef class pySim:
         param np.ndarray u: the control signal
         """
         self.thisptr.step(&out[0], &u[0])
+
+    def step_n(self, np.ndarray[double, mode="c"] out,
+                     np.ndarray[double, mode="c"] u, int n_steps):
+        """
+        Step the simulation forward n_steps timesteps, with the same
+        control signal applied for each step (the steps are run in C).
+        param np.ndarray out: where to store the system output
+            NOTE: output is of form [time, output], and holds the output
+                  of the last step
+        param np.ndarray u: the control signal
+        param int n_steps: the number of timesteps to step
+        """
+        cdef int ii
+        for ii in range(n_steps):
+            self.thisptr.step(&out[0], &u[0])
@@ -1,4 +1,5 @@
 from importlib import import_module
+from functools import partial
 import numpy as np
 
 import nengo
@@ -13,9 +14,11 @@ from ._spa.utils import get_optimal_radius
 from ._networks import AssociativeMemory as AM
 from ._networks import InputGatedMemory as Memory
 from ._networks import Selector, Router, VectorNormalize
+from ._networks import NeuronInhibition, BatchedEnsembleArray
 
 from .vocabulator import vocab
 from .loggerator import logger
+from .profiler import profiler
 
 
 class SpaunConfig(object):
@@ -38,11 +41,15 @@ class SpaunConfig(object):
         self.neuron_type = nengo.LIF()
 
         self.sim_dt = 0.001
+        self.share_ens_params = False
 
         self.stim_module = 'mnist'
         self.vis_module = 'lif_vision'
 
         self.spaun_modules = 'SVPREWTDMI'
+        # Tasks (basal ganglia actions) to include in the model. None for all
+        # tasks (see spaun_task_modules in spaun_main)
+        self.spaun_tasks = None
 
         self.vis_detect_dim = 5000
 
@@ -89,6 +96,8 @@ class SpaunConfig(object):
         self.mtr_kv1 = None
         self.mtr_kv2 = 0
         self.mtr_arm_type = 'three_link'
+        self.mtr_arm_integrator = 'maplesim'
+        self.mtr_arm_substeps = None
         self.mtr_arm_rest_x_bias = -0.3
         self.mtr_arm_rest_y_bias = 2.5
         self.mtr_tgt_threshold = 0.035  # 0.05  # 0.075
@@ -131,6 +140,14 @@ class SpaunConfig(object):
             raise RuntimeError('Exception! "%s" backend is not supported!' %
                                val)
 
+        # The MPI and SpiNNaker backends do not support the neuron inhibition
+        # and batched decoder operators, so use (one per ensemble)
+        # connections instead
+        NeuronInhibition.default_use_connections = \
+            self._backend in ['mpi', 'spinn']
+        BatchedEnsembleArray.default_use_connections = \
+            self._backend in ['mpi', 'spinn']
+
     @property
     def use_ref(self):
         return self.backend == 'ref'
@@ -156,7 +173,8 @@ class SpaunConfig(object):
         #                         globals(), locals(), 'Arm')
         arm_module = import_module('.arms.%s' % self.mtr_arm_type,
                                    __package__)
-        return arm_module.Arm
+        return partial(arm_module.Arm, integrator=self.mtr_arm_integrator,
+                       n_substeps=self.mtr_arm_substeps)
 
     @property
     def mtr_est_digit_response_time(self):
@@ -192,12 +210,10 @@ class SpaunConfig(object):
             net.make_inhibitable(inhib_scale=inhib_scale)
         else:
             with net:
-                net.inhibit = nengo.Node(size_in=1)
-                for e in net.all_ensembles:
-                    nengo.Connection(net.inhibit, e.neurons,
-                                     transform=[[-inhib_scale]] * e.n_neurons,
-                                     synapse=None)
+                net.inhibit = NeuronInhibition(net.all_ensembles, inhib_scale,
+                                               label='inhibit').input
 
+    @profiler.profile_construction('AssociativeMemory')
     def make_assoc_mem(self, input_vectors, output_vectors=None,
                        wta_inhibit_scale=3.5, cleanup_output=True,
                        default_output_vector=None, **args):
@@ -228,6 +244,7 @@ class SpaunConfig(object):
             mem_args[key] = args.get(key, self.mb_config[key])
         return Memory(**mem_args)
 
+    @profiler.profile_construction('MemoryBlock')
     def make_mem_block(self, **args):
         mb_args = dict(args)
         mb_args['n_neurons'] = args.get('n_neurons', self.n_neurons_mb)
@@ -239,6 +256,7 @@ class SpaunConfig(object):
             mb_args[key] = args.get(key, self.mb_config[key])
         return MB(**mb_args)
 
+    @profiler.profile_construction('CircularConvolution')
     def make_cir_conv(self, **args):
         cconv_args = dict(args)
         cconv_args['n_neurons'] = args.get('n_neurons', self.n_neurons_cconv)
@@ -317,6 +335,7 @@ class SpaunConfig(object):
             net.output = ens_array.output
         return net
 
+    @profiler.profile_construction('Selector')
     def make_selector(self, num_items, gate_gain=5, threshold_sel_in=True,
                       **args):
         dimensions = args.pop('dimensions', vocab.sp_dim)
@@ -329,6 +348,7 @@ class SpaunConfig(object):
                         gate_gain, threshold_sel_in=threshold_sel_in,
                         **sel_args)
 
+    @profiler.profile_construction('Router')
     def make_router(self, num_items, gate_gain=5, threshold_sel_in=True,
                     **args):
         dimensions = args.pop('dimensions', vocab.sp_dim)
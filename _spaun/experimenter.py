@@ -30,10 +30,19 @@ class SpaunExperiment(object):
 
         self.raw_seq_list = []
         self.stim_seq_list = []
+        self.stim_image_inds = []
         self.task_phase_seq_list = []
         self.instr_sps_list = []
         self.instr_dict = []
 
+        # Distinct instruction sets in instr_sps_list (and the index of the
+        # instruction set used for each stimulus in instr_sps_list). The
+        # instruction SP vectors of each distinct instruction set are cached
+        # in instr_sp_vecs (see SpaunInstructionStimulus).
+        self.instr_sps_unique = []
+        self.instr_sps_inds = []
+        self.instr_sp_vecs = None
+
         self.learn_min_num_actions = 2
         self._num_learn_actions = self.learn_min_num_actions
 
@@ -42,6 +51,35 @@ class SpaunExperiment(object):
 
         self.prev_t_ind = -1
 
+        # Motor responses (output characters) produced so far in the run
+        self.output_str = ''
+
+        # Motor responses expected by the stimulus sequence: the stimulus
+        # index of each response cue (the stimulus presented before a run of
+        # 'X's) and the number of responses expected after it, and the total
+        # number of expected responses (the number of 'X's)
+        self.response_cues = []
+        self.num_expected_responses = 0
+
+        # Number of motor responses produced after the final response cue
+        # was presented, and the time at which all of the final responses
+        # have been produced and the motor system is idle (None until then).
+        # See SpaunMonitor.monitor_node_func.
+        self.num_final_outputs = 0
+        self.t_responses_done = None
+
+        # Task selection stimulus (the stimulus following the 'A') -> Spaun
+        # task (see spaun_task_modules in spaun_main)
+        self.task_sel_map = {'ZER': 'copy_draw', 'ONE': 'recog',
+                             'TWO': 'learn', 'THR': 'mem', 'FOR': 'count',
+                             'FIV': 'qa', 'SIX': 'rvc', 'SEV': 'fi',
+                             'EIG': 'react', 'NIN': 'instr', 'C': 'match'}
+
+        # Stimulus image lookup function (and rng) used to build the stimulus
+        # image schedule (see get_stim_image_ind)
+        self.image_ind_func = None
+        self.image_rng = None
+
     @property
     def num_learn_actions(self):
         return max(self._num_learn_actions, self.learn_min_num_actions)
@@ -322,6 +360,7 @@ class SpaunExperiment(object):
         num_r = 0
 
         num_mtr_responses = 0.0
+        response_cues = []  # [raw_seq_list index, number of responses]
 
         for c in raw_seq:
             # Process motor response before descriptor tags
@@ -417,6 +456,9 @@ class SpaunExperiment(object):
                     c = value_maps[c]
 
                 if c == 'X':
+                    if num_mtr_responses == 0:
+                        response_cues.append([len(raw_seq_list) - 1, 0])
+                    response_cues[-1][1] += 1
                     num_mtr_responses += 1
                     continue
                 elif num_mtr_responses > 0:
@@ -440,7 +482,8 @@ class SpaunExperiment(object):
         instr_c = ''
 
         # Process raw sequence list to get actual SP's
-        for c in raw_seq_list:
+        cue_stim_inds = {}
+        for raw_ind, c in enumerate(raw_seq_list):
             if c in self.sym_map:
                 c = self.sym_map[c]
             if c in self.num_map:
@@ -468,13 +511,22 @@ class SpaunExperiment(object):
 
             stim_seq_list.append(c)
             instr_seq_list.append(instr_c)
+            cue_stim_inds[raw_ind] = len(stim_seq_list) - 1
 
             # Keep track of previous character (to insert spaces between)
             # duplicate characters
             prev_c = c
 
+        # Map the response cues to their stimulus indices
+        response_cues = [[cue_stim_inds.get(raw_ind, 0), num_responses]
+                         for raw_ind, num_responses in response_cues]
+
         # Insert blanks if present_blanks option is set
         if present_blanks:
+            for cue in response_cues:
+                # Account for the blanks inserted before the cue
+                cue[0] += len([c for c in stim_seq_list[:cue[0]]
+                               if c != '.' and c is not None])
             stim_seq_list, instr_seq_list = \
                 self.add_present_blanks(stim_seq_list, instr_seq_list)
 
@@ -558,7 +610,7 @@ class SpaunExperiment(object):
 
         return (raw_seq_list, stim_seq_list, task_phase_seq_list,
                 instr_sp_list, instr_dict, instr_change_inds,
-                num_learn_actions)
+                num_learn_actions, response_cues)
 
     def get_est_simtime(self):
         return (len(self.stim_seq_list) * self.present_interval)
@@ -569,17 +621,58 @@ class SpaunExperiment(object):
     def get_t_ind(self, t):
         return int(self.get_t_ind_float(t))
 
+    def get_t_ind_start(self, t_ind):
+        # Returns the time at which the stimulus with index t_ind (in
+        # stim_seq_list) is first presented
+        return t_ind * self.present_interval * (2 ** self.present_blanks)
+
+    def get_tasks(self):
+        # Returns the set of Spaun tasks used in the stimulus sequence, or
+        # None if they cannot be determined from the stimulus sequence (an
+        # unknown task selection, or instructed tasks, since instructions
+        # can switch Spaun to any task)
+        stim_list = [s for s in self.stim_seq_list if s is not None]
+
+        tasks = set()
+        for i, s in enumerate(stim_list):
+            if s == 'A':
+                if i + 1 >= len(stim_list) or \
+                   stim_list[i + 1] not in self.task_sel_map:
+                    return None
+                tasks.add(self.task_sel_map[stim_list[i + 1]])
+            elif s in ['M', 'V']:
+                # Instructed custom & positional tasks
+                tasks.add('instr')
+
+        if any([instr_sps is not None for instr_sps in self.instr_sps_list]):
+            tasks.add('instr')
+
+        if len(tasks) == 0 or 'instr' in tasks:
+            return None
+        return tasks
+
+    def get_task(self, t):
+        # Returns the task (task character, i.e. 'W' for the copy drawing
+        # task, 'X' for a task selection stimulus) being presented at time t
+        if len(self.task_phase_seq_list) == 0:
+            return ''
+        t_ind = min(self.get_t_ind(t), len(self.task_phase_seq_list) - 1)
+        task = self.task_phase_seq_list[t_ind]
+        return task[0] if isinstance(task, list) else task
+
     def in_learning_phase(self, t):
         t_ind = min(self.get_t_ind(t), len(self.task_phase_seq_list) - 1)
         task = self.task_phase_seq_list[t_ind]
         return (len(task) > 1 and task[0] == 'L')
 
-    def get_stimulus(self, t):
+    def get_stimulus_ind(self, t):
+        # Returns the index (in stim_seq_list) of the stimulus presented at
+        # time t, or -1 if no stimulus is presented.
         t_ind = self.get_t_ind(t)
         t_ind_float = self.get_t_ind_float(t)
 
         if t <= 0:
-            return None
+            return -1
 
         if t_ind != self.prev_t_ind:
             # Write the stimulus to file
@@ -609,9 +702,43 @@ class SpaunExperiment(object):
         if (self.present_blanks and t_ind != int(round(t_ind_float))) or \
            t_ind >= len(self.stim_seq_list) or \
            self.stim_seq_list[t_ind] == '.':
+            return -1
+        else:
+            return t_ind
+
+    def get_stimulus(self, t):
+        stim_ind = self.get_stimulus_ind(t)
+        if stim_ind < 0:
             return None
         else:
-            return self.stim_seq_list[t_ind]
+            return self.stim_seq_list[stim_ind]
+
+    def get_stimulus_image_ind(self, t):
+        # Returns the index of the stimulus image presented at time t (from
+        # the precompiled stimulus image schedule), or -1 for a blank image.
+        stim_ind = self.get_stimulus_ind(t)
+        if stim_ind < 0:
+            return -1
+        else:
+            return self.stim_image_inds[stim_ind]
+
+    def get_stim_image_ind(self, stim):
+        # Resolves a stimulus (as found in stim_seq_list) to the index of the
+        # stimulus image to display (-1 for a blank image)
+        if stim is None or stim == '.':
+            return -1
+        elif isinstance(stim, tuple):
+            return int(stim[0])
+        elif isinstance(stim, (int, np.integer)):
+            return int(stim)
+        else:
+            return int(self.image_ind_func(stim, self.image_rng))
+
+    def set_stimulus(self, stim_ind, stim):
+        # Changes the stimulus in the stimulus sequence (and stimulus image
+        # schedule)
+        self.stim_seq_list[stim_ind] = stim
+        self.stim_image_inds[stim_ind] = self.get_stim_image_ind(stim)
 
     def get_instruction_sps(self, t):
         t_ind = self.get_t_ind(t)
@@ -620,6 +747,15 @@ class SpaunExperiment(object):
         else:
             return None
 
+    def get_instruction_sps_ind(self, t):
+        # Returns the index (in instr_sps_unique) of the instruction set
+        # presented at time t, or -1 if there are no instructions.
+        t_ind = self.get_t_ind(t)
+        if t_ind < len(self.instr_sps_inds):
+            return self.instr_sps_inds[t_ind]
+        else:
+            return -1
+
     def update_output(self, t, out_ind):
         # Figure out what the motor output is and write it to file
         if out_ind >= 0 and out_ind < len(self.num_out_list):
@@ -628,6 +764,10 @@ class SpaunExperiment(object):
             out_str = self.null_output
         logger.write(out_str)
         logger.flush()
+        self.output_str += out_str
+        if len(self.response_cues) > 0 and \
+           t >= self.get_t_ind_start(self.response_cues[-1][0]):
+            self.num_final_outputs += 1
 
         if self.in_learning_phase(t):
             # Denote learning phase reward
@@ -646,10 +786,10 @@ class SpaunExperiment(object):
                     reward_chance = 0
 
                 rewarded = str(int(np.random.random() < reward_chance))
-                self.stim_seq_list[self.get_t_ind(t) + 1] = \
-                    self.num_map[rewarded]
+                self.set_stimulus(self.get_t_ind(t) + 1,
+                                  self.num_map[rewarded])
             elif (self.get_t_ind(t) + 1) < len(self.stim_seq_list):
-                self.stim_seq_list[self.get_t_ind(t) + 1] = self.num_map['0']
+                self.set_stimulus(self.get_t_ind(t) + 1, self.num_map['0'])
         else:
             pass
 
@@ -660,13 +800,58 @@ class SpaunExperiment(object):
 
         (self.raw_seq_list, self.stim_seq_list, self.task_phase_seq_list,
          self.instr_sps_list, self.instr_dict, self.instr_change_inds,
-         self._num_learn_actions) = \
+         self._num_learn_actions, self.response_cues) = \
             self.parse_raw_seq(self.raw_seq_str, get_image_ind,
                                get_image_label, self.present_blanks,
                                mtr_est_digit_response_time,
                                self.raw_instr_str, rng)
+        self.num_expected_responses = \
+            sum([num_responses for _, num_responses in self.response_cues])
+
+        # Precompile the stimulus image schedule (the image index of each
+        # stimulus in the stimulus sequence), so that the images do not have
+        # to be looked up on every simulation timestep.
+        # Note: A copy of the rng is used to choose the images so that the
+        #       random state used to generate the rest of the model (e.g. the
+        #       vocabularies) does not depend on the stimulus sequence.
+        self.image_ind_func = get_image_ind
+        self.image_rng = np.random.RandomState()
+        self.image_rng.set_state(rng.get_state())
+        self.stim_image_inds = [self.get_stim_image_ind(stim)
+                                for stim in self.stim_seq_list]
+
+        # Index the distinct instruction sets
+        instr_sps_keys = {}
+        self.instr_sps_unique = []
+        self.instr_sps_inds = []
+        for instr_sps in self.instr_sps_list:
+            if instr_sps is None:
+                self.instr_sps_inds.append(-1)
+                continue
+
+            instr_sps_key = tuple(map(tuple, instr_sps))
+            if instr_sps_key not in instr_sps_keys:
+                instr_sps_keys[instr_sps_key] = len(self.instr_sps_unique)
+                self.instr_sps_unique.append(instr_sps)
+            self.instr_sps_inds.append(instr_sps_keys[instr_sps_key])
+        self.instr_sp_vecs = None
+
+    def responses_done(self):
+        # True once all of the motor responses expected after the final
+        # response cue have been produced. Only the responses produced after
+        # the final cue is presented are counted, so that extra responses
+        # to the earlier tasks do not end the run before the final task.
+        return (len(self.response_cues) > 0 and
+                self.num_final_outputs >= self.response_cues[-1][1])
+
+    def set_responses_done(self, t):
+        if self.t_responses_done is None:
+            self.t_responses_done = t
 
     def reset(self):
         self.prev_t_ind = -1
+        self.output_str = ''
+        self.num_final_outputs = 0
+        self.t_responses_done = None
 
 experiment = SpaunExperiment()
@@ -0,0 +1,136 @@
+import os
+import hashlib
+from warnings import warn
+
+import numpy as np
+
+import nengo
+from nengo.cache import NoDecoderCache
+from nengo.spa import Vocabulary, SemanticPointer
+
+# Python2 vs Python3 imports
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
+from .configurator import cfg
+from .vocabulator import vocab
+
+# Spaun configuration options that do not affect the built model (and so
+# should not cause a cache miss when changed)
+cfg_ignored_params = ['rng', 'data_dir', 'probe_data_filename',
+                      'learn_init_transforms']
+
+
+def get_pickler():
+    # Nengo networks (and Spaun) make heavy use of lambda functions for node
+    # outputs and connection functions. These cannot be pickled with the
+    # default pickle module, so use dill if it is available.
+    try:
+        import dill
+        return dill
+    except ImportError:
+        return pickle
+
+
+def get_model_cache_key(*extra_params):
+    """Generates the hash used to identify a built Spaun model.
+
+    The hash is computed from the Spaun configuration options, the vocabulary
+    vectors (and the permutation transforms used by the instruction
+    vocabulary), and any additional parameters provided (e.g. the probe
+    configuration). The stimulus sequence is not included because the
+    stimulus is only referenced by the Spaun nodes at run time.
+    """
+    hasher = hashlib.sha1()
+
+    def update(value):
+        hasher.update(str(value).encode('utf-8'))
+
+    update('nengo %s' % nengo.__version__)
+
+    for param_name in sorted(cfg.__dict__.keys()):
+        if param_name in cfg_ignored_params:
+            continue
+        param_value = getattr(cfg, param_name)
+        if not callable(param_value):
+            update('%s=%r' % (param_name, param_value))
+
+    for param_name in sorted(vocab.__dict__.keys()):
+        param_value = getattr(vocab, param_name)
+        if isinstance(param_value, Vocabulary):
+            update('%s=%s' % (param_name, param_value.keys))
+            hasher.update(np.ascontiguousarray(param_value.vectors).tobytes())
+        elif isinstance(param_value, SemanticPointer):
+            update(param_name)
+            hasher.update(np.ascontiguousarray(param_value.v).tobytes())
+        elif isinstance(param_value, np.ndarray):
+            update(param_name)
+            hasher.update(np.ascontiguousarray(param_value).tobytes())
+        elif not callable(param_value):
+            update('%s=%r' % (param_name, param_value))
+
+    for param in extra_params:
+        update(repr(param))
+
+    return hasher.hexdigest()
+
+
+def get_model_cache_filename(cache_dir, cache_key):
+    return os.path.join(cache_dir, 'spaun_model+%s.pkl' % cache_key)
+
+
+def load_built_model(cache_dir, cache_key):
+    """Loads a built Spaun model from the model cache.
+
+    Returns the cached data dictionary (see `save_built_model`), or None if
+    the model is not in the cache (or could not be loaded).
+    """
+    cache_filename = get_model_cache_filename(cache_dir, cache_key)
+    if not os.path.exists(cache_filename):
+        return None
+
+    try:
+        with open(cache_filename, 'rb') as f:
+            return get_pickler().load(f)
+    except Exception as e:
+        warn('Model cache - Unable to load cached model "%s": %s' %
+             (cache_filename, e))
+        return None
+
+
+def save_built_model(cache_dir, cache_key, network, builder_model,
+                     **cache_data):
+    """Saves a built Spaun model to the model cache.
+
+    Note: The built model should be saved before the simulation is run, so
+          that the cached signals contain the initial simulation values.
+    """
+    if not os.path.isdir(cache_dir):
+        os.makedirs(cache_dir)
+
+    # The decoder cache is not needed to run the built model (and holds file
+    # handles to the nengo decoder cache)
+    decoder_cache = builder_model.decoder_cache
+    builder_model.decoder_cache = NoDecoderCache()
+
+    cache_data['network'] = network
+    cache_data['builder_model'] = builder_model
+
+    cache_filename = get_model_cache_filename(cache_dir, cache_key)
+    tmp_filename = cache_filename + '.tmp%i' % os.getpid()
+    try:
+        with open(tmp_filename, 'wb') as f:
+            get_pickler().dump(cache_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.rename(tmp_filename, cache_filename)
+    except Exception as e:
+        warn('Model cache - Unable to save built model to "%s": %s' %
+             (cache_filename, e))
+        if os.path.exists(tmp_filename):
+            os.remove(tmp_filename)
+        cache_filename = None
+    finally:
+        builder_model.decoder_cache = decoder_cache
+
+    return cache_filename
@@ -6,6 +6,7 @@ from nengo.spa.module import Module
 from nengo.utils.network import with_self
 
 from ..configurator import cfg
+from ..profiler import profiler
 from ..vocabulator import vocab
 from .instr import PS_Sig_Gen, Data_Sig_Gen, Set_Pos_Inc_Net
 
@@ -250,8 +251,12 @@ class InstructionProcessingSystem(Module):
         def norm_func(t, x):
             return np.linalg.norm(x)
 
-        self.norm_node1 = nengo.Node(size_in=vocab.sp_dim, output=norm_func)
-        self.norm_node2 = nengo.Node(size_in=vocab.sp_dim, output=norm_func)
+        self.norm_node1 = profiler.make_node(size_in=vocab.sp_dim,
+                                             output=norm_func,
+                                             label='Instr norm node 1')
+        self.norm_node2 = profiler.make_node(size_in=vocab.sp_dim,
+                                             output=norm_func,
+                                             label='Instr norm node 2')
         nengo.Connection(instr_pos_cconv.A, self.norm_node1)
         nengo.Connection(instr_pos_cconv.B, self.norm_node2)
 
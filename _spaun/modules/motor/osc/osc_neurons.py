@@ -19,7 +19,36 @@ import numpy as np
 import importlib
 
 import nengo
+from nengo.dists import Distribution
+from nengo.utils.builder import default_n_eval_points
+
 from . import controller
+from ....profiler import profiler
+
+
+def make_batched_connection(pre, post, function, rng, **conn_kwargs):
+    """Make a decoded connection from the ensemble `pre` computing
+    `function`, where `function` is evaluated once on the stack of all of the
+    (n, pre.dimensions) evaluation points (instead of once per evaluation
+    point by the nengo builder).
+
+    The evaluation points are sampled (using `rng`) from the evaluation point
+    distribution of `pre`, and the function targets are given to the
+    connection as the function.
+    """
+    n_eval_points = pre.n_eval_points
+    if n_eval_points is None:
+        n_eval_points = default_n_eval_points(pre.n_neurons, pre.dimensions)
+
+    eval_points = pre.eval_points
+    if isinstance(eval_points, Distribution):
+        eval_points = eval_points.sample(n_eval_points, pre.dimensions,
+                                         rng=rng)
+    eval_points = eval_points * pre.radius
+
+    return nengo.Connection(pre, post, eval_points=eval_points,
+                            scale_eval_points=False,
+                            function=function(eval_points), **conn_kwargs)
 
 
 class OSControllerNengo(controller.Control):
@@ -60,8 +89,13 @@ class OSControllerNengo(controller.Control):
         self.arm_state = np.hstack([self.arm.q, self.arm.dq, self.arm.x])
         return self.arm_state
 
-    def initialize_model(self):
-        """Generate the Nengo model that will control the arm."""
+    def initialize_model(self, arm_node=None):
+        """Generate the Nengo model that will control the arm.
+
+        arm_node nengo.Node: a node whose first 8 output dimensions are the
+                             arm state (q, dq, ee x/y). If None, a node
+                             reading the state from the arm is created.
+        """
 
         config_file = importlib.import_module(
             '_spaun.arms.%s.config' % self.arm_class_name, 'OSCConfig')
@@ -73,16 +107,22 @@ class OSControllerNengo(controller.Control):
         model = nengo.Network('OSC', seed=2)
         model.config[nengo.Connection].synapse = nengo.synapses.Lowpass(.001)
 
+        # Evaluation points of the connections with batched target functions
+        rng = np.random.RandomState(model.seed)
+
         with model:
             # model.config[nengo.Ensemble].neuron_type = nengo.Direct()
 
             # create input nodes
-            arm_node = nengo.Node(self.get_arm_state, size_out=8)
+            if arm_node is None:
+                arm_node = profiler.make_node(self.get_arm_state, size_out=8,
+                                              label='OSC arm state')
 
             # def get_target(t):
             #     return model.target
             # model.target = nengo.Node(output=get_target)
-            model.target = nengo.Node(output=self.set_target, size_in=2)
+            model.target = profiler.make_node(output=self.set_target,
+                                              size_in=2, label='OSC target')
 
             # create neural ensembles
             CB = nengo.Ensemble(**config.CB)
@@ -100,28 +140,32 @@ class OSControllerNengo(controller.Control):
 
             def set_output(t, x):
                 self.u = x
-            output_node = nengo.Node(output=set_output, size_in=3)
+            output_node = profiler.make_node(output=set_output, size_in=3,
+                                             label='OSC output')
 
             # connect up arm feedback to Cerebellum
             nengo.Connection(arm_node[:6], CB,
                              function=lambda x: config.CB_scaledown(x))
 
             def gen_Mqdq(signal, kv):
-                """Generate inertia compensation signal, np.dot(Mq,dq)"""
+                """Generate inertia compensation signal, np.dot(Mq,dq)
+                (for a stack of signals)"""
                 # scale things back
                 signal = config.CB_scaleup(signal)
 
-                q = signal[:3]
-                dq = signal[3:6]
+                q = signal[:, :3]
+                dq = signal[:, 3:6]
 
-                Mq = self.arm.gen_Mq(q=q)
-                # return np.dot(Mq, kv * dq).flatten()
-                return np.dot(Mq, self.kv * dq).flatten()
+                q_sum = np.cumsum(q, axis=1)
+                Mq = self.arm.gen_Mq_batch(sinq=np.sin(q_sum),
+                                           cosq=np.cos(q_sum))
+                # return np.einsum('nij,nj->ni', Mq, kv * dq)
+                return np.einsum('nij,nj->ni', Mq, self.kv * dq)
 
             # connect up Cerebellum inertia compensation to summation node
-            nengo.Connection(CB, u_relay,
-                             function=lambda x: gen_Mqdq(x, self.kv),
-                             transform=-1, synapse=None)  # , synapse=.005)
+            make_batched_connection(CB, u_relay,
+                                    lambda x: gen_Mqdq(x, self.kv), rng,
+                                    transform=-1, synapse=None)
 
             model.CB2_inhibit = nengo.Node(size_in=1)
             if self.kv2 != 0:
@@ -131,9 +175,9 @@ class OSControllerNengo(controller.Control):
                 CB2 = nengo.Ensemble(**config.CB)
                 nengo.Connection(arm_node[:6], CB2,
                                  function=lambda x: config.CB_scaledown(x))
-                nengo.Connection(CB2, u_relay,
-                                 function=lambda x: gen_Mqdq(x, self.kv2),
-                                 transform=-1, synapse=None)  # , synapse=.005)
+                make_batched_connection(CB2, u_relay,
+                                        lambda x: gen_Mqdq(x, self.kv2), rng,
+                                        transform=-1, synapse=None)
                 nengo.Connection(model.CB2_inhibit, CB2.neurons,
                                  transform=([[-config.CB['radius'] * 2.5]] *
                                             config.CB['n_neurons']),
@@ -159,8 +203,9 @@ class OSControllerNengo(controller.Control):
                                  transform=-1. / config.u_scaling[1])
             # connect up dot product output (post scaling) to summation node
             block_node = \
-                nengo.Node(output=lambda t, x: x * (not self.block_output),
-                           size_in=3, size_out=3)
+                profiler.make_node(
+                    output=lambda t, x: x * (not self.block_output),
+                    size_in=3, size_out=3, label='OSC output block')
             nengo.Connection(M1_mult_output[::2], block_node,
                              transform=self.kp)
             nengo.Connection(M1_mult_output[1::2], block_node,
@@ -179,55 +224,64 @@ class OSControllerNengo(controller.Control):
                                        np.cos(np.cumsum(x))])))
 
             def gen_JEETMx(signal, use_incorrect_values=False):
-                """Generate Jacobian weighted by task-space inertia matrix"""
+                """Generate Jacobian weighted by task-space inertia matrix
+                (for a stack of signals)"""
                 # scale things back
                 signal = config.M1_scaleup(signal)
 
-                sinq = signal[:3]
-                cosq = signal[3:6]
+                sinq = signal[:, :3]
+                cosq = signal[:, 3:6]
 
-                Mx = self.arm.gen_Mx_sinq_cosq(sinq=sinq, cosq=cosq)
-                JEE = self.arm.gen_jacEE_sinq_cosq(sinq=sinq, cosq=cosq,
-                          use_incorrect_values=use_incorrect_values) # noqa
-                JEETMx = np.dot(JEE.T, Mx)
-                return JEETMx.flatten()
+                Mx = self.arm.gen_Mx_batch(sinq=sinq, cosq=cosq)
+                JEE = self.arm.gen_jacEE_batch(
+                    sinq=sinq, cosq=cosq,
+                    use_incorrect_values=use_incorrect_values)
+                JEETMx = np.einsum('nji,njk->nik', JEE, Mx)
+                return JEETMx.reshape(len(signal), -1)
 
             def scaled_gen_JEETMx(signal, **kwargs):
                 return config.DP_scaledown(gen_JEETMx(signal, **kwargs))
 
             if self.adaptation != 'kinematic':
                 # set up regular transform connection
-                nengo.Connection(M1[:6], M1_mult.input[1::2],
-                                 function=scaled_gen_JEETMx, synapse=.005)
+                make_batched_connection(M1, M1_mult.input[1::2],
+                                        scaled_gen_JEETMx, rng, synapse=.005)
 
             # ------------------ set up null control ------------------
             if self.null_control:
                 def gen_null_signal(signal):
-                    """Generate the null space control signal"""
+                    """Generate the null space control signal (for a stack
+                    of signals)"""
 
                     # calculate our secondary control signal
-                    q = config.M1null_scaleup(signal[:3])
+                    q = config.M1null_scaleup(signal[:, :3])
                     u_null = (((self.arm.rest_angles - q) + np.pi) %
                               (np.pi * 2) - np.pi)
 
-                    Mq = self.arm.gen_Mq(q=q)
-                    JEE = self.arm.gen_jacEE(q=q)
-                    Mx = self.arm.gen_Mx(q=q)
+                    q_sum = np.cumsum(q, axis=1)
+                    sinq = np.sin(q_sum)
+                    cosq = np.cos(q_sum)
+                    Mq = self.arm.gen_Mq_batch(sinq=sinq, cosq=cosq)
+                    JEE = self.arm.gen_jacEE_batch(sinq=sinq, cosq=cosq)
+                    Mx = self.arm.gen_Mx_batch(sinq=sinq, cosq=cosq, Mq=Mq,
+                                               JEE=JEE)
 
-                    u_null = np.dot(Mq, self.kp * u_null)
+                    u_null = np.einsum('nij,nj->ni', Mq, self.kp * u_null)
 
                     # calculate the null space filter
-                    Jdyn_inv = np.dot(Mx, np.dot(JEE, np.linalg.inv(Mq)))
-                    null_filter = np.eye(3) - np.dot(JEE.T, Jdyn_inv)
+                    Jdyn_inv = np.einsum('nij,njk,nkl->nil', Mx, JEE,
+                                         np.linalg.inv(Mq))
+                    null_filter = np.eye(3) - np.einsum('nji,njk->nik', JEE,
+                                                        Jdyn_inv)
 
-                    return np.dot(null_filter, u_null).flatten()
+                    return np.einsum('nij,nj->ni', null_filter, u_null)
 
                 M1_null = nengo.Ensemble(**config.M1_null)
 
                 nengo.Connection(arm_node[:3], M1_null,
                                  function=config.M1null_scaledown)
-                nengo.Connection(M1_null, block_node,
-                                 function=gen_null_signal)
+                make_batched_connection(M1_null, block_node,
+                                        gen_null_signal, rng)
             # --------------------------------------------------------
         return model
 
@@ -10,10 +10,46 @@ from nengo.utils.network import with_self
 
 from .._networks import DifferenceFunctionEvaluator as DiffFuncEvaltr
 from ..configurator import cfg
+from ..profiler import profiler
 from ..vocabulator import vocab
 from .motor import Controller, Ramp_Signal_Network, forcefield, mtr_data
 
 
+def get_arm_state_slices(dof):
+    """Slices of the packed arm state vector (output of the arm node) for
+    an arm with `dof` joints"""
+    return {'q': slice(0, dof),
+            'dq': slice(dof, dof * 2),
+            'ee': slice(dof * 2, 2 + dof * 2),
+            'ee_centered': slice(2 + dof * 2, 4 + dof * 2),
+            'joints_x': slice(4 + dof * 2, 5 + dof * 3),
+            'joints_y': slice(5 + dof * 3, 6 + dof * 4)}
+
+
+def make_arm_node(arm_obj, ee_bias, dt=None):
+    """Make the arm node. If `dt` is given, the node applies its (torque)
+    input to the arm (stepping the arm simulation by `dt`) every timestep.
+    The node outputs the packed arm state vector: the joint angles and
+    velocities, the end-effector location (in that order, as expected by the
+    OSC network), the end-effector location relative to `ee_bias`, and the x
+    and y locations of the arm joints (see get_arm_state_slices). The arm
+    forward kinematics are computed once per timestep."""
+    def arm_state():
+        joints_x, joints_y = arm_obj.position()
+        ee = np.array([joints_x[-1], joints_y[-1]])
+        return np.hstack([arm_obj.q, arm_obj.dq, ee, ee - ee_bias,
+                          joints_x, joints_y])
+
+    if dt is None:
+        return profiler.make_node(output=lambda t: arm_state(), label='Arm')
+
+    def arm_step(t, x):
+        arm_obj.apply_torque(x, dt)
+        return arm_state()
+    return profiler.make_node(output=arm_step, size_in=arm_obj.DOF,
+                              size_out=6 + arm_obj.DOF * 4, label='Arm')
+
+
 class MotorSystem(Module):
     def __init__(self, label="Motor Sys", seed=None, add_to_container=None):
         super(MotorSystem, self).__init__(label, seed, add_to_container)
@@ -105,9 +141,11 @@ class MotorSystem(Module):
                                                        ee_only=True))
             # Note: arm_rest_coord is only used for initialization & startup
             #       transients
-            arm_node = nengo.Node(output=lambda t, x, dt=cfg.sim_dt,
-                                  arm=arm_obj: arm.apply_torque(x, dt),
-                                  size_in=arm_obj.DOF)
+            arm_node = make_arm_node(arm_obj,
+                                     np.array([cfg.mtr_arm_rest_x_bias,
+                                               cfg.mtr_arm_rest_y_bias]),
+                                     dt=cfg.sim_dt)
+            arm_slices = get_arm_state_slices(arm_obj.DOF)
 
             kp = mtr_data.kp if cfg.mtr_kp is None else cfg.mtr_kp
             kv1 = mtr_data.kv1 if cfg.mtr_kv1 is None else cfg.mtr_kv1
@@ -118,7 +156,9 @@ class MotorSystem(Module):
                                   arm_class_name=cfg.mtr_arm_type)
 
             # Make the osc control
-            ctrl_net = ctrl_obj.initialize_model()
+            # Note: ctrl_net reads the arm state (q, dq, ee location) from
+            #       the packed arm state
+            ctrl_net = ctrl_obj.initialize_model(arm_node=arm_node)
             self.ctrl_net = ctrl_net
 
             # Connect output of motor path evaluator to ctrl_net
@@ -136,17 +176,15 @@ class MotorSystem(Module):
             nengo.Connection(ctrl_net.output, arm_node)
 
             if cfg.mtr_dyn_adaptation:
-                # Arm state
-                arm_state = nengo.Node(output=lambda t, arm=arm_obj:
-                                       np.hstack([arm.q, arm.dq]))
-
                 # Create ensemble for arm dynamics adaptation
                 adapt_ens = nengo.Ensemble(cfg.mtr_dyn_adaptation_n_neurons,
                                            arm_obj.DOF * 2)
 
-                # Get information from the arm and connect to learning ensemble
+                # Get information from the arm (q, dq) and connect to learning
+                # ensemble
                 nengo.Connection(
-                    arm_state, adapt_ens,
+                    arm_node[arm_slices['q'].start:arm_slices['dq'].stop],
+                    adapt_ens,
                     function=lambda x: ctrl_obj.config.CB_scaledown(x))
 
                 # Make the learning connection
@@ -163,9 +201,10 @@ class MotorSystem(Module):
 
             # ------ MOTOR ARM FORCE FIELD ADDITION ------
             forcefield_obj = getattr(forcefield, cfg.mtr_forcefield)(arm_obj)
-            forcefield_node = nengo.Node(
+            forcefield_node = profiler.make_node(
                 size_in=arm_obj.DOF,
-                output=lambda t, x: forcefield_obj.generate(x))
+                output=lambda t, x: forcefield_obj.generate(x),
+                label='Arm forcefield')
             nengo.Connection(ctrl_net.output, forcefield_node, synapse=None)
             nengo.Connection(forcefield_node, arm_node,
                              synapse=cfg.mtr_forcefield_synapse)
@@ -173,15 +212,12 @@ class MotorSystem(Module):
             self.ff_node = forcefield_node
 
             # ------ ARM ZERO-CENTERED END EFFECTOR POSITION ------
-            # ## Note: ctrl_net already has an internal node that gets info
-            #          from arm_obj (i.e. state information). So an external
-            #          connection is not required
-
-            zero_centered_arm_ee_loc = \
-                nengo.Node(output=lambda t,
-                           bias=np.array([cfg.mtr_arm_rest_x_bias,
-                                          cfg.mtr_arm_rest_y_bias]),
-                           arm=arm_obj: arm.x - bias, label='Centered Arm EE')
+            # ## Note: Sliced from the packed arm state (as is all of the
+            #          arm state information)
+            zero_centered_arm_ee_loc = nengo.Node(size_in=2,
+                                                  label='Centered Arm EE')
+            nengo.Connection(arm_node[arm_slices['ee_centered']],
+                             zero_centered_arm_ee_loc, synapse=None)
 
         # ------ MOTOR ARM CONTROL SIGNAL FEEDBACK ------
         # X to target norm calculation
@@ -271,10 +307,12 @@ class MotorSystem(Module):
 
         # Arm segments joint locations
         if arm_obj is not None:
-            self.arm_px_node = \
-                nengo.Node(output=lambda t, arm=arm_obj: arm.position()[0])
-            self.arm_py_node = \
-                nengo.Node(output=lambda t, arm=arm_obj: arm.position()[1])
+            self.arm_px_node = nengo.Node(size_in=arm_obj.DOF + 1)
+            self.arm_py_node = nengo.Node(size_in=arm_obj.DOF + 1)
+            nengo.Connection(arm_node[arm_slices['joints_x']],
+                             self.arm_px_node, synapse=None)
+            nengo.Connection(arm_node[arm_slices['joints_y']],
+                             self.arm_py_node, synapse=None)
         else:
             self.arm_px_node = nengo.Node(0)
             self.arm_py_node = nengo.Node(0)
@@ -324,9 +362,17 @@ class MotorSystem(Module):
         nengo.Connection(self.motor_init_ps_dec.output, self.motor_init,
                          transform=-6, synapse=0.05)
 
-        self.arm_state = nengo.Node(output=lambda t, arm=arm_obj:
-                                    np.hstack([arm.q, arm.dq]))
-        self.arm_dq = nengo.Node(output=lambda t, arm=arm_obj: arm.dq)
+        if arm_obj is not None:
+            self.arm_state = nengo.Node(size_in=arm_obj.DOF * 2)
+            self.arm_dq = nengo.Node(size_in=arm_obj.DOF)
+            nengo.Connection(
+                arm_node[arm_slices['q'].start:arm_slices['dq'].stop],
+                self.arm_state, synapse=None)
+            nengo.Connection(arm_node[arm_slices['dq']], self.arm_dq,
+                             synapse=None)
+        else:
+            self.arm_state = nengo.Node(0)
+            self.arm_dq = nengo.Node(0)
 
     def setup_connections(self, parent_net):
         # Set up connections from vision system module
@@ -456,16 +502,20 @@ class MotorSystemDummy(Module):
         if arm_obj is not None:
             self.ff_node = nengo.Node(0)
 
-            # ------ ARM ZERO-CENTERED END EFFECTOR POSITION ------
-            # ## Note: ctrl_net already has an internal node that gets info
-            #          from arm_obj (i.e. state information). So an external
-            #          connection is not required
+            # Arm node (the arm is not driven, so only outputs the packed arm
+            # state)
+            arm_node = make_arm_node(arm_obj,
+                                     np.array([cfg.mtr_arm_rest_x_bias,
+                                               cfg.mtr_arm_rest_y_bias]))
+            arm_slices = get_arm_state_slices(arm_obj.DOF)
 
-            zero_centered_arm_ee_loc = \
-                nengo.Node(output=lambda t,
-                           bias=np.array([cfg.mtr_arm_rest_x_bias,
-                                          cfg.mtr_arm_rest_y_bias]),
-                           arm=arm_obj: arm.x - bias, label='Centered Arm EE')
+            # ------ ARM ZERO-CENTERED END EFFECTOR POSITION ------
+            # ## Note: Sliced from the packed arm state (as is all of the
+            #          arm state information)
+            zero_centered_arm_ee_loc = nengo.Node(size_in=2,
+                                                  label='Centered Arm EE')
+            nengo.Connection(arm_node[arm_slices['ee_centered']],
+                             zero_centered_arm_ee_loc, synapse=None)
 
         # ------ MOTOR ARM CONTROL SIGNAL FEEDBACK ------
 
@@ -479,10 +529,12 @@ class MotorSystemDummy(Module):
 
         # Arm segments joint locations
         if arm_obj is not None:
-            self.arm_px_node = \
-                nengo.Node(output=lambda t, arm=arm_obj: arm.position()[0])
-            self.arm_py_node = \
-                nengo.Node(output=lambda t, arm=arm_obj: arm.position()[1])
+            self.arm_px_node = nengo.Node(size_in=arm_obj.DOF + 1)
+            self.arm_py_node = nengo.Node(size_in=arm_obj.DOF + 1)
+            nengo.Connection(arm_node[arm_slices['joints_x']],
+                             self.arm_px_node, synapse=None)
+            nengo.Connection(arm_node[arm_slices['joints_y']],
+                             self.arm_py_node, synapse=None)
         else:
             self.arm_px_node = nengo.Node(0)
             self.arm_py_node = nengo.Node(0)
@@ -531,9 +583,17 @@ class MotorSystemDummy(Module):
                          transform=-6, synapse=0.05)
 
         # ################ DEBUG CODE ###################
-        self.arm_state = nengo.Node(output=lambda t, arm=arm_obj:
-                                    np.hstack([arm.q, arm.dq]))
-        self.arm_dq = nengo.Node(output=lambda t, arm=arm_obj: arm.dq)
+        if arm_obj is not None:
+            self.arm_state = nengo.Node(size_in=arm_obj.DOF * 2)
+            self.arm_dq = nengo.Node(size_in=arm_obj.DOF)
+            nengo.Connection(
+                arm_node[arm_slices['q'].start:arm_slices['dq'].stop],
+                self.arm_state, synapse=None)
+            nengo.Connection(arm_node[arm_slices['dq']], self.arm_dq,
+                             synapse=None)
+        else:
+            self.arm_state = nengo.Node(0)
+            self.arm_dq = nengo.Node(0)
 
     def setup_connections(self, parent_net):
         # Set up connections from vision system module
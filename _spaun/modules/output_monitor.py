@@ -6,6 +6,7 @@ from nengo.spa.module import Module
 from nengo.utils.network import with_self
 
 from ..configurator import cfg
+from ..profiler import profiler
 from ..vocabulator import vocab
 from ..experimenter import experiment
 
@@ -25,9 +26,9 @@ class SpaunOutputMonitor(Module):
             raise RuntimeError('Not Implemented')
         else:
             self.output = \
-                nengo.Node(output=self.monitor_node_func,
-                           size_in=len(vocab.mtr.keys) + 3,
-                           label='Experiment monitor')
+                profiler.make_node(output=self.monitor_node_func,
+                                   size_in=len(vocab.mtr.keys) + 3,
+                                   label='Experiment monitor')
 
         # Define vocabulary inputs and outputs
         self.outputs = dict(default=(self.output, vocab.vis_main))
@@ -47,6 +48,12 @@ class SpaunOutputMonitor(Module):
             elif mtr_ramp < self.mtr_reset_max:
                 self.mtr_exp_updated = False
 
+        # Signal that the experiment is done once the responses expected
+        # after the final response cue have been written, and the motor
+        # system has finished drawing them
+        if mtr_ramp < self.mtr_reset_max and experiment.responses_done():
+            experiment.set_responses_done(t)
+
     def setup_connections(self, parent_net):
         # Set up connections from motor module
         if hasattr(parent_net, 'mtr'):
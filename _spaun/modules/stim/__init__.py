@@ -1,5 +1,6 @@
 import importlib
 
 from ...configurator import cfg
+from ...utils import LazyDataObject
 stim_module = importlib.import_module('_spaun.modules.stim.' + cfg.stim_module)
-stim_data = stim_module.DataObject()
+stim_data = LazyDataObject(stim_module.DataObject)
@@ -0,0 +1,98 @@
+import os
+from warnings import warn
+
+import numpy as np
+
+# Stimulus dataset cache format version (increment to invalidate existing
+# caches when the cached data changes)
+data_cache_version = 1
+
+images_data_filename = 'images_data.npy'
+cache_data_filename = 'cache_data.npz'
+
+
+def get_source_info(source_filenames):
+    # Identifies the versions of the dataset source files (by file size and
+    # modification time)
+    return ['%s:%i:%i' % (os.path.basename(filename),
+                          os.path.getsize(filename),
+                          int(os.path.getmtime(filename)))
+            for filename in source_filenames]
+
+
+def load_data_cache(cache_dir, source_filenames):
+    """Loads a stimulus dataset from the dataset cache.
+
+    The image data is memory-mapped (read-only), so that the dataset loads
+    without reading the image data, and so that processes using the same
+    dataset share the image data through the OS page cache.
+
+    Returns the image data and a dictionary of the other cached data arrays,
+    or None if the dataset cache does not exist or is out of date. If none of
+    the dataset source files can be found, the cache is assumed to be valid.
+    """
+    images_filename = os.path.join(cache_dir, images_data_filename)
+    data_filename = os.path.join(cache_dir, cache_data_filename)
+    if not (os.path.exists(images_filename) and
+            os.path.exists(data_filename)):
+        return None
+
+    try:
+        with np.load(data_filename) as data_fileobj:
+            cache_data = dict([(key, data_fileobj[key])
+                               for key in data_fileobj.keys()])
+
+        if int(cache_data.pop('version')) != data_cache_version:
+            return None
+
+        source_info = list(map(str, cache_data.pop('source_info')))
+        source_filenames = [filename for filename in source_filenames
+                            if os.path.exists(filename)]
+        if len(source_filenames) > 0 and \
+           source_info != get_source_info(source_filenames):
+            return None
+
+        images_data = np.load(images_filename, mmap_mode='r')
+    except Exception as e:
+        warn('Stimulus data cache - Unable to load cached data from "%s": %s'
+             % (cache_dir, e))
+        return None
+
+    return images_data, cache_data
+
+
+def save_data_cache(cache_dir, source_filenames, images_data, **cache_data):
+    """Saves a (processed) stimulus dataset to the dataset cache.
+
+    Returns True if the dataset was successfully saved.
+    """
+    images_filename = os.path.join(cache_dir, images_data_filename)
+    data_filename = os.path.join(cache_dir, cache_data_filename)
+    tmp_suffix = '.tmp%i' % os.getpid()
+
+    cache_data['version'] = data_cache_version
+    cache_data['source_info'] = get_source_info(source_filenames)
+
+    try:
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir)
+
+        # Note: Data is written to temporary files first so that processes
+        #       loading the dataset at the same time never see partially
+        #       written cache files.
+        with open(images_filename + tmp_suffix, 'wb') as f:
+            np.save(f, np.ascontiguousarray(images_data))
+        with open(data_filename + tmp_suffix, 'wb') as f:
+            np.savez(f, **cache_data)
+        os.rename(images_filename + tmp_suffix, images_filename)
+        os.rename(data_filename + tmp_suffix, data_filename)
+    except Exception as e:
+        warn('Stimulus data cache - Unable to save data to "%s": %s' %
+             (cache_dir, e))
+        for filename in [images_filename + tmp_suffix,
+                         data_filename + tmp_suffix]:
+            if os.path.exists(filename):
+                os.remove(filename)
+        return False
+
+    return True
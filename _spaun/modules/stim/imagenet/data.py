@@ -4,6 +4,8 @@ import bisect as bs
 
 from nengo_extras.data import load_ilsvrc2012, spasafe_names
 
+from ..data_cache import load_data_cache, save_data_cache
+
 
 class ImagenetDataObject(object):
     def __init__(self, data_filepath=None):
@@ -15,66 +17,39 @@ class ImagenetDataObject(object):
         else:
             self.filepath = data_filepath
 
-        # --- Spaun symbol data ---
-        spaun_sym_filename = 'spaun_sym.npz'
-
-        sym_fileobj = np.load(os.path.join(self.filepath, spaun_sym_filename),
-                              encoding='latin1')
-
-        # --- Imagenet data ---
-        # retrieve from https://figshare.com/s/cdde71007405eb11a88f
-        data_filename = os.path.join(self.filepath,
-                                     'ilsvrc-2012-batches-test3.tar.gz')
-
-        # Try alternate params filename if can't locate default file
-        if not os.path.exists(data_filename):
-            data_filename = \
-                os.path.join(self.filepath, 'ilsvrc2012batchestest3.tar.gz')
-
-        images_data, images_labels, images_data_mean, class_labels = \
-            load_ilsvrc2012(data_filename, n_files=5)
-
-        # --- Mean data ---
-        data_mean_filename = 'image_data_mean.npz'
-
-        # Image pre-processing
-        images_data = images_data.astype('float32')
-        images_data = images_data[:, :, 16:-16, 16:-16]
-        # images_data_mean = images_data_mean[:, 16:-16, 16:-16]
-        images_data_mean = \
-            np.load(os.path.join(self.filepath,
-                                 data_mean_filename),
-                    encoding='latin1')['data_mean']
-
-        # --- Combined image (imagenet + spaun symbol) data ---
-        # Spaun symbol data
-        sym_im_data = sym_fileobj['image_data']
-        sym_label_strs = list(sym_fileobj['image_labels'])
+        # --- Load (cropped and sorted) image data from the dataset cache ---
+        cache_dir = os.path.join(self.filepath, 'data_cache')
+        source_filenames = [os.path.join(self.filepath, 'spaun_sym.npz'),
+                            os.path.join(self.filepath,
+                                         'image_data_mean.npz'),
+                            self.get_data_filename()]
+
+        cached_data = load_data_cache(cache_dir, source_filenames)
+        if cached_data is None:
+            cache_data = self.load_source_data()
+            images_data = cache_data.pop('images_data')
+
+            # Cache the image data, and use the memory-mapped data from the
+            # dataset cache if it was saved successfully
+            if save_data_cache(cache_dir, source_filenames, images_data,
+                               **cache_data):
+                cached_data = load_data_cache(cache_dir, source_filenames)
+            else:
+                cached_data = (images_data, cache_data)
+        images_data, cache_data = cached_data
 
-        self.num_spaun_sym_classes = len(sym_label_strs)
-        sym_im_labels = range(self.num_spaun_sym_classes)
+        self.num_spaun_sym_classes = int(cache_data['num_spaun_sym_classes'])
+        self.num_imagenet_classes = int(cache_data['num_imagenet_classes'])
 
         # Imagenet data
-        self.images_data_mean = images_data_mean.flatten()
-
-        self.images_data_dimensions = \
-            images_data[0, :, :, :].flatten().shape[0]
-
-        sorted_inds = np.argsort(images_labels)
-        imagenet_im_data = images_data[sorted_inds]
-        imagenet_im_labels = np.array(images_labels[sorted_inds])
-
-        imagenet_label_strs = list(map(lambda s: str(s).upper(),
-                                   spasafe_names(class_labels)))
-
-        self.num_imagenet_classes = len(imagenet_label_strs)
+        self.images_data_mean = cache_data['images_data_mean']
+        self.images_data_dimensions = int(np.prod(images_data.shape[1:]))
 
         # Combined data
-        self.images_data = np.vstack((sym_im_data, imagenet_im_data))
-        self.images_labels = (sym_im_labels +
-                              list(imagenet_im_labels +
-                                   self.num_spaun_sym_classes))
-        self.stim_SP_labels = np.array(sym_label_strs + imagenet_label_strs)
+        self.images_data = images_data
+        self.images_labels = list(map(int, cache_data['images_labels']))
+        self.stim_SP_labels = np.array(list(map(str,
+                                                cache_data['stim_SP_labels'])))
         self.num_classes = (self.num_spaun_sym_classes +
                             self.num_imagenet_classes)
 
@@ -86,6 +61,16 @@ class ImagenetDataObject(object):
                 range(bs.bisect_left(self.images_labels, lbl),
                       bs.bisect_right(self.images_labels, lbl))
 
+        # --- Label and image indexes ---
+        # SP label -> class index (index into images_labels_inds)
+        # Note: The first class with a given SP label is used (if the SP
+        #       label is not unique)
+        self.images_labels_class_inds = {}
+        for i, lbl in enumerate(self.stim_SP_labels):
+            self.images_labels_class_inds.setdefault(str(lbl), i)
+        # image index -> class index
+        self.images_labels_array = np.array(self.images_labels)
+
         # --- Image data ---
         self.image_shape = (3, 224, 224)
         self.max_pixel_value = 255.0
@@ -125,6 +110,66 @@ class ImagenetDataObject(object):
              (self.get_image('V')[0] /
              (1.0 * self.max_pixel_value))[subsample_inds]]
 
+    def get_data_filename(self):
+        # retrieve from https://figshare.com/s/cdde71007405eb11a88f
+        data_filename = os.path.join(self.filepath,
+                                     'ilsvrc-2012-batches-test3.tar.gz')
+
+        # Try alternate params filename if can't locate default file
+        if not os.path.exists(data_filename):
+            data_filename = \
+                os.path.join(self.filepath, 'ilsvrc2012batchestest3.tar.gz')
+        return data_filename
+
+    def load_source_data(self):
+        # --- Spaun symbol data ---
+        spaun_sym_filename = 'spaun_sym.npz'
+
+        sym_fileobj = np.load(os.path.join(self.filepath, spaun_sym_filename),
+                              encoding='latin1')
+
+        # --- Imagenet data ---
+        images_data, images_labels, images_data_mean, class_labels = \
+            load_ilsvrc2012(self.get_data_filename(), n_files=5)
+
+        # --- Mean data ---
+        data_mean_filename = 'image_data_mean.npz'
+
+        # Image pre-processing
+        images_data = images_data.astype('float32')
+        images_data = images_data[:, :, 16:-16, 16:-16]
+        # images_data_mean = images_data_mean[:, 16:-16, 16:-16]
+        images_data_mean = \
+            np.load(os.path.join(self.filepath,
+                                 data_mean_filename),
+                    encoding='latin1')['data_mean']
+
+        # --- Combined image (imagenet + spaun symbol) data ---
+        # Spaun symbol data
+        sym_im_data = sym_fileobj['image_data']
+        sym_label_strs = list(sym_fileobj['image_labels'])
+
+        num_spaun_sym_classes = len(sym_label_strs)
+        sym_im_labels = list(range(num_spaun_sym_classes))
+
+        # Imagenet data
+        sorted_inds = np.argsort(images_labels)
+        imagenet_im_data = images_data[sorted_inds]
+        imagenet_im_labels = np.array(images_labels[sorted_inds])
+
+        imagenet_label_strs = list(map(lambda s: str(s).upper(),
+                                   spasafe_names(class_labels)))
+
+        return {'images_data': np.vstack((sym_im_data, imagenet_im_data)),
+                'images_labels': np.array(sym_im_labels +
+                                          list(imagenet_im_labels +
+                                               num_spaun_sym_classes)),
+                'images_data_mean': images_data_mean.flatten(),
+                'stim_SP_labels': np.array(sym_label_strs +
+                                           imagenet_label_strs),
+                'num_spaun_sym_classes': num_spaun_sym_classes,
+                'num_imagenet_classes': len(imagenet_label_strs)}
+
     def get_image(self, label=None, rng=None):
         if rng is None:
             rng = np.random.RandomState()
@@ -144,10 +189,9 @@ class ImagenetDataObject(object):
             return (self.images_data[image_ind].flatten(), image_ind)
 
     def get_image_label(self, index):
-        for label, indicies in enumerate(self.images_labels_inds):
-            if indicies is not None and index in indicies:
-                return self.stim_SP_labels[label]
-        return -1
+        if index < 0 or index >= self.images_labels_array.shape[0]:
+            return -1
+        return self.stim_SP_labels[self.images_labels_array[index]]
 
     def get_image_ind(self, label, rng):
         # --- HACK FOR SPAUN DIGITS
@@ -157,18 +201,18 @@ class ImagenetDataObject(object):
 
         if all(c.isdigit() for c in label):
             # Case where the class label index (and not the SP name) is given
-            label_ind = (np.array([int(label)]),)
+            label_ind = int(label)
         else:
             # Case where class label SP name is given
-            label_ind = np.where(self.stim_SP_labels == label)
+            label_ind = self.images_labels_class_inds.get(label)
 
-        if label_ind[0].shape[0] > 0:
-            if label_ind[0][0] is None:
+        if label_ind is not None:
+            indicies = self.images_labels_inds[label_ind]
+            if indicies is None:
                 image_ind = 0   # TODO: Fix this? This happens when trying to
                 # get image that was not in dataset (depends on nfiles)
             else:
-                image_ind = rng.choice(
-                    self.images_labels_inds[label_ind[0][0]])
+                image_ind = indicies[rng.randint(len(indicies))]
         else:
             raise RuntimeError('IMAGENET - Unable to find label matching ' +
                                '[%s] in label set.' % label)
@@ -3,6 +3,7 @@ import numpy as np
 import bisect as bs
 
 from . import mnist
+from ..data_cache import load_data_cache, save_data_cache
 
 
 class MNISTDataObject(object):
@@ -15,31 +16,37 @@ class MNISTDataObject(object):
         else:
             self.filepath = data_filepath
 
-        # --- Mnist data ---
-        _, _, [images_data, images_labels] = \
-            mnist.read_file('mnist.pkl.gz', self.filepath)
-        images_labels = list(map(str, images_labels))
-
-        # --- Spaun symbol data ---
-        _, _, [symbol_data, _] = \
-            mnist.read_file('spaun_sym.pkl.gz', self.filepath)
-
         symbol_labels = ['ZER', 'ONE', 'TWO', 'THR', 'FOR', 'FIV', 'SIX',
                          'SEV', 'EIG', 'NIN', 'OPEN', 'CLOSE', 'SPACE', 'QM',
                          'A', 'C', 'F', 'K', 'L', 'M', 'P', 'R', 'V', 'W']
 
-        # --- Combined image (mnist + spaun symbol) data ---
-        images_data = np.append(images_data, symbol_data, axis=0)
-        images_labels = np.append(images_labels, symbol_labels, axis=0)
-
-        sorted_labels = np.argsort(images_labels)
-        images_data = images_data[sorted_labels]
-        images_labels = images_labels[sorted_labels]
-
-        self.images_data_mean = images_data.mean(axis=0, keepdims=True)
-        self.images_data_std = 1.0 / np.maximum(images_data.std(axis=0,
-                                                                keepdims=True),
-                                                3e-1)
+        # --- Load (sorted) image data from the dataset cache ---
+        cache_dir = os.path.join(self.filepath, 'data_cache')
+        source_filenames = [os.path.join(self.filepath, 'mnist.pkl.gz'),
+                            os.path.join(self.filepath, 'spaun_sym.pkl.gz')]
+
+        cached_data = load_data_cache(cache_dir, source_filenames)
+        if cached_data is None:
+            images_data, images_labels = self.load_source_data(symbol_labels)
+            images_data_mean = images_data.mean(axis=0, keepdims=True)
+            images_data_std = images_data.std(axis=0, keepdims=True)
+
+            # Cache the image data, and use the memory-mapped data from the
+            # dataset cache if it was saved successfully
+            if save_data_cache(cache_dir, source_filenames, images_data,
+                               images_labels=images_labels,
+                               images_data_mean=images_data_mean,
+                               images_data_std=images_data_std):
+                cached_data = load_data_cache(cache_dir, source_filenames)
+
+        if cached_data is not None:
+            images_data, cache_data = cached_data
+            images_labels = cache_data['images_labels']
+            images_data_mean = cache_data['images_data_mean']
+            images_data_std = cache_data['images_data_std']
+
+        self.images_data_mean = images_data_mean
+        self.images_data_std = 1.0 / np.maximum(images_data_std, 3e-1)
 
         self.images_data_dimensions = images_data[0].shape[0]
         self.images_labels_inds = []
@@ -56,6 +63,15 @@ class MNISTDataObject(object):
         self.stim_SP_labels_full = (list(map(str, self.images_labels_unique)) +
                                     symbol_labels)
 
+        # --- Label and image indexes ---
+        # label -> class index (index into images_labels_inds)
+        self.images_labels_class_inds = \
+            dict([(lbl, i) for i, lbl in enumerate(self.images_labels_unique)])
+        # class index -> first image index (used to find the class of an
+        # image index using searchsorted)
+        self.images_labels_starts = \
+            np.array([inds[0] for inds in self.images_labels_inds])
+
         self.image_shape = (28, 28)
         self.max_pixel_value = 1.0
 
@@ -79,6 +95,26 @@ class MNISTDataObject(object):
              (self.get_image('V')[0] /
              (1.0 * self.max_pixel_value))[subsample_inds]]
 
+    def load_source_data(self, symbol_labels):
+        # --- Mnist data ---
+        _, _, [images_data, images_labels] = \
+            mnist.read_file('mnist.pkl.gz', self.filepath)
+        images_labels = list(map(str, images_labels))
+
+        # --- Spaun symbol data ---
+        _, _, [symbol_data, _] = \
+            mnist.read_file('spaun_sym.pkl.gz', self.filepath)
+
+        # --- Combined image (mnist + spaun symbol) data ---
+        images_data = np.append(images_data, symbol_data, axis=0)
+        images_labels = np.append(images_labels, symbol_labels, axis=0)
+
+        sorted_labels = np.argsort(images_labels)
+        images_data = images_data[sorted_labels]
+        images_labels = images_labels[sorted_labels]
+
+        return images_data, images_labels
+
     def get_image(self, label=None, rng=None):
         if rng is None:
             rng = np.random.RandomState()
@@ -98,16 +134,17 @@ class MNISTDataObject(object):
             return (self.images_data[image_ind], image_ind)
 
     def get_image_label(self, index):
-        for label, indicies in enumerate(self.images_labels_inds):
-            if index in indicies:
-                return self.stim_SP_labels_full[label]
-        return -1
+        if index < 0 or index >= len(self.images_labels):
+            return -1
+        label = np.searchsorted(self.images_labels_starts, index,
+                                side='right') - 1
+        return self.stim_SP_labels_full[label]
 
     def get_image_ind(self, label, rng):
-        label_ind = np.where(self.images_labels_unique == label)
-        if label_ind[0].shape[0] > 0:
-            image_ind = rng.choice(
-                self.images_labels_inds[label_ind[0][0]])
+        label_ind = self.images_labels_class_inds.get(label)
+        if label_ind is not None:
+            indicies = self.images_labels_inds[label_ind]
+            image_ind = indicies[rng.randint(len(indicies))]
         else:
             raise RuntimeError('MNIST - Unable to find label matching ' +
                                '[%s] in label set.' % label)
@@ -5,6 +5,7 @@ from nengo.spa.module import Module
 from nengo.utils.network import with_self
 
 from ..configurator import cfg
+from ..profiler import profiler
 from ..vocabulator import vocab
 from ..experimenter import experiment
 from .stim import stim_data
@@ -24,8 +25,32 @@ def get_vocab(label=None):
     return (vocab.vis_main[str(label)].v, label)
 
 
-def stim_func_vis(t):
-    return get_image(experiment.get_stimulus(t))[0]
+def get_image_by_ind(image_ind):
+    # Returns the (flattened) stimulus image with the given index (a blank
+    # image if image_ind < 0)
+    if image_ind < 0:
+        return get_image()[0]
+    else:
+        return np.ravel(stim_data.images_data[image_ind])
+
+
+class StimulusImageFunc(object):
+    # Output function of the vision stimulus node. The stimulus images are
+    # looked up from the stimulus image schedule precompiled by the
+    # experiment, and only change at the stimulus presentation boundaries.
+    def __init__(self):
+        self.image_ind = None
+        self.image = None
+
+    def __call__(self, t):
+        image_ind = experiment.get_stimulus_image_ind(t)
+        if image_ind != self.image_ind:
+            self.image = get_image_by_ind(image_ind)
+            self.image_ind = image_ind
+        return self.image
+
+
+stim_func_vis = StimulusImageFunc()
 
 
 def stim_func_vocab(t):
@@ -48,8 +73,8 @@ class SpaunStimulus(Module):
                                         experiment.present_interval,
                                         experiment.present_blanks)
         else:
-            self.output = nengo.Node(output=stim_func_vis,
-                                     label='Stim Module Out')
+            self.output = profiler.make_node(output=stim_func_vis,
+                                             label='Stim Module Out')
 
             # Normalized output (output values range from 0 to 1)
             self.probe_output = \
@@ -85,14 +110,27 @@ class SpaunInstructionStimulus(Module):
                                                        add_to_container)
         self.init_module()
 
+    def make_instr_sp_vecs(self):
+        # Instruction SP vectors for each distinct instruction set in the
+        # experiment. The last row (zero vector) is used when there are no
+        # instructions (i.e. for an instruction set index of -1).
+        instr_sp_vecs = np.zeros((len(experiment.instr_sps_unique) + 1,
+                                  vocab.sp_dim))
+        for i, instr_sps in enumerate(experiment.instr_sps_unique):
+            instr_sp_vecs[i] = vocab.parse_instr_sps_list(instr_sps).v
+        return instr_sp_vecs
+
     def get_instr_sp_vec(self, t):
-        instr_sps = experiment.get_instruction_sps(t)
-        if instr_sps is not None:
-            return vocab.parse_instr_sps_list(instr_sps).v
-        else:
-            return vocab.main.parse('0').v
+        # Note: The instruction SP vectors are computed on the first call
+        #       after the experiment is initialized (the vocabulary is
+        #       initialized after the experiment).
+        if experiment.instr_sp_vecs is None:
+            experiment.instr_sp_vecs = self.make_instr_sp_vecs()
+        return experiment.instr_sp_vecs[
+            experiment.get_instruction_sps_ind(t)]
 
     @with_self
     def init_module(self):
         self.output = \
-            nengo.Node(output=self.get_instr_sp_vec)
+            profiler.make_node(output=self.get_instr_sp_vec,
+                               label='Instr Stim Module Out')
@@ -7,6 +7,7 @@ from nengo.utils.network import with_self
 
 from .._spa import Compare
 from ..configurator import cfg
+from ..profiler import profiler
 from ..vocabulator import vocab
 from ..utils import invol_matrix
 from .transform import Assoc_Mem_Transforms_Network
@@ -305,8 +306,10 @@ class TransformationSystemDummy(TransformationSystem):
                 return vocab.cmp.parse('NO_MATCH').v
 
         self.compare = \
-            nengo.Node(size_in=vocab.sp_dim * 2,
-                       output=lambda t, x: cmp_func(x, cmp_vocab=vocab))
+            profiler.make_node(
+                size_in=vocab.sp_dim * 2,
+                output=lambda t, x: cmp_func(x, cmp_vocab=vocab),
+                label='Trfm compare node')
 
         nengo.Connection(self.frm_mb2, self.compare[:vocab.sp_dim])
         nengo.Connection(self.frm_mb3, self.compare[vocab.sp_dim:])
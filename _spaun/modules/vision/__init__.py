@@ -1,7 +1,8 @@
 import importlib
 
 from ...configurator import cfg
+from ...utils import LazyDataObject
 vis_module = importlib.import_module('_spaun.modules.vision.' + cfg.vis_module)
-vis_data = vis_module.DataObject()
+vis_data = LazyDataObject(vis_module.DataObject)
 VisionNet = vis_module.VisionNet
 VisionNetClassifier = vis_module.VisionNetClassifier
@@ -8,6 +8,7 @@ from nengo.utils.network import with_self
 from .._networks import DetectChange
 
 from ..configurator import cfg
+from ..profiler import profiler
 from ..vocabulator import vocab
 from .stimulus import stim_func_vocab
 from .stim import stim_data
@@ -181,8 +182,8 @@ class VisionSystemDummy(VisionSystem):
         with nengo.Network(label="Dummy LIF Vision") as net:
             net.input = nengo.Node(size_in=stim_data.images_data_dimensions,
                                    label='Input')
-            net.output = nengo.Node(output=stim_func_vocab,
-                                    label='Dummy LIF Vision Out')
+            net.output = profiler.make_node(output=stim_func_vocab,
+                                            label='Dummy LIF Vision Out')
             net.raw_output = net.output
         return net
 
@@ -0,0 +1,192 @@
+import time
+import multiprocessing
+from collections import OrderedDict
+
+import numpy as np
+
+import nengo
+from nengo.builder import Builder
+from nengo.builder.connection import get_eval_points, get_targets, multiply
+from nengo.exceptions import BuildError
+from nengo.solvers import Solver
+
+# Note: The shared ensemble parameters builders have to be registered first,
+#       so that the parallel solver builder wraps them (and the decoder
+#       sharing is then done on the deferred solves).
+from . import shared_params  # noqa
+
+
+# Decoder solve jobs of the model being solved (inherited by the forked
+# worker processes, so that the connection functions do not have to be
+# pickled)
+_solve_jobs = []
+
+
+class DeferredSolves(object):
+    """Build state of the parallel decoder solving build mode.
+
+    In this build mode, the decoders of the decoded connections are not
+    solved as the connections are built. Instead, each connection gets a
+    (zero) placeholder weights array, and a solve job is recorded. Once the
+    top-level network has been built (and before the simulator signals are
+    created from the built model), all of the solve jobs (function
+    evaluation, activity matrix computation and least-squares solve) are run
+    in a pool of worker processes, and the solved decoders are written into
+    the placeholder weights arrays.
+
+    Solve jobs use a copy of the random state of their connection, and the
+    results are merged in build order, so the decoders are identical to the
+    ones solved serially.
+
+    Note: Solves in this build mode bypass the nengo decoder cache. Worker
+          processes are forked, so on platforms without the 'fork' start
+          method, the solve jobs are run serially. They are also run
+          serially when the model is built in a daemonic process (e.g. a
+          run_spaun.py --jobs batch worker), since daemonic processes can't
+          have child processes.
+    """
+    def __init__(self, n_jobs):
+        self.n_jobs = n_jobs
+
+        self.jobs = []
+        self.job_inds = {}
+        self.weights = []
+
+        self.times = OrderedDict([('targets', 0.0), ('activities', 0.0),
+                                  ('solve', 0.0)])
+        self.solve_time = 0.0
+
+    def add(self, model, conn, rng, transform):
+        built_ens = model.params[conn.pre_obj]
+
+        # Decoders are only solved once for connections sharing their
+        # decoders (see shared_params)
+        shared = getattr(model, 'shared_params', None)
+        key = (conn if shared is None else
+               shared.get_decoders_key(conn))
+        if shared is not None:
+            shared.n_solves += 1
+
+        if key in self.job_inds:
+            if shared is not None:
+                shared.n_shared_solves += 1
+            job_ind = self.job_inds[key]
+            eval_points = self.jobs[job_ind][1]
+        else:
+            eval_points = get_eval_points(model, conn, rng)
+            job_rng = np.random.RandomState()
+            job_rng.set_state(rng.get_state())
+
+            job_ind = len(self.jobs)
+            self.jobs.append((conn, eval_points, built_ens.encoders,
+                              built_ens.gain, built_ens.bias, job_rng))
+            self.job_inds[key] = job_ind
+
+        size_out = (transform.shape[0] if transform.ndim == 2 else
+                    conn.size_mid)
+        weights = np.zeros((size_out, conn.pre_obj.n_neurons))
+        solver_info = {}
+        self.weights.append((job_ind, weights, transform, solver_info))
+        return eval_points, weights, solver_info
+
+    def solve(self):
+        global _solve_jobs
+
+        timestamp = time.time()
+        n_procs = min(self.n_jobs, len(self.jobs))
+
+        _solve_jobs = self.jobs
+        try:
+            if n_procs > 1 and \
+               'fork' in multiprocessing.get_all_start_methods() and \
+               not multiprocessing.current_process().daemon:
+                pool = multiprocessing.get_context('fork').Pool(n_procs)
+                try:
+                    results = pool.map(solve_job, range(len(self.jobs)))
+                finally:
+                    pool.terminate()
+            else:
+                results = list(map(solve_job, range(len(self.jobs))))
+        finally:
+            _solve_jobs = []
+
+        for job_ind, weights, transform, solver_info in self.weights:
+            decoders, job_solver_info, _ = results[job_ind]
+            weights[...] = multiply(transform, decoders.T)
+            solver_info.update(job_solver_info)
+
+        for _, _, job_times in results:
+            for key, t in zip(self.times.keys(), job_times):
+                self.times[key] += t
+        self.solve_time += time.time() - timestamp
+
+        self.jobs = []
+        self.job_inds = {}
+        self.weights = []
+
+    def get_stats_str(self):
+        return ('%i processes, %0.2fs (cumulative worker times: %s)' %
+                (self.n_jobs, self.solve_time,
+                 ', '.join(['%s %0.2fs' % (key, t)
+                            for key, t in self.times.items()])))
+
+
+def solve_job(job_ind):
+    conn, eval_points, encoders, gain, bias, rng = _solve_jobs[job_ind]
+
+    timestamp = time.time()
+    targets = get_targets(conn, eval_points)
+    t_targets = time.time() - timestamp
+
+    timestamp = time.time()
+    x = np.dot(eval_points, encoders.T / conn.pre_obj.radius)
+    activities = conn.pre_obj.neuron_type.rates(x, gain, bias)
+    if np.count_nonzero(activities) == 0:
+        raise BuildError(
+            "Building %s: 'activities' matrix is all zero for %s. "
+            "This is because no evaluation points fall in the firing "
+            "ranges of any neurons." % (conn, conn.pre_obj))
+    t_activities = time.time() - timestamp
+
+    timestamp = time.time()
+    decoders, solver_info = conn.solver(activities, targets, rng=rng)
+    t_solve = time.time() - timestamp
+
+    return decoders, solver_info, (t_targets, t_activities, t_solve)
+
+
+def enable_parallel_solves(model, n_jobs):
+    """Enables the parallel decoder solving build mode (with `n_jobs` worker
+    processes) for a (not yet built) nengo builder model. Returns the
+    DeferredSolves build state of the model."""
+    model.deferred_solves = DeferredSolves(n_jobs)
+    return model.deferred_solves
+
+
+# ----- Builders -----
+# Note: As with the shared ensemble parameters builders, the network and
+#       solver builders are wrapped, and only differ from the wrapped builders
+#       for builder models with the parallel solving mode enabled.
+_build_network = Builder.builders[nengo.Network]
+_build_solver = Builder.builders[Solver]
+
+
+def build_network_deferred(model, network, *args, **kwargs):
+    deferred_solves = getattr(model, 'deferred_solves', None)
+    is_toplevel = model.toplevel is None
+
+    rval = _build_network(model, network, *args, **kwargs)
+    if deferred_solves is not None and is_toplevel:
+        deferred_solves.solve()
+    return rval
+
+
+def build_solver_deferred(model, solver, conn, rng, transform):
+    deferred_solves = getattr(model, 'deferred_solves', None)
+    if deferred_solves is None or solver.weights:
+        return _build_solver(model, solver, conn, rng, transform)
+    return deferred_solves.add(model, conn, rng, transform)
+
+
+Builder.builders[nengo.Network] = build_network_deferred
+Builder.builders[Solver] = build_solver_deferred
@@ -18,15 +18,17 @@ def idstr(p):
 
 
 class SpaunProbeConfig(object):
+    # Default sampling period (in seconds) of the value and image probes.
+    # None records the probed value every simulation timestep.
+    sample_every = None
+
     def __init__(self, spaun_model, spaun_vocab, dt, probe_data_dir,
                  probe_data_filename):
         # Probe config version number
-        self.version = 6.1
+        self.version = 6.3
 
         # File data names and locations
-        self.data_dir = probe_data_dir
-        self.data_filename = probe_data_filename
-        self.config_filename = probe_data_filename[:-4] + '_cfg.npz'
+        self.set_data_filename(probe_data_dir, probe_data_filename)
 
         # Probe config internal objects
         self.graph_list = []
@@ -43,9 +45,12 @@ class SpaunProbeConfig(object):
         # - next figure tags are '..'
 
         self.probe_list = []
+        self.probe_objs = {}
         self.label_dict = {}
         self.vocab_dict = {}
         self.ncount_dict = {}
+        self.neuron_inds_dict = {}
+        self.sample_every_dict = {}
         self.image_dict = {}
         self.path_dict = {}
         self.anim_config = []
@@ -56,24 +61,47 @@ class SpaunProbeConfig(object):
         self.v = spaun_vocab
         self.dt = dt
 
+        # Random number generator used to pick the neurons to record from in
+        # the spike probes (separate from cfg.rng so that the probes do not
+        # affect the construction of the model)
+        self.rng = np.random.RandomState(cfg.seed)
+
         # Initialize the probes (add to the spaun self.m, and fill in the
         # config lists), then write the probe configuration to file
         self.initialize_probes()
         self.write_config_to_file()
 
+    def set_data_filename(self, probe_data_dir, probe_data_filename):
+        self.data_dir = probe_data_dir
+        self.data_filename = probe_data_filename
+        self.config_filename = probe_data_filename[:-4] + '_cfg.npz'
+
+        # Chunked probe data store (see `write_simdata_chunk`)
+        self.chunk_dirname = probe_data_filename[:-4] + '_chunks'
+        self.chunk_filenames = []
+        self.chunk_step = 0
+
     def probe_null(self):
         return '!!'
 
-    def probe_value(self, probed_obj, synapse=0.005, vocab=None, label=None):
+    def probe_value(self, probed_obj, synapse=0.005, vocab=None, label=None,
+                    sample_every=None):
         if isinstance(probed_obj, str):
             probe_id = probed_obj[:-2]
         else:
+            if sample_every is None:
+                sample_every = self.sample_every
+
             with self.m:
-                probe = nengo.Probe(probed_obj, synapse=synapse)
+                probe = nengo.Probe(probed_obj, synapse=synapse,
+                                    sample_every=sample_every)
 
             probe_id = idstr(probe)
             if probe_id not in self.probe_list:
                 self.probe_list.append(probe_id)
+                self.probe_objs[probe_id] = probe
+            if sample_every is not None:
+                self.sample_every_dict[probe_id] = sample_every
 
         self.label_dict[probe_id] = label
 
@@ -92,19 +120,35 @@ class SpaunProbeConfig(object):
                                  'probe id string, but probed object ' +
                                  'is not a spike probe. Confused. Failing.')
         else:
+            # Only record from a random subset of n_neurons neurons (only
+            # n_neurons spike trains are displayed anyway)
+            total_n_neurons = probed_obj.neurons.size_out
+            if n_neurons is None or n_neurons >= total_n_neurons:
+                neuron_inds = np.arange(total_n_neurons)
+                probed_neurons = probed_obj.neurons
+            else:
+                neuron_inds = np.sort(self.rng.choice(total_n_neurons,
+                                                      n_neurons,
+                                                      replace=False))
+                probed_neurons = probed_obj.neurons[list(neuron_inds)]
+
             with self.m:
-                probe = nengo.Probe(probed_obj.neurons)
+                probe = nengo.Probe(probed_neurons)
 
             probe_id = idstr(probe)
             if probe_id not in self.probe_list:
                 self.probe_list.append(probe_id)
+                self.probe_objs[probe_id] = probe
+            self.neuron_inds_dict[probe_id] = neuron_inds
 
         self.ncount_dict[probe_id] = n_neurons
         self.label_dict[probe_id] = label
         return probe_id + 's.'
 
-    def probe_image(self, probed_obj, shape, synapse=None, label=None):
-        probe_id = self.probe_value(probed_obj, synapse, label=label)[:-2]
+    def probe_image(self, probed_obj, shape, synapse=None, label=None,
+                    sample_every=None):
+        probe_id = self.probe_value(probed_obj, synapse, label=label,
+                                    sample_every=sample_every)[:-2]
         self.image_dict[probe_id] = shape
         return probe_id + 'i.'
 
@@ -172,6 +216,8 @@ class SpaunProbeConfig(object):
         config_data = {'graph_list': self.graph_list, 'sp_dim': self.v.sp_dim,
                        'vocab_dict': self.vocab_dict, 'prim_vocab': self.v,
                        'ncount_dict': self.ncount_dict,
+                       'neuron_inds_dict': self.neuron_inds_dict,
+                       'sample_every_dict': self.sample_every_dict,
                        'anim_config': self.anim_config,
                        'image_dict': self.image_dict,
                        'path_dict': self.path_dict,
@@ -181,17 +227,56 @@ class SpaunProbeConfig(object):
         np.savez_compressed(os.path.join(self.data_dir, self.config_filename),
                             **config_data)
 
+    def write_simdata_chunk(self, sim):
+        """Appends the probe data recorded since the last chunk was written to
+        the chunked probe data store (one compressed npz file per chunk).
+
+        Note: The probe data is not removed from the simulator, since the
+              simulator data is shared by all of the probe configs. Call
+              `clear_sim_probe_data` once every probe config has written its
+              chunk.
+        """
+        n_steps = sim.n_steps
+        if n_steps <= self.chunk_step:
+            return
+
+        chunk_dir = os.path.join(self.data_dir, self.chunk_dirname)
+        if not os.path.isdir(chunk_dir):
+            os.makedirs(chunk_dir)
+
+        chunk_data = {'trange': sim.dt * np.arange(self.chunk_step + 1,
+                                                   n_steps + 1)}
+        for probe_id in self.probe_list:
+            chunk_data[probe_id] = sim.data[self.probe_objs[probe_id]]
+
+        chunk_filename = os.path.join(self.chunk_dirname, 'chunk%05i.npz' %
+                                      len(self.chunk_filenames))
+        np.savez_compressed(os.path.join(self.data_dir, chunk_filename),
+                            **chunk_data)
+        self.chunk_filenames.append(chunk_filename)
+        self.chunk_step = n_steps
+
     def write_simdata_to_file(self, sim, experiment):
         # Generic probe data (time and stimulus sequence)
-        probe_data = {'trange': sim.trange(),
-                      'stim_seq': experiment.stim_seq_list,
+        probe_data = {'stim_seq': experiment.stim_seq_list,
                       'present_interval': experiment.present_interval}
 
-        # Sort out the actual probes from sim
-        for probe in sim.data.keys():
-            if isinstance(probe, nengo.Probe) and \
-               idstr(probe) in self.probe_list:
-                probe_data[idstr(probe)] = sim.data[probe]
+        if len(self.chunk_filenames) > 0:
+            # Probe data has been written to the chunked probe data store.
+            # Write out the remaining probe data as the last chunk, and
+            # write the list of chunk files in place of the probe data.
+            self.write_simdata_chunk(sim)
+            probe_data['chunk_filenames'] = self.chunk_filenames
+        else:
+            probe_data['trange'] = sim.trange()
+
+            # Sort out the actual probes from sim
+            # Note: Probe ids are looked up through probe_objs (and not
+            #       generated from the probes in sim.data) so that they stay
+            #       valid for probe configs that have been loaded from the
+            #       model cache.
+            for probe_id in self.probe_list:
+                probe_data[probe_id] = sim.data[self.probe_objs[probe_id]]
         np.savez_compressed(os.path.join(self.data_dir,
                                          self.data_filename),
                             **probe_data)
@@ -202,6 +287,21 @@ class SpaunProbeConfig(object):
                            ' be implemented by SpaunProbeConfig subclasses.')
 
 
+def clear_sim_probe_data(sim):
+    """Removes the recorded probe data from the simulator (so that the memory
+    used by the probe data does not grow with the simulation run time)."""
+    if hasattr(sim, 'clear_probes'):
+        sim.clear_probes()
+        return
+
+    for probe in sim.model.probes:
+        del sim._probe_outputs[probe][:]
+    # The simulator data caches the probe data arrays by length, so the cache
+    # has to be cleared as well
+    if hasattr(sim.data, 'reset'):
+        sim.data.reset()
+
+
 class ProbeCfgVisOnly(SpaunProbeConfig):
     def initialize_probes(self):
         p0 = self.probe_image(self.m.stim.probe_output, synapse=None,
@@ -313,6 +413,8 @@ class ProbeCfgAnimDefault(SpaunProbeConfig):
 
 
 class ProbeCfgDefault(SpaunProbeConfig):
+    sample_every = 0.005
+
     def initialize_probes(self):
         # ===================== MAKE DISPLAY VOCABS ===========================
         sub_vocab1 = self.v.enum.create_subset(['POS1*ONE', 'POS2*TWO',
@@ -1481,6 +1583,8 @@ class ProbeCfgDarpaImagenetAdaptMotor(SpaunProbeConfig):
 
 
 class ProbeCfgVisMtrMemSpikes(SpaunProbeConfig):
+    sample_every = 0.005
+
     def initialize_probes(self):
         p0 = self.probe_image(self.m.stim.probe_output, synapse=None,
                               shape=stim_data.probe_image_shape)
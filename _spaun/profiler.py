@@ -0,0 +1,363 @@
+import sys
+import json
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import wraps
+
+import nengo
+from nengo.builder import Model
+
+
+class TimedDecoderCache(object):
+    """Decoder cache wrapper that records the time spent solving decoders.
+
+    All decoder cache functionality is passed through to the wrapped decoder
+    cache. Solve times are attributed to the object currently being built by
+    the `ProfiledModel` that owns the cache.
+    """
+    def __init__(self, decoder_cache, profiler):
+        self.decoder_cache = decoder_cache
+        self.profiler = profiler
+
+    def __getattr__(self, name):
+        return getattr(self.decoder_cache, name)
+
+    def __enter__(self):
+        self.decoder_cache.__enter__()
+        return self
+
+    def __exit__(self, *args):
+        return self.decoder_cache.__exit__(*args)
+
+    def wrap_solver(self, solver_fn):
+        cached_solver_fn = self.decoder_cache.wrap_solver(solver_fn)
+
+        @wraps(cached_solver_fn)
+        def timed_solver_fn(*args, **kwargs):
+            timestamp = time.time()
+            rval = cached_solver_fn(*args, **kwargs)
+            self.profiler.add_solve_time(time.time() - timestamp)
+            return rval
+        return timed_solver_fn
+
+
+class ProfiledModel(Model):
+    """Nengo builder model that records the build time, number of operators
+    and signal bytes of every ensemble, node, connection and probe built."""
+    profiled_types = (nengo.Ensemble, nengo.Node, nengo.Connection,
+                      nengo.Probe)
+
+    def __init__(self, profiler, dt=0.001, label=None, decoder_cache=None):
+        if decoder_cache is None:
+            from nengo.cache import get_default_decoder_cache
+            decoder_cache = get_default_decoder_cache()
+
+        super(ProfiledModel, self).__init__(
+            dt=dt, label=label,
+            decoder_cache=TimedDecoderCache(decoder_cache, profiler))
+        self.profiler = profiler
+
+    def build(self, obj, *args, **kwargs):
+        if not isinstance(obj, self.profiled_types) or \
+           self.profiler.build_obj is not None:
+            return super(ProfiledModel, self).build(obj, *args, **kwargs)
+
+        self.profiler.build_obj = obj
+        n_ops = len(self.operators)
+        timestamp = time.time()
+        try:
+            return super(ProfiledModel, self).build(obj, *args, **kwargs)
+        finally:
+            self.profiler.build_times[obj] = time.time() - timestamp
+            self.profiler.build_n_ops[obj] = len(self.operators) - n_ops
+            self.profiler.build_obj = None
+
+
+class TimedNodeOutput(object):
+    """Node output function wrapper that records the number of calls and the
+    time spent in the wrapped function (under the node timing key `key`)
+    while node timing is enabled."""
+    def __init__(self, output, key):
+        self.output = output
+        self.key = key
+
+    def __call__(self, *args):
+        if not profiler.node_timing:
+            return self.output(*args)
+
+        timestamp = time.time()
+        try:
+            return self.output(*args)
+        finally:
+            profiler.add_node_time(self.key, time.time() - timestamp)
+
+
+class SpaunProfiler(object):
+    def __init__(self):
+        self.enabled = False
+
+        # Python node (output function) timing. Only nodes created with
+        # `make_node` while node timing is enabled are timed.
+        self.node_timing = False
+        self.node_times = {}
+
+        # Types of the networks constructed through `profile_construction`
+        # (Selectors, associative memories, memory blocks, etc.)
+        self.profiled_net_types = {}
+
+        self.construct_times = OrderedDict()
+        self.build_times = {}
+        self.build_n_ops = {}
+        self.solve_times = {}
+
+        self.build_obj = None
+
+    def reset(self):
+        self.profiled_net_types.clear()
+        self.construct_times.clear()
+        self.build_times.clear()
+        self.build_n_ops.clear()
+        self.solve_times.clear()
+        self.build_obj = None
+
+    def reset_node_times(self):
+        self.node_times.clear()
+
+    def add_node_time(self, key, t):
+        n_calls, t_total = self.node_times.get(key, (0, 0))
+        self.node_times[key] = (n_calls + 1, t_total + t)
+
+    def add_construct_time(self, key, t):
+        self.construct_times[key] = self.construct_times.get(key, 0) + t
+
+    def add_solve_time(self, t):
+        if self.build_obj is not None:
+            self.solve_times[self.build_obj] = \
+                self.solve_times.get(self.build_obj, 0) + t
+
+    @contextmanager
+    def construct_timer(self, key):
+        """Context manager to record the construction time of the top-level
+        Spaun module `key`. Construction times are accumulated, so that the
+        time spent in the `setup_connections` of the module can be included
+        as well."""
+        timestamp = time.time()
+        yield
+        if self.enabled:
+            self.add_construct_time(key, time.time() - timestamp)
+
+    def profile_construction(self, net_type):
+        """Decorator to record the construction time of the network returned
+        by a network constructor (factory) function."""
+        def decorator(func):
+            @wraps(func)
+            def profiled_func(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+
+                timestamp = time.time()
+                net = func(*args, **kwargs)
+                self.add_construct_time(net, time.time() - timestamp)
+                self.profiled_net_types[net] = net_type
+                return net
+            return profiled_func
+        return decorator
+
+    def make_node(self, output=None, label=None, **node_kwargs):
+        """Creates a nengo.Node. If node timing is enabled, the node output
+        function (if any) is wrapped so that its number of calls and run
+        time are recorded under the node label (or the function name, if the
+        node has no label). Nodes with the same label are timed together."""
+        if self.node_timing and callable(output):
+            key = label if label is not None else \
+                getattr(output, '__name__', str(output))
+            output = TimedNodeOutput(output, key)
+        return nengo.Node(output=output, label=label, **node_kwargs)
+
+    def get_node_times_str(self, t_run=None):
+        """Returns the node timing data as a table (slowest node first).
+        If `t_run` (the wall time of the simulation run) is given, the
+        fraction of the run time spent in each node is included."""
+        header = '%-40s | %10s | %10s | %12s | %7s' % (
+            'node', 'calls', 'total(s)', 'per call(us)', '% run')
+        lines = [header, '-' * len(header)]
+
+        t_nodes = 0
+        for key, (n_calls, t_total) in sorted(self.node_times.items(),
+                                              key=lambda kv: -kv[1][1]):
+            t_nodes += t_total
+            lines.append('%-40s | %10i | %10.3f | %12.2f | %7s' % (
+                str(key)[:40], n_calls, t_total, t_total / n_calls * 1e6,
+                '-' if not t_run else '%0.2f' % (t_total / t_run * 100)))
+
+        lines.append('-' * len(header))
+        if t_run:
+            lines.append('Total node time: %0.3fs of %0.3fs run time '
+                         '(%0.2f%%)' % (t_nodes, t_run, t_nodes / t_run * 100))
+        else:
+            lines.append('Total node time: %0.3fs' % t_nodes)
+        return '\n'.join(lines)
+
+    def write_node_times(self, filename, t_run=None):
+        with open(filename, 'w') as f:
+            f.write(self.get_node_times_str(t_run) + '\n')
+
+    def make_builder_model(self, dt, label=None):
+        return ProfiledModel(self, dt=dt, label=label)
+
+    def get_net_stats(self, sim_model, net):
+        stats = OrderedDict()
+
+        stats['n_neurons'] = sum([e.n_neurons for e in net.all_ensembles])
+        stats['n_ensembles'] = len(net.all_ensembles)
+        stats['n_nodes'] = len(net.all_nodes)
+        stats['n_connections'] = len(net.all_connections)
+        stats['n_probes'] = len(net.all_probes)
+
+        objs = (net.all_ensembles + net.all_nodes + net.all_connections +
+                net.all_probes)
+        stats['build_time'] = sum([self.build_times.get(obj, 0)
+                                   for obj in objs])
+        stats['decoder_solve_time'] = sum([self.solve_times.get(obj, 0)
+                                           for obj in objs])
+        stats['n_operators'] = sum([self.build_n_ops.get(obj, 0)
+                                    for obj in objs])
+
+        # Bytes used by the simulator signals & the built ensemble and
+        # connection parameters (eval points, gains, biases, decoders, ...)
+        signal_bytes = 0
+        param_bytes = 0
+        for obj in objs:
+            for sig in sim_model.sig.get(obj, {}).values():
+                signal_bytes += getattr(sig, 'nbytes', 0)
+            if obj in sim_model.params:
+                built_params = sim_model.params[obj]
+                for attr in ['eval_points', 'encoders', 'gain', 'bias',
+                             'scaled_encoders', 'weights']:
+                    param_value = getattr(built_params, attr, None)
+                    param_bytes += getattr(param_value, 'nbytes', 0)
+        stats['signal_bytes'] = signal_bytes
+        stats['param_bytes'] = param_bytes
+
+        return stats
+
+    def get_profile_data(self, model, sim_model, module_names):
+        profile_data = OrderedDict()
+
+        profile_data['total'] = self.get_net_stats(sim_model, model)
+        profile_data['total']['construct_time'] = \
+            sum([self.construct_times.get(name, 0) for name in module_names])
+        profile_data['total']['max_rss_bytes'] = get_max_rss_bytes()
+
+        profile_data['modules'] = OrderedDict()
+        for name in module_names:
+            if not hasattr(model, name):
+                continue
+            module = getattr(model, name)
+
+            module_data = OrderedDict()
+            module_data['label'] = module.label
+            module_data['construct_time'] = self.construct_times.get(name, 0)
+            module_data.update(self.get_net_stats(sim_model, module))
+
+            # Sub-networks (sorted by build time, slowest first)
+            subnet_data_list = []
+            for net in module.all_networks:
+                if net not in self.profiled_net_types:
+                    continue
+                subnet_data = OrderedDict()
+                subnet_data['label'] = net.label
+                subnet_data['type'] = self.profiled_net_types[net]
+                subnet_data['construct_time'] = self.construct_times[net]
+                subnet_data.update(self.get_net_stats(sim_model, net))
+                subnet_data_list.append(subnet_data)
+            module_data['subnetworks'] = \
+                sorted(subnet_data_list, key=lambda d: -d['build_time'])
+
+            profile_data['modules'][name] = module_data
+
+        return profile_data
+
+    def write_profile_data(self, filename, model, sim_model, module_names):
+        with open(filename, 'w') as f:
+            json.dump(self.get_profile_data(model, sim_model, module_names),
+                      f, indent=2)
+
+
+class RunTelemetry(object):
+    """Records the progress of a (chunked) simulation run: the simulation
+    time, wall time, realtime factor (simulated seconds per wall clock
+    second) of the last chunk, process RSS and current experiment task
+    after each chunk, as rows of a CSV file.
+
+    filename string: CSV file to write the telemetry data to
+    runtime float: total simulation time of the run (for the ETA)
+    print_eta bool: print the run progress (and ETA) after each chunk
+    """
+    columns = ['sim_time', 'wall_time', 'chunk_wall_time', 'realtime_factor',
+               'rss_mb', 'task']
+
+    def __init__(self, filename, runtime, print_eta=False):
+        self.filename = filename
+        self.runtime = runtime
+        self.print_eta = print_eta
+
+        self.data_obj = open(filename, 'w')
+        self.data_obj.write(','.join(self.columns) + '\n')
+        self.start()
+
+    def start(self):
+        self.t_start = time.time()
+        self.t_prev = self.t_start
+        self.t_sim_prev = 0.0
+
+    def record(self, t_sim, task=''):
+        timestamp = time.time()
+        t_wall = timestamp - self.t_start
+        t_chunk = timestamp - self.t_prev
+        rt_factor = (t_sim - self.t_sim_prev) / max(t_chunk, 1e-9)
+        self.t_prev = timestamp
+        self.t_sim_prev = t_sim
+
+        self.data_obj.write('%g,%0.3f,%0.3f,%0.4f,%0.1f,%s\n' % (
+            t_sim, t_wall, t_chunk, rt_factor, get_rss_bytes() / 1024.0 ** 2,
+            task))
+        self.data_obj.flush()
+
+        if self.print_eta:
+            # ETA from the average realtime factor of the run so far
+            t_eta = max(self.runtime - t_sim, 0) * t_wall / max(t_sim, 1e-9)
+            print(">>> SIM TIME: %0.3f / %0.3fs (%0.1f%%) - RT FACTOR: %0.4f "
+                  "- ETA: %0.1fs" % (t_sim, self.runtime,
+                                     t_sim / self.runtime * 100, rt_factor,
+                                     t_eta))
+
+    def close(self):
+        self.data_obj.close()
+
+
+def get_rss_bytes():
+    # Current (not peak) resident set size of the process. Only available on
+    # linux (/proc); the peak RSS is returned on other platforms.
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            rss_pages = int(f.read().split()[1])
+    except (IOError, OSError, IndexError, ValueError):
+        return get_max_rss_bytes()
+
+    import resource
+    return rss_pages * resource.getpagesize()
+
+
+def get_max_rss_bytes():
+    try:
+        import resource
+    except ImportError:
+        return -1
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in kilobytes on linux, and bytes on OSX
+    return max_rss if sys.platform == 'darwin' else max_rss * 1024
+
+profiler = SpaunProfiler()
@@ -0,0 +1,145 @@
+import numpy as np
+
+import nengo
+from nengo.builder import Builder
+from nengo.builder.connection import multiply
+from nengo.params import iter_params
+from nengo.solvers import Solver
+
+
+class SharedEnsembleParams(object):
+    """Build state of the shared ensemble parameters build mode.
+
+    In this build mode, (unseeded) ensembles with the same parameter
+    signature (number of neurons, dimensionality, radius, neuron type, and
+    encoder, intercept, max rate and evaluation point distributions) are built
+    with the same seed, and so reuse one set of sampled encoders, gains,
+    biases and evaluation points. Decoded connections from these ensembles
+    with the same function, evaluation points and solver then reuse one set
+    of solved decoders.
+
+    Note: All ensembles sharing a parameter signature have identical tuning
+          curves, which reduces the neural heterogeneity of the model.
+    """
+    def __init__(self):
+        self.ens_keys = {}
+        self.ens_seeds = {}
+        self.decoders = {}
+
+        self.n_ensembles = 0
+        self.n_shared_ensembles = 0
+        self.n_solves = 0
+        self.n_shared_solves = 0
+
+    def share_ensemble(self, model, ens):
+        key = get_ensemble_key(ens)
+        if key is None:
+            return
+
+        self.n_ensembles += 1
+        if key in self.ens_seeds:
+            model.seeds[ens] = self.ens_seeds[key]
+            self.n_shared_ensembles += 1
+        else:
+            self.ens_seeds[key] = model.seeds[ens]
+        self.ens_keys[ens] = key
+
+    def get_decoders_key(self, conn):
+        pre_key = self.ens_keys.get(conn.pre_obj, ('id', id(conn.pre_obj)))
+        return (pre_key, get_value_key(conn.pre_slice),
+                get_function_key(conn.function),
+                get_value_key(conn.eval_points), conn.scale_eval_points,
+                conn.solver)
+
+    def clear(self):
+        # Releases the build state (the statistics are kept)
+        self.ens_keys.clear()
+        self.ens_seeds.clear()
+        self.decoders.clear()
+
+    def get_stats_str(self):
+        return ('%i of %i ensembles, %i of %i decoder solves shared' %
+                (self.n_shared_ensembles, self.n_ensembles,
+                 self.n_shared_solves, self.n_solves))
+
+
+def get_value_key(value):
+    # Hashable key of a parameter value (ensemble parameter values are
+    # mostly hashable nengo objects: distributions, neuron types, processes)
+    if isinstance(value, np.ndarray):
+        return ('ndarray', value.shape, value.dtype.str, value.tobytes())
+    if isinstance(value, slice):
+        return ('slice', value.start, value.stop, value.step)
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__,) + tuple(map(get_value_key, value))
+    try:
+        hash(value)
+    except TypeError:
+        return ('id', id(value))
+    return value
+
+
+def get_function_key(func):
+    # Functions created by the same code (e.g. the same lambda in a loop),
+    # with the same default argument and closure values are considered equal
+    code = getattr(func, '__code__', None)
+    if code is None:
+        return get_value_key(func)
+
+    closure = [cell.cell_contents for cell in (func.__closure__ or [])]
+    return ('function', code, get_value_key(func.__defaults__),
+            get_value_key(closure))
+
+
+def get_ensemble_key(ens):
+    # Ensembles with an explicitly set seed are never shared
+    if ens.seed is not None:
+        return None
+    return tuple([(name, get_value_key(getattr(ens, name)))
+                  for name in sorted(iter_params(ens)) if name != 'label'])
+
+
+def enable_shared_params(model):
+    """Enables the shared ensemble parameters build mode for a (not yet
+    built) nengo builder model. Returns the SharedEnsembleParams build state
+    of the model."""
+    model.shared_params = SharedEnsembleParams()
+    return model.shared_params
+
+
+# ----- Builders -----
+# Note: The nengo ensemble and solver builders are wrapped (and not
+#       overwritten with Builder.register, which warns), and only differ from
+#       them for builder models with the shared parameters mode enabled.
+_build_ensemble = Builder.builders[nengo.Ensemble]
+_build_solver = Builder.builders[Solver]
+
+
+def build_shared_ensemble(model, ens):
+    shared_params = getattr(model, 'shared_params', None)
+    if shared_params is not None:
+        shared_params.share_ensemble(model, ens)
+    return _build_ensemble(model, ens)
+
+
+def build_shared_solver(model, solver, conn, rng, transform):
+    shared_params = getattr(model, 'shared_params', None)
+    if shared_params is None or solver.weights:
+        return _build_solver(model, solver, conn, rng, transform)
+
+    # Decoders are solved (and stored) without the connection transform, so
+    # that connections with different transforms can share them
+    shared_params.n_solves += 1
+    key = shared_params.get_decoders_key(conn)
+    if key in shared_params.decoders:
+        shared_params.n_shared_solves += 1
+    else:
+        shared_params.decoders[key] = _build_solver(
+            model, solver, conn, rng, np.array(1.0))
+
+    eval_points, decoders, solver_info = shared_params.decoders[key]
+    return eval_points, multiply(transform, decoders), solver_info
+
+
+Builder.builders[nengo.Ensemble] = build_shared_ensemble
+Builder.builders[Solver] = build_shared_solver
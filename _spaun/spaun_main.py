@@ -5,6 +5,7 @@ from nengo import spa
 from .configurator import cfg
 from .vocabulator import vocab
 from .loggerator import logger
+from .profiler import profiler
 from .modules import Stimulus, Vision, ProdSys, RewardEval, InfoEnc
 from .modules import TrfmSys, Memory, Monitor, InfoDec, Motor
 from .modules import InstrStimulus, InstrProcess
@@ -16,6 +17,27 @@ from .modules import InstrStimulus, InstrProcess
 # from _spaun.modules.transform_system import TransformationSystemDummy as TrfmSys  # noqa
 # from _spaun.modules.motor_system import MotorSystemDummy as Motor
 
+# Attribute names of the top-level Spaun modules (in construction order)
+spaun_module_names = ['stim', 'instr_stim', 'monitor', 'vis', 'ps', 'reward',
+                      'enc', 'mem', 'trfm', 'dec', 'mtr', 'instr', 'bg',
+                      'thal']
+
+# Spaun tasks (groups of basal ganglia actions), and the Spaun modules (see
+# cfg.spaun_modules) needed by each task in addition to the modules used by
+# all tasks (spaun_base_modules)
+spaun_base_modules = 'SVPEWTDM'
+spaun_task_modules = {'copy_draw': '', 'recog': '', 'learn': 'R', 'mem': '',
+                      'count': '', 'qa': '', 'rvc': '', 'fi': '', 'react': '',
+                      'match': '', 'instr': 'I'}
+
+
+def get_task_modules(tasks, modules):
+    """Returns the subset of the Spaun modules `modules` (in the
+    cfg.spaun_modules format) needed by the tasks `tasks`."""
+    task_modules = spaun_base_modules + \
+        ''.join([spaun_task_modules[task] for task in tasks])
+    return ''.join([m for m in modules if m in task_modules])
+
 
 def Spaun():
     model = spa.SPA(label='Spaun', seed=cfg.seed)
@@ -25,27 +47,39 @@ def Spaun():
         model.config[nengo.Connection].synapse = cfg.pstc
 
         if 'S' in cfg.spaun_modules:
-            model.stim = Stimulus()
-            model.instr_stim = InstrStimulus()
-            model.monitor = Monitor()
+            with profiler.construct_timer('stim'):
+                model.stim = Stimulus()
+            with profiler.construct_timer('instr_stim'):
+                model.instr_stim = InstrStimulus()
+            with profiler.construct_timer('monitor'):
+                model.monitor = Monitor()
         if 'V' in cfg.spaun_modules:
-            model.vis = Vision()
+            with profiler.construct_timer('vis'):
+                model.vis = Vision()
         if 'P' in cfg.spaun_modules:
-            model.ps = ProdSys()
+            with profiler.construct_timer('ps'):
+                model.ps = ProdSys()
         if 'R' in cfg.spaun_modules:
-            model.reward = RewardEval()
+            with profiler.construct_timer('reward'):
+                model.reward = RewardEval()
         if 'E' in cfg.spaun_modules:
-            model.enc = InfoEnc()
+            with profiler.construct_timer('enc'):
+                model.enc = InfoEnc()
         if 'W' in cfg.spaun_modules:
-            model.mem = Memory()
+            with profiler.construct_timer('mem'):
+                model.mem = Memory()
         if 'T' in cfg.spaun_modules:
-            model.trfm = TrfmSys()
+            with profiler.construct_timer('trfm'):
+                model.trfm = TrfmSys()
         if 'D' in cfg.spaun_modules:
-            model.dec = InfoDec()
+            with profiler.construct_timer('dec'):
+                model.dec = InfoDec()
         if 'M' in cfg.spaun_modules:
-            model.mtr = Motor()
+            with profiler.construct_timer('mtr'):
+                model.mtr = Motor()
         if 'I' in cfg.spaun_modules:
-            model.instr = InstrProcess()
+            with profiler.construct_timer('instr'):
+                model.instr = InstrProcess()
 
         model.learn_conns = []
 
@@ -155,6 +189,20 @@ def Spaun():
             default_action = \
                 []
 
+            # Remove the actions of the tasks not in cfg.spaun_tasks
+            if cfg.spaun_tasks is not None:
+                for task, task_action in [
+                        ('learn', learn_action),
+                        ('learn', learn_state_action),
+                        ('copy_draw', copy_draw_action),
+                        ('recog', recog_action), ('mem', mem_action),
+                        ('count', count_action), ('qa', qa_action),
+                        ('rvc', rvc_action), ('fi', fi_action),
+                        ('react', react_action), ('match', match_action),
+                        ('instr', instr_action)]:
+                    if task not in cfg.spaun_tasks:
+                        del task_action[:]
+
             # List learning task spa actions first, so we know the precise
             # indicies of the learning task actions (i.e. the first N)
             all_actions = (learn_action + learn_state_action +
@@ -164,17 +212,22 @@ def Spaun():
                            instr_action + match_action)
 
             actions = spa.Actions(*all_actions)
-            model.bg = spa.BasalGanglia(actions=actions, input_synapse=0.008,
-                                        label='Basal Ganglia')
-            model.thal = spa.Thalamus(model.bg, subdim_channel=1,
-                                      mutual_inhibit=1, route_inhibit=5.0,
-                                      label='Thalamus')
+            with profiler.construct_timer('bg'):
+                model.bg = spa.BasalGanglia(actions=actions,
+                                            input_synapse=0.008,
+                                            label='Basal Ganglia')
+            with profiler.construct_timer('thal'):
+                model.thal = spa.Thalamus(model.bg, subdim_channel=1,
+                                          mutual_inhibit=1, route_inhibit=5.0,
+                                          label='Thalamus')
 
         # ----- Set up connections (and save record of modules) -----
         if hasattr(model, 'vis'):
-            model.vis.setup_connections(model)
+            with profiler.construct_timer('vis'):
+                model.vis.setup_connections(model)
         if hasattr(model, 'ps'):
-            model.ps.setup_connections(model)
+            with profiler.construct_timer('ps'):
+                model.ps.setup_connections(model)
             # Modify any 'channel' ensemble arrays to have
             # get_optimal_sp_radius radius sizes
             for net in model.ps.all_networks:
@@ -207,13 +260,17 @@ def Spaun():
         if hasattr(model, 'thal'):
             pass
         if hasattr(model, 'reward'):
-            model.reward.setup_connections(model, model.learn_conns)
+            with profiler.construct_timer('reward'):
+                model.reward.setup_connections(model, model.learn_conns)
         if hasattr(model, 'enc'):
-            model.enc.setup_connections(model)
+            with profiler.construct_timer('enc'):
+                model.enc.setup_connections(model)
         if hasattr(model, 'mem'):
-            model.mem.setup_connections(model)
+            with profiler.construct_timer('mem'):
+                model.mem.setup_connections(model)
         if hasattr(model, 'trfm'):
-            model.trfm.setup_connections(model)
+            with profiler.construct_timer('trfm'):
+                model.trfm.setup_connections(model)
             # Modify any 'channel' ensemble arrays to have
             # get_optimal_sp_radius radius sizes
             for net in model.trfm.all_networks:
@@ -221,12 +278,16 @@ def Spaun():
                     for ens in net.all_ensembles:
                         ens.radius = cfg.get_optimal_sp_radius()
         if hasattr(model, 'dec'):
-            model.dec.setup_connections(model)
+            with profiler.construct_timer('dec'):
+                model.dec.setup_connections(model)
         if hasattr(model, 'mtr'):
-            model.mtr.setup_connections(model)
+            with profiler.construct_timer('mtr'):
+                model.mtr.setup_connections(model)
         if hasattr(model, 'instr'):
-            model.instr.setup_connections(model)
+            with profiler.construct_timer('instr'):
+                model.instr.setup_connections(model)
         if hasattr(model, 'monitor'):
-            model.monitor.setup_connections(model)
+            with profiler.construct_timer('monitor'):
+                model.monitor.setup_connections(model)
 
     return model
@@ -60,3 +60,29 @@ def get_probe_data_filename(label='probe_data', suffix='', ext='npz'):
                      raw_seq[:150],
                      str(cfg.seed)]) + \
            ("" if suffix is '' else '(' + suffix + ')') + "." + ext
+
+
+class LazyDataObject(object):
+    """Proxy for a stimulus, vision or motor data object.
+
+    The data object (which loads the datasets or network parameters) is only
+    created when one of its attributes is first accessed, so that importing
+    the Spaun modules does not load any data.
+    """
+    def __init__(self, data_object_class, *args, **kwargs):
+        self.__dict__['_data_object_args'] = (data_object_class, args, kwargs)
+        self.__dict__['_data_object'] = None
+
+    def get_data_object(self):
+        if self._data_object is None:
+            data_object_class, args, kwargs = self._data_object_args
+            self.__dict__['_data_object'] = data_object_class(*args, **kwargs)
+        return self._data_object
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return getattr(self.get_data_object(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self.get_data_object(), name, value)
@@ -0,0 +1,107 @@
+"""Benchmark of the numpy three-link arm integrators.
+
+Drives the compiled MapleSim arm simulation (py3LinkArm dll) and the numpy
+arm simulation (the `mtr_arm_integrator` config) with the same (random)
+torques, for each of the numpy integrators and number of integration steps
+per timestep (the `mtr_arm_substeps` config). Reports the number of arm steps
+(Spaun simulation timesteps) per second, and the RMS and maximum differences
+between the joint angles and end-effector positions of the numpy arm and the
+compiled arm over the run. Runs whose maximum end-effector difference exceeds
+`--tol` are flagged.
+
+Note: The MapleSim arm is only run if the py3LinkArm dll can be imported
+      (see the README.txt in _spaun/arms/three_link). Without it, the numpy
+      integrators are compared against the rk4 integrator run with 1e-5s
+      integration steps.
+
+Usage: python benchmarks/bench_arm_integrators.py [--steps 2000] [--tol 1e-3]
+"""
+from __future__ import print_function
+
+import os
+import sys
+import time
+import argparse
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..'))
+from _spaun.arms.three_link import Arm  # noqa
+from _spaun.arms.three_link import arm as arm_module  # noqa
+
+
+def run_benchmark(torques, dt, **arm_kwargs):
+    arm = Arm(**arm_kwargs)
+
+    qs = []
+    ees = []
+    timestamp = time.time()
+    for u in torques:
+        arm.apply_torque(u, dt)
+        qs.append(arm.q)
+        ees.append(arm.x)
+    t_run = time.time() - timestamp
+
+    return len(torques) / t_run, np.array(qs), np.array(ees)
+
+
+parser = argparse.ArgumentParser(
+    description='Benchmark of the numpy three-link arm integrators.')
+parser.add_argument(
+    '--steps', type=int, default=2000,
+    help='Number of arm steps (simulation timesteps) to run.')
+parser.add_argument(
+    '--dt', type=float, default=0.001,
+    help='Simulation timestep.')
+parser.add_argument(
+    '--euler_substeps', type=int, nargs='*', default=[100, 50, 20],
+    help='Numbers of integration steps per timestep for the ' +
+         'semi_implicit_euler integrator.')
+parser.add_argument(
+    '--rk4_substeps', type=int, nargs='*', default=[10, 4, 2, 1],
+    help='Numbers of integration steps per timestep for the rk4 integrator.')
+parser.add_argument(
+    '--tol', type=float, default=1e-3,
+    help='Tolerance on the maximum end-effector position difference.')
+parser.add_argument(
+    '--seed', type=int, default=1,
+    help='Random seed.')
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+
+    torques = np.random.RandomState(args.seed).uniform(
+        -1, 1, size=(args.steps, 3))
+
+    if arm_module.py3LinkArm is not None:
+        ref_name = 'maplesim'
+        ref_rate, ref_q, ref_ee = run_benchmark(torques, args.dt)
+    else:
+        ref_name = 'rk4 (1e-5s)'
+        ref_rate, ref_q, ref_ee = run_benchmark(
+            torques, args.dt, integrator='rk4',
+            n_substeps=int(np.ceil(args.dt / 1e-5)))
+
+    print('%i arm steps, dt=%g, reference: %s' %
+          (args.steps, args.dt, ref_name))
+    header = '%-20s | %8s | %10s | %9s | %9s | %9s | %9s | %4s' % (
+        'integrator', 'substeps', 'steps/s', 'rms q', 'max q', 'rms ee',
+        'max ee', 'ok')
+    print(header)
+    print('-' * len(header))
+    print('%-20s | %8i | %10.1f | %9s | %9s | %9s | %9s | %4s' %
+          (ref_name, int(np.ceil(args.dt / 1e-5)), ref_rate,
+           '-', '-', '-', '-', '-'))
+
+    runs = ([('semi_implicit_euler', n) for n in args.euler_substeps] +
+            [('rk4', n) for n in args.rk4_substeps])
+    for integrator, n_substeps in runs:
+        rate, q, ee = run_benchmark(torques, args.dt, integrator=integrator,
+                                    n_substeps=n_substeps)
+        q_err = abs(q - ref_q)
+        ee_err = np.sqrt(np.sum((ee - ref_ee) ** 2, axis=1))
+        print('%-20s | %8i | %10.1f | %9.2e | %9.2e | %9.2e | %9.2e | %4s' %
+              (integrator, n_substeps, rate, np.sqrt(np.mean(q_err ** 2)),
+               np.max(q_err), np.sqrt(np.mean(ee_err ** 2)), np.max(ee_err),
+               'yes' if np.max(ee_err) <= args.tol else 'NO'))
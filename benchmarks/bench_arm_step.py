@@ -0,0 +1,80 @@
+"""Microbenchmark of the three-link arm simulation step.
+
+Compares the number of arm steps (Spaun simulation timesteps, i.e. calls of
+`Arm3Link.apply_torque`) per second when the arm simulation substeps (1e-5s
+each) are run with one `py3LinkArm.pySim.step` call per substep from Python
+(the original implementation) against one `pySim.step_n` call per timestep.
+Both arms are driven with the same (random) torques, and the maximum
+difference between their final joint angles and velocities is reported as a
+sanity check.
+
+Note: Requires a py3LinkArm dll compiled with step_n (see the README.txt in
+      _spaun/arms/three_link).
+
+Usage: python benchmarks/bench_arm_step.py [--steps 2000] [--dt 0.001]
+"""
+from __future__ import print_function
+
+import os
+import sys
+import time
+import argparse
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..'))
+from _spaun.arms.three_link import Arm  # noqa
+
+
+def apply_torque_loop(arm, u, dt):
+    # Original Arm3Link.apply_torque implementation
+    u = -1 * np.array(u, dtype='float')
+
+    for ii in range(int(np.ceil(dt / 1e-5))):
+        arm.sim.step(arm.state, u)
+    arm.update_state()
+    return [0]
+
+
+def run_benchmark(apply_torque, torques, dt):
+    arm = Arm()
+
+    timestamp = time.time()
+    for u in torques:
+        apply_torque(arm, u, dt)
+    t_run = time.time() - timestamp
+
+    return len(torques) / t_run, np.hstack([arm.q, arm.dq])
+
+
+parser = argparse.ArgumentParser(
+    description='Microbenchmark of the three-link arm simulation step.')
+parser.add_argument(
+    '--steps', type=int, default=2000,
+    help='Number of arm steps (simulation timesteps) to run.')
+parser.add_argument(
+    '--dt', type=float, default=0.001,
+    help='Simulation timestep.')
+parser.add_argument(
+    '--seed', type=int, default=1,
+    help='Random seed.')
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+
+    torques = np.random.RandomState(args.seed).uniform(
+        -1, 1, size=(args.steps, 3))
+
+    loop_rate, loop_state = run_benchmark(apply_torque_loop, torques,
+                                          args.dt)
+    step_n_rate, step_n_state = run_benchmark(
+        lambda arm, u, dt: arm.apply_torque(u, dt), torques, args.dt)
+
+    print('%i arm steps, dt=%g (%i substeps per step)' %
+          (args.steps, args.dt, int(np.ceil(args.dt / 1e-5))))
+    print('per-substep step calls: %10.1f steps/s' % loop_rate)
+    print('step_n:                 %10.1f steps/s (%0.2fx)' %
+          (step_n_rate, step_n_rate / loop_rate))
+    print('max state difference:   %10.2e' %
+          np.max(abs(loop_state - step_n_state)))
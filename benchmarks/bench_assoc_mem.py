@@ -0,0 +1,151 @@
+"""Benchmark of the AssociativeMemory network.
+
+Compares the number of connections and operators, the build time and the
+simulation step time of the AssociativeMemory network (item ensembles in a
+single batched EnsembleArray, batched input and output transforms, and a
+linear WTA network) against the original implementation (one ensemble, and
+one bias, input, utility and output connection per item, and a dense WTA
+transform), for a range of item counts. The RMS difference between the
+outputs of the two implementations (given the same inputs) is reported as a
+sanity check.
+
+Usage: python benchmarks/bench_assoc_mem.py [--items 10 100 1000]
+"""
+from __future__ import print_function
+
+import os
+import sys
+import time
+import argparse
+
+import numpy as np
+
+import nengo
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..'))
+from _spaun._networks import AssociativeMemory  # noqa
+
+
+# ----- Original (one ensemble and set of connections per item) AM -----
+class LoopAssociativeMemory(nengo.Network):
+    exp_scale = AssociativeMemory.exp_scale
+    n_eval_points = AssociativeMemory.n_eval_points
+    am_ens_config = AssociativeMemory.am_ens_config
+
+    def __init__(self, input_vectors, n_neurons=50, threshold=0.3,
+                 wta_inhibit_scale=3.5, wta_synapse=0.005, label=None,
+                 seed=None, add_to_container=None):
+        super(LoopAssociativeMemory, self).__init__(label, seed,
+                                                    add_to_container)
+
+        n_items = input_vectors.shape[0]
+        utility_map_func = AssociativeMemory.filtered_step_func()
+
+        with self, self.am_ens_config:
+            bias_node = nengo.Node(output=1)
+            self.elem_input = nengo.Node(size_in=n_items)
+            self.elem_utilities = nengo.Node(size_in=n_items)
+            self.input = nengo.Node(size_in=input_vectors.shape[1])
+            self.output = nengo.Node(size_in=input_vectors.shape[1])
+            self.output_utilities = nengo.Node(size_in=n_items)
+
+            for i in range(n_items):
+                e = nengo.Ensemble(n_neurons, 1)
+                nengo.Connection(bias_node, e, transform=-threshold)
+                nengo.Connection(self.elem_input[i], e, synapse=None)
+                nengo.Connection(e, self.elem_utilities[i], synapse=None)
+                nengo.Connection(e, self.output, synapse=None,
+                                 transform=input_vectors[i, :, None],
+                                 function=utility_map_func)
+                nengo.Connection(e, self.output_utilities[i], synapse=None,
+                                 function=utility_map_func)
+
+            nengo.Connection(self.input, self.elem_input, synapse=None,
+                             transform=input_vectors)
+            nengo.Connection(self.elem_utilities, self.elem_input,
+                             synapse=wta_synapse,
+                             transform=((np.eye(n_items) - 1) *
+                                        wta_inhibit_scale))
+
+
+def make_am(input_vectors, n_neurons, threshold=0.3, wta_inhibit_scale=3.5):
+    am = AssociativeMemory(input_vectors, n_neurons=n_neurons,
+                           threshold=threshold)
+    am.add_wta_network(wta_inhibit_scale)
+    return am
+
+
+def make_model(am_func, n_neurons, dimensions, num_items, seed):
+    rng = np.random.RandomState(seed)
+    vectors = rng.normal(size=(num_items, dimensions))
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+
+    # Present (at most 10 of) the items in turn (0.1s per item)
+    n_presented = min(num_items, 10)
+    input_vecs = vectors[:n_presented]
+
+    with nengo.Network(seed=seed) as model:
+        model.am = am_func(vectors, n_neurons)
+        nengo.Connection(
+            nengo.Node(lambda t: input_vecs[int(t / 0.1) % n_presented]),
+            model.am.input)
+        model.probe = nengo.Probe(model.am.output, synapse=0.01)
+    return model
+
+
+def run_benchmark(am_func, n_neurons, dimensions, num_items, n_steps, seed):
+    model = make_model(am_func, n_neurons, dimensions, num_items, seed)
+    n_connections = len(model.all_connections)
+
+    timestamp = time.time()
+    sim = nengo.Simulator(model, progress_bar=False)
+    t_build = time.time() - timestamp
+
+    timestamp = time.time()
+    sim.run_steps(n_steps)
+    t_step = (time.time() - timestamp) / n_steps
+
+    output = sim.data[model.probe]
+    if hasattr(sim, 'close'):
+        sim.close()
+    return n_connections, len(sim.model.operators), t_build, t_step, output
+
+
+parser = argparse.ArgumentParser(
+    description='Benchmark of the AssociativeMemory network.')
+parser.add_argument(
+    '--items', type=int, nargs='*', default=[10, 100, 1000],
+    help='Number of associative memory items to benchmark.')
+parser.add_argument(
+    '--dims', type=int, default=64,
+    help='Dimensionality of the associative memory vectors.')
+parser.add_argument(
+    '--n_neurons', type=int, default=50,
+    help='Number of neurons per item ensemble.')
+parser.add_argument(
+    '--steps', type=int, default=500,
+    help='Number of simulation steps used to measure the step time.')
+parser.add_argument(
+    '--seed', type=int, default=1,
+    help='Random seed.')
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+
+    header = ('%5s | %8s %8s | %8s %8s | %9s %9s | %9s %9s | %8s' %
+              ('items', 'conns', 'conns', 'ops', 'ops', 'build(s)',
+               'build(s)', 'step(ms)', 'step(ms)', 'rmse'))
+    print(' ' * 8 + '(original vs. batched)')
+    print(header)
+    print('-' * len(header))
+
+    for num_items in args.items:
+        old = run_benchmark(LoopAssociativeMemory, args.n_neurons, args.dims,
+                            num_items, args.steps, args.seed)
+        new = run_benchmark(make_am, args.n_neurons, args.dims, num_items,
+                            args.steps, args.seed)
+        rmse = np.sqrt(np.mean((old[4] - new[4]) ** 2))
+        print('%5i | %8i %8i | %8i %8i | %9.2f %9.2f | %9.3f %9.3f | %8.4f' %
+              (num_items, old[0], new[0], old[1], new[1], old[2], new[2],
+               old[3] * 1e3, new[3] * 1e3, rmse))
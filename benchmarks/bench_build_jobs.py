@@ -0,0 +1,112 @@
+"""Benchmark of the parallel decoder solving build mode.
+
+Builds a model of (many, large) ensembles with decoded connections computing
+non-trivial functions, with the decoders solved serially (the nengo builder)
+and in a pool of 1, 2, 4, ... worker processes (the `--build_jobs` build mode
+of run_spaun.py). Reports the build time and the speedup relative to the
+serial build for each number of worker processes, and checks that the
+decoders are identical to the serially solved ones.
+
+Usage: python benchmarks/bench_build_jobs.py [--jobs 1 2 4 8]
+"""
+from __future__ import print_function
+
+import os
+import sys
+import time
+import argparse
+import multiprocessing
+
+import numpy as np
+
+import nengo
+from nengo.builder import Model
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..'))
+from _spaun import parallel_build  # noqa
+
+
+def product(x):
+    return np.prod(x)
+
+
+def norm(x):
+    return np.linalg.norm(x)
+
+
+def softmax(x):
+    e = np.exp(3 * (x - np.max(x)))
+    return e / np.sum(e)
+
+
+def make_model(n_ensembles, n_neurons, dimensions, n_eval_points, seed):
+    with nengo.Network(seed=seed) as model:
+        output = nengo.Node(size_in=dimensions + 2)
+        for _ in range(n_ensembles):
+            ens = nengo.Ensemble(n_neurons, dimensions,
+                                 n_eval_points=n_eval_points)
+            nengo.Connection(ens, output[0], function=product)
+            nengo.Connection(ens, output[1], function=norm)
+            nengo.Connection(ens, output[2:], function=softmax)
+    return model
+
+
+def run_benchmark(model, n_jobs):
+    builder_model = Model()
+    if n_jobs is not None:
+        parallel_build.enable_parallel_solves(builder_model, n_jobs)
+
+    timestamp = time.time()
+    sim = nengo.Simulator(model, model=builder_model, progress_bar=False)
+    t_build = time.time() - timestamp
+
+    weights = [sim.data[conn].weights for conn in model.all_connections]
+    if hasattr(sim, 'close'):
+        sim.close()
+    return t_build, weights
+
+
+parser = argparse.ArgumentParser(
+    description='Benchmark of the parallel decoder solving build mode.')
+parser.add_argument(
+    '--jobs', type=int, nargs='*', default=[1, 2, 4, 8],
+    help='Numbers of worker processes to benchmark.')
+parser.add_argument(
+    '--ensembles', type=int, default=32,
+    help='Number of ensembles in the benchmark model.')
+parser.add_argument(
+    '--n_neurons', type=int, default=500,
+    help='Number of neurons per ensemble.')
+parser.add_argument(
+    '--dims', type=int, default=4,
+    help='Dimensionality of the ensembles.')
+parser.add_argument(
+    '--n_eval_points', type=int, default=5000,
+    help='Number of evaluation points per ensemble.')
+parser.add_argument(
+    '--seed', type=int, default=1,
+    help='Random seed.')
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+
+    model = make_model(args.ensembles, args.n_neurons, args.dims,
+                       args.n_eval_points, args.seed)
+    print('%i connections, %i CPUs' % (len(model.all_connections),
+                                       multiprocessing.cpu_count()))
+
+    t_serial, serial_weights = run_benchmark(model, None)
+
+    header = '%6s | %9s | %8s | %9s' % (
+        'jobs', 'build(s)', 'speedup', 'identical')
+    print(header)
+    print('-' * len(header))
+    print('%6s | %9.2f | %8.2f | %9s' % ('serial', t_serial, 1.0, '-'))
+
+    for n_jobs in args.jobs:
+        t_build, weights = run_benchmark(model, n_jobs)
+        identical = all([np.array_equal(w, sw)
+                         for w, sw in zip(weights, serial_weights)])
+        print('%6i | %9.2f | %8.2f | %9s' %
+              (n_jobs, t_build, t_serial / t_build, identical))
@@ -0,0 +1,110 @@
+"""Benchmark of the EnsembleArray neuron inhibition.
+
+Compares the number of connections and operators, the build time and the
+simulation step time of inhibiting every neuron of an EnsembleArray with one
+connection per sub-ensemble (the original `make_inhibitable` implementation)
+against the NeuronInhibition network (one operator per sub-ensemble reading
+the scalar inhibition input, and no connections). The operator counts are
+those of the optimized model, in which both implementations' inhibition is
+merged into a single operator, so the step times are expected to match. The
+RMS difference between the EnsembleArray outputs of the two implementations
+is reported as a sanity check.
+
+Usage: python benchmarks/bench_inhibit.py [--dims 64 128 ...]
+"""
+from __future__ import print_function
+
+import os
+import sys
+import time
+import argparse
+
+import numpy as np
+
+import nengo
+from nengo.networks import EnsembleArray
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..'))
+from _spaun._networks import NeuronInhibition  # noqa
+
+
+def make_model(use_connections, n_neurons, dimensions, inhib_scale, seed):
+    rng = np.random.RandomState(seed)
+    input_vec = rng.uniform(-1, 1, size=dimensions)
+    input_vec /= np.linalg.norm(input_vec)
+
+    with nengo.Network(seed=seed) as model:
+        model.ea = EnsembleArray(n_neurons, dimensions)
+        nengo.Connection(nengo.Node(input_vec), model.ea.input)
+
+        # Inhibition is on for the second half of every 0.2s period
+        inhibit = nengo.Node(lambda t: float((t % 0.2) > 0.1))
+        with model.ea:
+            model.ea.inhibit = NeuronInhibition(
+                model.ea.all_ensembles, inhib_scale,
+                use_connections=use_connections, label='inhibit').input
+        nengo.Connection(inhibit, model.ea.inhibit, synapse=None)
+
+        model.probe = nengo.Probe(model.ea.output, synapse=0.01)
+    return model
+
+
+def run_benchmark(use_connections, n_neurons, dimensions, inhib_scale,
+                  n_steps, seed):
+    model = make_model(use_connections, n_neurons, dimensions, inhib_scale,
+                       seed)
+    n_connections = len(model.all_connections)
+
+    timestamp = time.time()
+    sim = nengo.Simulator(model, progress_bar=False)
+    t_build = time.time() - timestamp
+
+    timestamp = time.time()
+    sim.run_steps(n_steps)
+    t_step = (time.time() - timestamp) / n_steps
+
+    output = sim.data[model.probe]
+    if hasattr(sim, 'close'):
+        sim.close()
+    return n_connections, len(sim.model.operators), t_build, t_step, output
+
+
+parser = argparse.ArgumentParser(
+    description='Benchmark of the EnsembleArray neuron inhibition.')
+parser.add_argument(
+    '--dims', type=int, nargs='*', default=[64, 128, 256, 512, 1024],
+    help='EnsembleArray dimensionalities (number of sub-ensembles) to ' +
+         'benchmark.')
+parser.add_argument(
+    '--n_neurons', type=int, default=50,
+    help='Number of neurons per sub-ensemble.')
+parser.add_argument(
+    '--inhib_scale', type=float, default=3,
+    help='Inhibition scale.')
+parser.add_argument(
+    '--steps', type=int, default=500,
+    help='Number of simulation steps used to measure the step time.')
+parser.add_argument(
+    '--seed', type=int, default=1,
+    help='Random seed.')
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+
+    header = ('%5s | %8s %8s | %8s %8s | %9s %9s | %9s %9s | %8s' %
+              ('dims', 'conns', 'conns', 'ops', 'ops', 'build(s)',
+               'build(s)', 'step(ms)', 'step(ms)', 'rmse'))
+    print(' ' * 8 + '(connections vs. NeuronInhibition)')
+    print(header)
+    print('-' * len(header))
+
+    for dims in args.dims:
+        old = run_benchmark(True, args.n_neurons, dims, args.inhib_scale,
+                            args.steps, args.seed)
+        new = run_benchmark(False, args.n_neurons, dims, args.inhib_scale,
+                            args.steps, args.seed)
+        rmse = np.sqrt(np.mean((old[4] - new[4]) ** 2))
+        print('%5i | %8i %8i | %8i %8i | %9.2f %9.2f | %9.3f %9.3f | %8.4f' %
+              (dims, old[0], new[0], old[1], new[1], old[2], new[2],
+               old[3] * 1e3, new[3] * 1e3, rmse))
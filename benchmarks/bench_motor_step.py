@@ -0,0 +1,100 @@
+"""Benchmark of the motor system simulation step time.
+
+Builds the MotorSystem module on its own (with the OSC ensemble sizes scaled
+by `--scale`), drives it with the motor semantic pointer of a digit (as in
+the copy_draw task, without the vision and decoding systems, whose data files
+are needed to run the full copy_draw preset), and reports the simulation step
+time and the time per step spent in the Python nodes of the motor system
+(arm simulation and arm state nodes, OSC nodes). Run on two revisions to
+compare their step times.
+
+Usage: python benchmarks/bench_motor_step.py [--steps 2000] [--scale 0.1]
+"""
+from __future__ import print_function
+
+import os
+import sys
+import time
+import argparse
+import cProfile
+import pstats
+
+import numpy as np
+
+import nengo
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..'))
+from _spaun.vocabulator import vocab  # noqa
+from _spaun.arms.three_link.config import OSCConfig  # noqa
+from _spaun.modules.motor import mtr_data  # noqa
+
+
+def make_model(digit, scale, seed):
+    for ens_config in [OSCConfig.CB, OSCConfig.M1, OSCConfig.M1_mult,
+                       OSCConfig.M1_null]:
+        ens_config['n_neurons'] = int(ens_config['n_neurons'] * scale)
+
+    stim_sp_labels = (vocab.num_sp_strs + vocab.misc_vis_sp_strs +
+                      vocab.ps_task_vis_sp_strs)
+    vocab.initialize(stim_sp_labels, rng=np.random.RandomState(seed))
+    vocab.initialize_mtr_vocab(mtr_data.dimensions, mtr_data.sps)
+
+    from _spaun.modules.motor_system import MotorSystem
+
+    with nengo.Network(seed=seed) as model:
+        model.mtr = MotorSystem()
+        nengo.Connection(nengo.Node(vocab.mtr.parse(digit).v),
+                         model.mtr.motor_sp_in)
+        model.probe = nengo.Probe(model.mtr.zero_centered_arm_ee_loc)
+    return model
+
+
+def get_node_time(profile, n_steps):
+    # Time per step spent in the (top-level) python functions of the motor
+    # system and OSC modules (i.e. the node functions)
+    mtr_files = ['motor_system.py', 'osc_neurons.py']
+    t_nodes = 0
+    for (filename, _, _), (_, _, _, t_cum, callers) in \
+            pstats.Stats(profile).stats.items():
+        if any([f in filename for f in mtr_files]) and \
+           not any([f in caller[0] for caller in callers
+                    for f in mtr_files]):
+            t_nodes += t_cum
+    return t_nodes / n_steps
+
+
+parser = argparse.ArgumentParser(
+    description='Benchmark of the motor system simulation step time.')
+parser.add_argument(
+    '--steps', type=int, default=2000,
+    help='Number of simulation steps used to measure the step time.')
+parser.add_argument(
+    '--scale', type=float, default=0.1,
+    help='Scale of the OSC ensemble sizes.')
+parser.add_argument(
+    '--digit', type=str, default='ONE',
+    help='Motor semantic pointer (digit) to draw.')
+parser.add_argument(
+    '--seed', type=int, default=1,
+    help='Random seed.')
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+
+    model = make_model(args.digit, args.scale, args.seed)
+    sim = nengo.Simulator(model, progress_bar=False)
+    sim.run_steps(100)
+
+    timestamp = time.time()
+    sim.run_steps(args.steps)
+    t_step = (time.time() - timestamp) / args.steps
+
+    profile = cProfile.Profile()
+    profile.enable()
+    sim.run_steps(args.steps)
+    profile.disable()
+
+    print('Step time: %0.3f ms' % (t_step * 1e3))
+    print('Motor system python node time (profiled): %0.1f us per step' %
+          (get_node_time(profile, args.steps) * 1e6))
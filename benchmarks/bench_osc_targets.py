@@ -0,0 +1,132 @@
+"""Benchmark of the batched OSC decoder target functions.
+
+Compares the time taken to evaluate the decoder targets of the OSC (motor
+control) network connections computing the inertia compensation (Mq dq), the
+Jacobian weighted by the task-space inertia matrix (JEE^T Mx) and the null
+space control signal, per evaluation point (with the per-configuration arm
+methods, as the original connection functions did) against the batched
+target functions (evaluated once on the stack of evaluation points). The
+maximum relative difference between the two sets of targets is reported as a
+sanity check. The build time of the OSC network is then reported, with the
+ensemble sizes scaled by `--scale` (the full-size network needs more than
+8GB of memory to build).
+
+Usage: python benchmarks/bench_osc_targets.py [--scale 0.2]
+"""
+from __future__ import print_function
+
+import os
+import sys
+import time
+import argparse
+
+import numpy as np
+
+import nengo
+from nengo.builder import Model
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..'))
+from _spaun.arms.three_link import Arm  # noqa
+from _spaun.arms.three_link.config import OSCConfig  # noqa
+from _spaun.modules.motor.osc.osc_neurons import OSControllerNengo  # noqa
+
+
+# ----- Original (per evaluation point) target functions -----
+def gen_Mqdq(ctrl, signal):
+    signal = ctrl.config.CB_scaleup(signal)
+    Mq = ctrl.arm.gen_Mq(q=signal[:3])
+    return np.dot(Mq, ctrl.kv * signal[3:6]).flatten()
+
+
+def gen_JEETMx(ctrl, signal):
+    signal = ctrl.config.M1_scaleup(signal)
+    sinq = signal[:3]
+    cosq = signal[3:6]
+    Mx = ctrl.arm.gen_Mx_sinq_cosq(sinq=sinq, cosq=cosq)
+    JEE = ctrl.arm.gen_jacEE_sinq_cosq(sinq=sinq, cosq=cosq)
+    return ctrl.config.DP_scaledown(np.dot(JEE.T, Mx).flatten())
+
+
+def gen_null_signal(ctrl, signal):
+    q = ctrl.config.M1null_scaleup(signal[:3])
+    u_null = (((ctrl.arm.rest_angles - q) + np.pi) % (np.pi * 2) - np.pi)
+
+    Mq = ctrl.arm.gen_Mq(q=q)
+    JEE = ctrl.arm.gen_jacEE(q=q)
+    Mx = ctrl.arm.gen_Mx(q=q)
+
+    u_null = np.dot(Mq, ctrl.kp * u_null)
+    Jdyn_inv = np.dot(Mx, np.dot(JEE, np.linalg.inv(Mq)))
+    null_filter = np.eye(3) - np.dot(JEE.T, Jdyn_inv)
+    return np.dot(null_filter, u_null).flatten()
+
+
+def make_controller():
+    arm = Arm()
+    ctrl = OSControllerNengo(dt=0.001, arm=arm, kp=10, kv=np.sqrt(10),
+                             kv2=np.sqrt(10), arm_class_name='three_link',
+                             init_target=arm.position(q=arm.rest_angles,
+                                                      ee_only=True))
+    return ctrl, ctrl.initialize_model()
+
+
+def get_target_conns(ctrl, net):
+    # Connections with precomputed (batched) targets, and the original
+    # target function of each
+    conns = []
+    for conn in net.all_connections:
+        if not isinstance(conn.function, np.ndarray):
+            continue
+        if conn.pre_obj.dimensions == 3:
+            func = gen_null_signal
+        elif conn.size_mid == 6:
+            func = gen_JEETMx
+        else:
+            func = gen_Mqdq
+        conns.append((conn, func))
+    return conns
+
+
+parser = argparse.ArgumentParser(
+    description='Benchmark of the batched OSC decoder target functions.')
+parser.add_argument(
+    '--scale', type=float, default=0.2,
+    help='Scale of the OSC ensemble sizes used to measure the build time.')
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+
+    # ----- Target function evaluation (full-size network) -----
+    timestamp = time.time()
+    ctrl, net = make_controller()
+    t_batched = time.time() - timestamp
+
+    header = '%-16s | %10s | %10s | %10s' % ('function', 'points',
+                                             'per-point', 'max err')
+    print(header)
+    print('-' * len(header))
+    t_loop = 0
+    for conn, func in get_target_conns(ctrl, net):
+        timestamp = time.time()
+        targets = np.array([func(ctrl, ep) for ep in conn.eval_points])
+        t_func = time.time() - timestamp
+        t_loop += t_func
+
+        err = (np.max(abs(targets - conn.function)) /
+               np.max(abs(targets)))
+        print('%-16s | %10i | %9.2fs | %10.2e' %
+              (func.__name__, len(conn.eval_points), t_func, err))
+    print('Total target evaluation time: %0.2fs per-point, %0.2fs batched '
+          '(including the network creation)' % (t_loop, t_batched))
+
+    # ----- OSC network build time (scaled network) -----
+    for ens_config in [OSCConfig.CB, OSCConfig.M1, OSCConfig.M1_mult,
+                       OSCConfig.M1_null]:
+        ens_config['n_neurons'] = int(ens_config['n_neurons'] * args.scale)
+    ctrl, net = make_controller()
+
+    timestamp = time.time()
+    sim = nengo.Simulator(net, model=Model(), progress_bar=False)
+    print('OSC network build time (scale %0.2f): %0.2fs' %
+          (args.scale, time.time() - timestamp))
@@ -0,0 +1,240 @@
+"""Performance (and correctness) regression suite for the Spaun presets.
+
+For each preset, Spaun is constructed, built (with the reference nengo
+backend, and a fixed seed) and simulated in a separate Python process, by
+default up to the end of the response window of the preset's first response
+cue (so that the first task's responses are produced, see `--sim_time`), and
+the following are recorded:
+  - the build time (construction and build)
+  - the simulation run (wall) time per simulated second
+  - the peak RSS of the process
+  - the response string (the motor outputs written by
+    `experiment.update_output`) produced in the simulated slice
+
+and compared against the thresholds stored in the `--thresholds` file
+(maximum build time, run time per simulated second and peak RSS, and the
+expected response string of each preset). Presets that exceed a threshold
+(speed regressions) or produce a different response string (correctness
+regressions) are reported, and the exit code is then 1. Presets without
+thresholds are reported as failures as well.
+
+The thresholds are recorded on the reference machine with `--save`, which
+stores the measured values (scaled by 1 + `--margin`) and response strings
+of the presets run as the new thresholds of those presets.
+
+Presets are the names of the run_spaun.py stimulus presets, optionally
+followed by configuration presets (joined with '+'), e.g.
+'darpa_adapt_motor1+mtr_adapt_qvelff'.
+
+Note: Requires the Spaun stimulus and vision data (see `cfg.stim_module`
+      and `cfg.vis_module`).
+
+Usage: python benchmarks/bench_presets.py [--presets copy_draw memory_3]
+           [--sim_time 0] [--thresholds preset_thresholds.json] [--save]
+"""
+from __future__ import print_function
+
+import os
+import sys
+import json
+import time
+import argparse
+import subprocess
+from collections import OrderedDict
+
+import nengo
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..'))
+from _spaun.presets import stim_presets, cfg_presets  # noqa
+from bench_spaun_scaling import init_spaun, build_spaun  # noqa
+
+# Recorded values with (maximum value) thresholds
+threshold_metrics = ['build_time', 'run_time_per_sim_sec', 'peak_rss_bytes']
+
+def_presets = ['copy_draw', 'digit_recog', 'memory_3', 'count_3', 'qa_kind',
+               'qa_pos', 'rvc_simple', 'induction_simple',
+               'darpa_adapt_motor1+mtr_adapt_qvelff',
+               'darpa_instr_stim_resp_2', 'darpa_instr_stim_task_2']
+
+
+def get_preset_config(preset):
+    preset_names = preset.split('+')
+    stim_seq_str, instr_seq_str = stim_presets[preset_names[0]]
+    config_list = []
+    for cfg_preset_name in preset_names[1:]:
+        config_list += cfg_presets[cfg_preset_name]
+    return stim_seq_str, instr_seq_str, config_list
+
+
+def get_first_response_time(experiment):
+    """Returns the end time of the response window of the first response
+    cue of the experiment (the start of the next stimulus presented after
+    the cue, or the estimated run time if there is none)."""
+    if len(experiment.response_cues) == 0:
+        return experiment.get_est_simtime()
+
+    cue_ind = experiment.response_cues[0][0]
+    for stim_ind in range(cue_ind + 1, len(experiment.stim_seq_list)):
+        if experiment.stim_seq_list[stim_ind] is not None:
+            return experiment.get_t_ind_start(stim_ind)
+    return experiment.get_est_simtime()
+
+
+def run_preset(preset, sp_dim, sim_time, seed):
+    from _spaun.configurator import cfg
+    from _spaun.experimenter import experiment
+    from _spaun.profiler import get_max_rss_bytes
+
+    stim_seq_str, instr_seq_str, config_list = get_preset_config(preset)
+    init_spaun(stim_seq_str, instr_seq_str, sp_dim=sp_dim, seed=seed,
+               config_list=config_list)
+    model, sim, t_construct, t_build = build_spaun()
+
+    if sim_time == 0:
+        sim_time = get_first_response_time(experiment)
+    elif sim_time < 0:
+        sim_time = experiment.get_est_simtime()
+
+    experiment.reset()
+    timestamp = time.time()
+    sim.run_steps(int(round(sim_time / cfg.sim_dt)))
+    t_run = time.time() - timestamp
+
+    result = OrderedDict()
+    result['sim_time'] = sim_time
+    result['build_time'] = t_construct + t_build
+    result['run_time_per_sim_sec'] = t_run / sim_time
+    result['peak_rss_bytes'] = get_max_rss_bytes()
+    result['output_str'] = experiment.output_str
+
+    if hasattr(sim, 'close'):
+        sim.close()
+    return result
+
+
+def run_preset_process(args, preset):
+    # Run the preset in a new python process (so that the peak RSS of each
+    # preset is measured independently, and the Spaun configuration
+    # singletons start from their defaults)
+    cmd = [sys.executable, os.path.abspath(__file__), '--case',
+           '--presets', preset, '--d', str(args.d),
+           '--sim_time', str(args.sim_time), '--seed', str(args.seed)]
+    output = subprocess.check_output(cmd).decode('utf-8')
+    for line in output.splitlines():
+        if line.startswith('RESULT: '):
+            return json.loads(line[len('RESULT: '):],
+                              object_pairs_hook=OrderedDict)
+    raise RuntimeError('No result from preset "%s":\n%s' % (preset, output))
+
+
+def check_thresholds(preset, result, thresholds):
+    """Returns the list of regressions (descriptions) of the preset. A
+    preset without thresholds is reported as a regression."""
+    if preset not in thresholds:
+        return ['no thresholds (record them with --save)']
+    preset_thresholds = thresholds[preset]
+
+    regressions = []
+    for metric in threshold_metrics:
+        if result[metric] > preset_thresholds[metric]:
+            regressions.append('%s %0.4g > %0.4g' %
+                               (metric, result[metric],
+                                preset_thresholds[metric]))
+    if result['output_str'] != preset_thresholds['output_str']:
+        regressions.append('output_str "%s" != "%s"' %
+                           (result['output_str'],
+                            preset_thresholds['output_str']))
+    return regressions
+
+
+parser = argparse.ArgumentParser(
+    description='Performance regression suite for the Spaun presets.')
+parser.add_argument(
+    '--presets', type=str, nargs='*', default=def_presets,
+    help='Stimulus presets (optionally followed by "+" separated ' +
+         'configuration presets) to run.')
+parser.add_argument(
+    '--d', type=int, default=512,
+    help='Number of dimensions to use for the semantic pointers.')
+parser.add_argument(
+    '--sim_time', type=float, default=0,
+    help='Simulation time (in seconds) to run for each preset. If 0, each ' +
+         'preset is simulated up to the end of the response window of its ' +
+         'first response cue. If < 0, the full (estimated) run time of the ' +
+         'preset is simulated.')
+parser.add_argument(
+    '--seed', type=int, default=1,
+    help='Random seed.')
+parser.add_argument(
+    '--thresholds', type=str,
+    default=os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                         'preset_thresholds.json'),
+    help='Filename of the JSON thresholds file.')
+parser.add_argument(
+    '--save', action='store_true',
+    help='Supply to store the results as the new thresholds of the presets.')
+parser.add_argument(
+    '--margin', type=float, default=0.25,
+    help='Margin (fraction) added to the measured values when storing ' +
+         'thresholds.')
+parser.add_argument(
+    '--case', action='store_true',
+    help='(Internal) Run a single preset (the first of --presets) in this ' +
+         'process.')
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+
+    # Use the decoder cache (as run_spaun.py does for fixed seeds), so that
+    # build times are comparable between runs
+    nengo.rc.set("decoder_cache", "enabled", "True")
+
+    if args.case:
+        result = run_preset(args.presets[0], args.d, args.sim_time,
+                            args.seed)
+        print('RESULT: ' + json.dumps(result))
+        sys.exit(0)
+
+    thresholds = OrderedDict()
+    if os.path.exists(args.thresholds):
+        with open(args.thresholds, 'r') as f:
+            thresholds = json.load(f, object_pairs_hook=OrderedDict)
+
+    header = '%-40s | %8s | %10s | %8s | %-12s | %s' % (
+        'preset', 'build(s)', 'run(s)/sim', 'rss(MB)', 'output', 'status')
+    print(header)
+    print('-' * len(header))
+
+    n_regressions = 0
+    for preset in args.presets:
+        result = run_preset_process(args, preset)
+
+        if args.save:
+            preset_thresholds = OrderedDict()
+            for metric in threshold_metrics:
+                preset_thresholds[metric] = \
+                    result[metric] * (1 + args.margin)
+            preset_thresholds['output_str'] = result['output_str']
+            thresholds[preset] = preset_thresholds
+            status = 'SAVED'
+        else:
+            regressions = check_thresholds(preset, result, thresholds)
+            n_regressions += len(regressions)
+            status = 'OK' if len(regressions) == 0 else \
+                'REGRESSION: ' + '; '.join(regressions)
+
+        print('%-40s | %8.1f | %10.2f | %8.1f | %-12s | %s' %
+              (preset[:40], result['build_time'],
+               result['run_time_per_sim_sec'],
+               result['peak_rss_bytes'] / 1024.0 ** 2, result['output_str'],
+               status))
+
+    if args.save:
+        with open(args.thresholds, 'w') as f:
+            json.dump(thresholds, f, indent=2)
+        print('Thresholds written to: %s' % args.thresholds)
+    elif n_regressions > 0:
+        print('%i REGRESSION(S) (or presets without thresholds)' %
+              n_regressions)
+        sys.exit(1)
@@ -0,0 +1,171 @@
+"""Benchmark of the Selector cross-inhibition.
+
+Compares the number of connections, the build time and the simulation step
+time of the Selector network (one inhibition bus per item) against the
+original pairwise cross-inhibition implementation (one inhibitory connection
+from every selection signal to every ensemble of every other item), for a
+range of item counts and dimensionalities. The RMS difference between the
+outputs of the two implementations (given the same inputs) is reported as a
+sanity check.
+
+Usage: python benchmarks/bench_routing.py [--items 2 4 ...] [--dims 64 ...]
+"""
+from __future__ import print_function
+
+import os
+import sys
+import time
+import argparse
+
+import numpy as np
+
+import nengo
+from nengo.dists import Choice, Exponential
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..'))
+from _spaun._networks.routing import Selector, make_ensarray_func  # noqa
+
+
+# ----- Original (pairwise cross-inhibition) Selector -----
+class PairwiseSelector(nengo.Network):
+    def __init__(self, n_neurons, dimensions, num_items,
+                 make_ens_func=make_ensarray_func, gate_gain=3,
+                 default_sel=None, threshold_sel_in=False,
+                 label=None, seed=None, add_to_container=None, **ens_args):
+        super(PairwiseSelector, self).__init__(label, seed, add_to_container)
+
+        self.ens_elements = []
+        self.sel_nodes = []
+        self.dimensions = dimensions
+
+        with self:
+            bias_node = nengo.Node(output=1)
+
+            self.sel_none = nengo.Ensemble(20, 1)
+            nengo.Connection(bias_node, self.sel_none, synapse=None)
+
+            for n in range(num_items):
+                sel_node = nengo.Node(size_in=1)
+                sel_in = sel_node
+                ens = make_ens_func(n_neurons=n_neurons,
+                                    dimensions=dimensions,
+                                    label='Gate %d' % n, **ens_args)
+
+                if threshold_sel_in:
+                    sel_node = nengo.Ensemble(
+                        50, 1, intercepts=Exponential(0.05, 0.25, 0.5),
+                        encoders=Choice([[1]]), label='Sel In %d' % n)
+                    nengo.Connection(sel_in, sel_node, synapse=None)
+
+                nengo.Connection(sel_node, self.sel_none.neurons,
+                                 transform=([[-gate_gain]] *
+                                            self.sel_none.n_neurons))
+
+                if n != default_sel:
+                    for e in ens.all_ensembles:
+                        nengo.Connection(
+                            self.sel_none, e.neurons,
+                            transform=[[-gate_gain]] * e.n_neurons)
+                for sn in self.sel_nodes:
+                    for e in ens.all_ensembles:
+                        nengo.Connection(
+                            sn, e.neurons,
+                            transform=[[-gate_gain]] * e.n_neurons)
+                for ee in self.ens_elements:
+                    for e in ee.all_ensembles:
+                        nengo.Connection(
+                            sel_node, e.neurons,
+                            transform=[[-gate_gain]] * e.n_neurons)
+
+                self.ens_elements.append(ens)
+                self.sel_nodes.append(sel_node)
+
+                setattr(self, 'sel%i' % n, sel_in)
+
+            self.output = nengo.Node(size_in=self.dimensions)
+            for n, ens in enumerate(self.ens_elements):
+                nengo.Connection(ens.output, self.output, synapse=None)
+                setattr(self, 'input%i' % n, ens.input)
+
+
+def make_model(selector_class, n_neurons, dimensions, num_items, seed):
+    rng = np.random.RandomState(seed)
+    input_vecs = rng.uniform(-1, 1, size=(num_items, dimensions))
+    input_vecs /= np.linalg.norm(input_vecs, axis=1, keepdims=True)
+
+    with nengo.Network(seed=seed) as model:
+        model.sel = selector_class(n_neurons, dimensions, num_items)
+        for n in range(num_items):
+            nengo.Connection(nengo.Node(input_vecs[n]),
+                             getattr(model.sel, 'input%i' % n))
+
+        # Select each item in turn (0.1s per item)
+        sel_input = nengo.Node(
+            lambda t: np.eye(num_items)[int(t / 0.1) % num_items])
+        for n in range(num_items):
+            nengo.Connection(sel_input[n], getattr(model.sel, 'sel%i' % n),
+                             synapse=None)
+
+        model.probe = nengo.Probe(model.sel.output, synapse=0.01)
+    return model
+
+
+def run_benchmark(selector_class, n_neurons, dimensions, num_items, n_steps,
+                  seed):
+    model = make_model(selector_class, n_neurons, dimensions, num_items, seed)
+    n_connections = len(model.all_connections)
+
+    timestamp = time.time()
+    sim = nengo.Simulator(model, progress_bar=False)
+    t_build = time.time() - timestamp
+
+    timestamp = time.time()
+    sim.run_steps(n_steps)
+    t_step = (time.time() - timestamp) / n_steps
+
+    output = sim.data[model.probe]
+    if hasattr(sim, 'close'):
+        sim.close()
+    return n_connections, len(sim.model.operators), t_build, t_step, output
+
+
+parser = argparse.ArgumentParser(
+    description='Benchmark of the Selector cross-inhibition.')
+parser.add_argument(
+    '--items', type=int, nargs='*', default=[2, 4, 6, 8, 10],
+    help='Number of selector items to benchmark.')
+parser.add_argument(
+    '--dims', type=int, nargs='*', default=[64, 128, 256, 512, 1024],
+    help='Selector dimensionalities to benchmark.')
+parser.add_argument(
+    '--n_neurons', type=int, default=50,
+    help='Number of neurons per (1D) ensemble.')
+parser.add_argument(
+    '--steps', type=int, default=500,
+    help='Number of simulation steps used to measure the step time.')
+parser.add_argument(
+    '--seed', type=int, default=1,
+    help='Random seed.')
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+
+    header = ('%5s %5s | %8s %8s | %8s %8s | %9s %9s | %9s %9s | %8s' %
+              ('items', 'dims', 'conns', 'conns', 'ops', 'ops',
+               'build(s)', 'build(s)', 'step(ms)', 'step(ms)', 'rmse'))
+    print(' ' * 14 + '(pairwise vs. bus)')
+    print(header)
+    print('-' * len(header))
+
+    for dims in args.dims:
+        for num_items in args.items:
+            old = run_benchmark(PairwiseSelector, args.n_neurons, dims,
+                                num_items, args.steps, args.seed)
+            new = run_benchmark(Selector, args.n_neurons, dims, num_items,
+                                args.steps, args.seed)
+            rmse = np.sqrt(np.mean((old[4] - new[4]) ** 2))
+            print('%5i %5i | %8i %8i | %8i %8i | %9.2f %9.2f | %9.3f %9.3f '
+                  '| %8.4f' %
+                  (num_items, dims, old[0], new[0], old[1], new[1],
+                   old[2], new[2], old[3] * 1e3, new[3] * 1e3, rmse))
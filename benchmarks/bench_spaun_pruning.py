@@ -0,0 +1,166 @@
+"""Benchmark of the Spaun module and action pruning (the run_spaun.py --prune
+option).
+
+For each preset, Spaun is constructed, built (with the reference nengo
+backend) and run for `--steps` simulation steps (after `--warmup_steps`
+steps) twice, in separate Python processes: once with all the Spaun modules
+and basal ganglia actions (the full model), and once with only the modules
+and actions needed by the tasks in the preset's stimulus sequence (the pruned
+model, see `experiment.get_tasks` and `get_task_modules` in spaun_main). For
+each, the number of neurons and basal ganglia actions, the build time
+(construction and build) and the simulator step rate are reported, along with
+the reductions of the pruned model.
+
+Presets whose tasks cannot be determined from the stimulus sequence (e.g. the
+instructed task presets) are not pruned, and are reported as such.
+
+Note: Requires the Spaun stimulus and vision data (see `cfg.stim_module`
+      and `cfg.vis_module`).
+
+Usage: python benchmarks/bench_spaun_pruning.py [--presets copy_draw qa_pos]
+           [--d 512] [--steps 1000] [--output pruning.json]
+"""
+from __future__ import print_function
+
+import os
+import sys
+import json
+import time
+import argparse
+import subprocess
+from collections import OrderedDict
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..'))
+from _spaun.presets import stim_presets  # noqa
+from bench_spaun_scaling import init_spaun, build_spaun  # noqa
+
+def_presets = ['copy_draw', 'digit_recog', 'memory_3', 'count_3', 'qa_pos',
+               'rvc_simple', 'induction_simple', 'darpa_adapt_motor1',
+               'darpa_instr_stim_resp_2']
+
+
+def run_case(preset, prune, sp_dim, n_steps, n_warmup_steps, seed):
+    from _spaun.configurator import cfg
+    from _spaun.experimenter import experiment
+    from _spaun.spaun_main import get_task_modules
+    from _spaun.utils import get_total_n_neurons
+
+    stim_seq_str, instr_seq_str = stim_presets[preset]
+    init_spaun(stim_seq_str, instr_seq_str, sp_dim=sp_dim, seed=seed)
+
+    tasks = experiment.get_tasks() if prune else None
+    if tasks is not None:
+        cfg.spaun_tasks = sorted(tasks)
+        cfg.spaun_modules = get_task_modules(tasks, cfg.spaun_modules)
+
+    model, sim, t_construct, t_build = build_spaun()
+
+    experiment.reset()
+    sim.run_steps(n_warmup_steps)
+    timestamp = time.time()
+    sim.run_steps(n_steps)
+    t_run = time.time() - timestamp
+
+    result = OrderedDict()
+    result['preset'] = preset
+    result['pruned'] = tasks is not None
+    result['tasks'] = cfg.spaun_tasks
+    result['modules'] = cfg.spaun_modules
+    result['n_neurons'] = get_total_n_neurons(model)
+    result['n_actions'] = model.bg.actions.count
+    result['build_time'] = t_construct + t_build
+    result['step_rate'] = n_steps / t_run
+
+    if hasattr(sim, 'close'):
+        sim.close()
+    return result
+
+
+def run_case_process(args, preset, prune):
+    # Run the case in a new python process (so that the Spaun configuration
+    # singletons start from their defaults)
+    cmd = [sys.executable, os.path.abspath(__file__), '--case',
+           '--presets', preset, '--d', str(args.d),
+           '--steps', str(args.steps),
+           '--warmup_steps', str(args.warmup_steps), '--seed', str(args.seed)]
+    if prune:
+        cmd.append('--prune')
+    output = subprocess.check_output(cmd).decode('utf-8')
+    for line in output.splitlines():
+        if line.startswith('RESULT: '):
+            return json.loads(line[len('RESULT: '):],
+                              object_pairs_hook=OrderedDict)
+    raise RuntimeError('No result from preset "%s" (prune=%s):\n%s' %
+                       (preset, prune, output))
+
+
+parser = argparse.ArgumentParser(
+    description='Benchmark of the Spaun module and action pruning.')
+parser.add_argument(
+    '--presets', type=str, nargs='*', default=def_presets,
+    help='Stimulus presets to benchmark.')
+parser.add_argument(
+    '--d', type=int, default=512,
+    help='Number of dimensions to use for the semantic pointers.')
+parser.add_argument(
+    '--steps', type=int, default=1000,
+    help='Number of simulation steps used to measure the step rate.')
+parser.add_argument(
+    '--warmup_steps', type=int, default=100,
+    help='Number of simulation steps run before measuring the step rate.')
+parser.add_argument(
+    '--seed', type=int, default=1,
+    help='Random seed.')
+parser.add_argument(
+    '--output', type=str, default=None,
+    help='Filename of the JSON results file (optional).')
+parser.add_argument(
+    '--prune', action='store_true',
+    help='(Internal) Prune the model of the --case run.')
+parser.add_argument(
+    '--case', action='store_true',
+    help='(Internal) Run a single preset (the first of --presets) in this ' +
+         'process.')
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+
+    if args.case:
+        result = run_case(args.presets[0], args.prune, args.d, args.steps,
+                          args.warmup_steps, args.seed)
+        print('RESULT: ' + json.dumps(result))
+        sys.exit(0)
+
+    results = []
+
+    header = '%-24s | %-10s | %9s | %7s | %8s | %8s | %s' % (
+        'preset', 'modules', 'neurons', 'actions', 'build(s)', 'steps/s',
+        'reduction (neurons, build time, step time)')
+    print(header)
+    print('-' * len(header))
+    for preset in args.presets:
+        full = run_case_process(args, preset, False)
+        pruned = run_case_process(args, preset, True)
+        results.append(OrderedDict([('full', full), ('pruned', pruned)]))
+
+        for case in [full, pruned]:
+            print('%-24s | %-10s | %9i | %7i | %8.1f | %8.1f |' %
+                  (preset[:24], case['modules'], case['n_neurons'],
+                   case['n_actions'], case['build_time'], case['step_rate']))
+        if pruned['pruned']:
+            print('%-24s | %-10s | %9s | %7s | %8s | %8s | %0.1f%%, %0.1f%%, '
+                  '%0.1f%%' %
+                  ('', '', '', '', '', '',
+                   100 * (1 - pruned['n_neurons'] / float(full['n_neurons'])),
+                   100 * (1 - pruned['build_time'] / full['build_time']),
+                   100 * (1 - full['step_rate'] / pruned['step_rate'])))
+        else:
+            print('%-24s | %-10s | %9s | %7s | %8s | %8s | not pruned (tasks '
+                  'not determined from the stimulus sequence)' %
+                  ('', '', '', '', '', ''))
+
+    if args.output is not None:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print('Results written to: %s' % args.output)
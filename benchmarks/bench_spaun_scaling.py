@@ -0,0 +1,268 @@
+"""Benchmark of how Spaun scales with the semantic pointer dimensionality and
+the modules included in the model.
+
+Constructs, builds (with the reference nengo backend) and runs Spaun for
+each combination of `vocab.sp_dim` (`--dims`) and `cfg.spaun_modules`
+subset (`--modules`), on a fixed stimulus. Each case is run in a separate
+Python process (so that the peak RSS of each case is measured independently,
+and the Spaun configuration singletons start from their defaults). For each
+case, the following are recorded:
+  - the construction and build times
+  - the number of neurons, ensembles, connections and (simulator) operators
+  - the peak RSS of the process (after the simulation run)
+  - the simulator step rate (steps per wall clock second) over `--steps`
+    simulation steps (after `--warmup_steps` steps)
+
+The results are written (in JSON format) to `--output`. If a `--baseline`
+results file is given, each case is compared against the same case (same
+dimensionality and modules) of the baseline, and the cases whose build time,
+peak RSS or step rate are worse than the baseline by more than `--tol`
+(fraction) are reported as regressions (the exit code is then 1). Changes to
+the model size (neuron, ensemble, connection and operator counts) are
+reported as well.
+
+Note: Requires the Spaun stimulus and vision data (see `cfg.stim_module`
+      and `cfg.vis_module`).
+
+Usage: python benchmarks/bench_spaun_scaling.py [--dims 64 128 256 512]
+           [--modules SVPREWTDMI SVPEWDM] [--output results.json]
+           [--baseline baseline.json] [--tol 0.1]
+"""
+from __future__ import print_function
+
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import subprocess
+from collections import OrderedDict
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..'))
+
+# Metrics compared against the baseline, and whether larger values are
+# better (True) or worse (False)
+perf_metrics = OrderedDict([('construct_time', False),
+                            ('build_time', False),
+                            ('peak_rss_bytes', False),
+                            ('step_rate', True)])
+size_metrics = ['n_neurons', 'n_ensembles', 'n_connections', 'n_operators']
+
+
+def init_spaun(stim_seq_str, instr_seq_str='', sp_dim=512, modules=None,
+               seed=1, config_list=()):
+    """Initializes the Spaun configuration, experiment and vocabularies (as
+    run_spaun.py does) for a Spaun model to be constructed with `Spaun()`.
+
+    config_list list: configuration options, in the ARG_NAME=ARG_VALUE
+                      format of the run_spaun.py --config option
+    """
+    from _spaun.configurator import cfg
+    from _spaun.vocabulator import vocab
+    from _spaun.experimenter import experiment
+    from _spaun.loggerator import logger
+
+    # The experiment writes the motor responses to the log file
+    logger.initialize(tempfile.mkdtemp(), 'spaun_bench_log.txt')
+
+    cfg.set_seed(seed)
+    vocab.sp_dim = sp_dim
+    for cfg_options in config_list:
+        cfg_param, cfg_value = cfg_options.split('=', 1)
+        for obj in [cfg, experiment, vocab]:
+            if hasattr(obj, cfg_param):
+                setattr(obj, cfg_param, eval(cfg_value))
+                break
+    if modules is not None:
+        cfg.spaun_modules = modules
+
+    from _spaun.modules.stim import stim_data
+    from _spaun.modules.vision import vis_data
+    from _spaun.modules.motor import mtr_data
+
+    experiment.initialize(stim_seq_str, stim_data.get_image_ind,
+                          stim_data.get_image_label,
+                          cfg.mtr_est_digit_response_time, instr_seq_str,
+                          cfg.rng)
+    vocab.initialize(stim_data.stim_SP_labels, experiment.num_learn_actions,
+                     cfg.rng)
+    vocab.initialize_mtr_vocab(mtr_data.dimensions, mtr_data.sps)
+    vocab.initialize_vis_vocab(vis_data.dimensions, vis_data.sps)
+
+
+def build_spaun():
+    """Constructs and builds (with the reference backend) Spaun. Returns the
+    model, the simulator and the construction and build times."""
+    import nengo
+    from _spaun.configurator import cfg
+    from _spaun.spaun_main import Spaun
+
+    timestamp = time.time()
+    model = Spaun()
+    t_construct = time.time() - timestamp
+
+    timestamp = time.time()
+    sim = nengo.Simulator(model, dt=cfg.sim_dt, progress_bar=False)
+    t_build = time.time() - timestamp
+
+    return model, sim, t_construct, t_build
+
+
+def run_case(sp_dim, modules, stim_seq_str, n_steps, n_warmup_steps, seed):
+    from _spaun.utils import get_total_n_neurons
+    from _spaun.experimenter import experiment
+    from _spaun.profiler import get_max_rss_bytes
+
+    init_spaun(stim_seq_str, sp_dim=sp_dim, modules=modules, seed=seed)
+    model, sim, t_construct, t_build = build_spaun()
+
+    experiment.reset()
+    sim.run_steps(n_warmup_steps)
+    timestamp = time.time()
+    sim.run_steps(n_steps)
+    t_run = time.time() - timestamp
+
+    result = OrderedDict()
+    result['sp_dim'] = sp_dim
+    result['modules'] = modules
+    result['construct_time'] = t_construct
+    result['build_time'] = t_build
+    result['n_neurons'] = get_total_n_neurons(model)
+    result['n_ensembles'] = len(model.all_ensembles)
+    result['n_connections'] = len(model.all_connections)
+    result['n_operators'] = len(sim.model.operators)
+    result['peak_rss_bytes'] = get_max_rss_bytes()
+    result['step_rate'] = n_steps / t_run
+
+    if hasattr(sim, 'close'):
+        sim.close()
+    return result
+
+
+def run_case_process(args, sp_dim, modules):
+    # Run the case in a new python process (see the module docstring)
+    cmd = [sys.executable, os.path.abspath(__file__), '--case',
+           '--dims', str(sp_dim), '--modules', modules,
+           '--stim', args.stim, '--steps', str(args.steps),
+           '--warmup_steps', str(args.warmup_steps), '--seed', str(args.seed)]
+    output = subprocess.check_output(cmd).decode('utf-8')
+    for line in output.splitlines():
+        if line.startswith('RESULT: '):
+            return json.loads(line[len('RESULT: '):],
+                              object_pairs_hook=OrderedDict)
+    raise RuntimeError('No result from benchmark case (sp_dim=%i, '
+                       'modules=%s):\n%s' % (sp_dim, modules, output))
+
+
+def compare_results(results, baseline, tol):
+    """Compares the results with the baseline results. Returns the list of
+    regressions (and prints the comparison of each case)."""
+    baseline_cases = dict([((case['sp_dim'], case['modules']), case)
+                           for case in baseline['cases']])
+
+    regressions = []
+    for case in results['cases']:
+        key = (case['sp_dim'], case['modules'])
+        if key not in baseline_cases:
+            print('%-5i %-12s | not in baseline' % key)
+            continue
+        base_case = baseline_cases[key]
+
+        for metric, higher_is_better in perf_metrics.items():
+            ratio = case[metric] / float(base_case[metric])
+            regressed = (ratio < 1 - tol) if higher_is_better else \
+                (ratio > 1 + tol)
+            print('%-5i %-12s | %-16s | %12.4g | %12.4g | %6.2fx %s' %
+                  (key + (metric, base_case[metric], case[metric], ratio,
+                          'REGRESSION' if regressed else '')))
+            if regressed:
+                regressions.append((key, metric))
+
+        for metric in size_metrics:
+            if case[metric] != base_case[metric]:
+                print('%-5i %-12s | %-16s | %12i | %12i | changed' %
+                      (key + (metric, base_case[metric], case[metric])))
+    return regressions
+
+
+parser = argparse.ArgumentParser(
+    description='Benchmark of how Spaun scales with the semantic pointer ' +
+                'dimensionality and the modules included in the model.')
+parser.add_argument(
+    '--dims', type=int, nargs='*', default=[64, 128, 256, 512],
+    help='Semantic pointer dimensionalities (vocab.sp_dim) to benchmark.')
+parser.add_argument(
+    '--modules', type=str, nargs='*', default=['SVPREWTDMI', 'SVPEWDM'],
+    help='Spaun module subsets (cfg.spaun_modules) to benchmark.')
+parser.add_argument(
+    '--stim', type=str, default='A0[0]?X',
+    help='Stimulus sequence used for the simulation run.')
+parser.add_argument(
+    '--steps', type=int, default=1000,
+    help='Number of simulation steps used to measure the step rate.')
+parser.add_argument(
+    '--warmup_steps', type=int, default=100,
+    help='Number of simulation steps run before measuring the step rate.')
+parser.add_argument(
+    '--seed', type=int, default=1,
+    help='Random seed.')
+parser.add_argument(
+    '--output', type=str, default='spaun_scaling.json',
+    help='Filename of the JSON results file.')
+parser.add_argument(
+    '--baseline', type=str, default=None,
+    help='Filename of the JSON results file to compare the results with.')
+parser.add_argument(
+    '--tol', type=float, default=0.1,
+    help='Relative tolerance of the build time, peak RSS and step rate ' +
+         'comparisons with the baseline.')
+parser.add_argument(
+    '--case', action='store_true',
+    help='(Internal) Run a single case (the first of --dims and --modules) ' +
+         'in this process.')
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+
+    if args.case:
+        result = run_case(args.dims[0], args.modules[0], args.stim,
+                          args.steps, args.warmup_steps, args.seed)
+        print('RESULT: ' + json.dumps(result))
+        sys.exit(0)
+
+    results = OrderedDict()
+    results['config'] = OrderedDict([('stim', args.stim),
+                                     ('steps', args.steps),
+                                     ('warmup_steps', args.warmup_steps),
+                                     ('seed', args.seed)])
+    results['cases'] = []
+
+    header = '%5s %-12s | %9s | %10s | %9s | %8s | %9s | %8s' % (
+        'dim', 'modules', 'neurons', 'ensembles', 'conns', 'build(s)',
+        'rss(MB)', 'steps/s')
+    print(header)
+    print('-' * len(header))
+    for modules in args.modules:
+        for sp_dim in args.dims:
+            case = run_case_process(args, sp_dim, modules)
+            results['cases'].append(case)
+            print('%5i %-12s | %9i | %10i | %9i | %8.1f | %9.1f | %8.1f' %
+                  (sp_dim, modules, case['n_neurons'], case['n_ensembles'],
+                   case['n_connections'], case['build_time'],
+                   case['peak_rss_bytes'] / 1024.0 ** 2, case['step_rate']))
+
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print('Results written to: %s' % args.output)
+
+    if args.baseline is not None:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+        print('\nComparison with baseline: %s' % args.baseline)
+        regressions = compare_results(results, baseline, args.tol)
+        if len(regressions) > 0:
+            print('%i REGRESSION(S) (tolerance %g)' %
+                  (len(regressions), args.tol))
+            sys.exit(1)
@@ -8,7 +8,7 @@ import matplotlib.pyplot as plt
 
 
 # --------------------- DISP_PROBE_DATA CODE DEFAULTS ---------------------
-supported_data_version = 6.1
+supported_data_version = 6.3
 default_filename = ''
 max_lines = 50
 
@@ -62,6 +62,39 @@ if data_filename.endswith('.npz'):
     config_filename = data_filename[:-4] + '_cfg.npz'
     probe_data = np.load(data_filename, encoding='latin1')
 
+    if 'chunk_filenames' in probe_data.keys():
+        # Chunked probe data (long simulation runs). Concatenate the probe
+        # data chunks, only loading the chunks that overlap the time range
+        # to display.
+        chunk_dir = os.path.dirname(data_filename)
+        chunk_list = []
+        for chunk_filename in probe_data['chunk_filenames']:
+            chunk = np.load(os.path.join(chunk_dir, str(chunk_filename)),
+                            encoding='latin1')
+            chunk_trange = chunk['trange']
+            if args.trange is not None and \
+               (chunk_trange[-1] < args.trange[0] or
+                    chunk_trange[0] > args.trange[1]):
+                chunk.close()
+                continue
+            chunk_list.append(chunk)
+
+        if len(chunk_list) <= 0:
+            raise RuntimeError('Filename: %s - No probe data in time range.' %
+                               data_filename)
+
+        chunked_probe_data = {'stim_seq': probe_data['stim_seq'],
+                              'present_interval':
+                              probe_data['present_interval']}
+        for key in chunk_list[0].keys():
+            chunked_probe_data[key] = \
+                np.concatenate([chunk[key] for chunk in chunk_list])
+
+        for chunk in chunk_list:
+            chunk.close()
+        probe_data.close()
+        probe_data = chunked_probe_data
+
 elif data_filename.endswith('.h5'):
     # H5 file format (nengo_mpi)
     config_dir, filename = os.path.split(data_filename[:-3])
@@ -88,6 +121,10 @@ if int(data_version) != int(supported_data_version):
 
 vocab_dict = config_data['vocab_dict'].item()
 ncount_dict = config_data['ncount_dict'].item()
+neuron_inds_dict = config_data['neuron_inds_dict'].item() \
+    if 'neuron_inds_dict' in config_data.keys() else {}
+sample_every_dict = config_data['sample_every_dict'].item() \
+    if 'sample_every_dict' in config_data.keys() else {}
 image_shapes = config_data['image_dict'].item()
 path_limits = config_data['path_dict'].item()
 probe_labels = config_data['label_dict'].item()
@@ -109,6 +146,30 @@ else:
     trange_inds = np.where((trange >= trange_min) & (trange <= trange_max))
 t_data = trange[trange_inds]
 
+
+# Helper function to get the time values (and the time range filtered
+# indices) of the probe data. Probes with a sample_every record one value
+# every sample_every seconds (instead of every timestep).
+def get_probe_trange(probe):
+    if probe not in sample_every_dict:
+        return trange, trange_inds
+
+    sample_every = sample_every_dict[probe]
+    # Note: The probe data may not start at t=0 if only some of the chunks
+    #       of a chunked probe data file have been loaded.
+    sample_start = int(np.floor((trange[0] - sim_dt) / sample_every +
+                                1e-6)) + 1
+    p_trange = sample_every * np.arange(sample_start, sample_start +
+                                        probe_data[probe].shape[0])
+
+    if args.trange is None:
+        p_trange_inds = np.arange(p_trange.shape[0])
+    else:
+        p_trange_inds = np.where((p_trange >= trange_min) &
+                                 (p_trange <= trange_max))
+    return p_trange, p_trange_inds
+
+
 # --------------------- DISPLAY PROBE DATA ---------------------
 print("\nDISPLAYING PROBE DATA.")
 
@@ -228,7 +289,9 @@ if show_grphs:
 
             # Get probe data (filtered by min and max tranges)
             if probe_opts[0] != 'p':
-                p_data = probe_data[probe][trange_inds]
+                p_trange, p_trange_inds = get_probe_trange(probe)
+                p_t_data = p_trange[p_trange_inds]
+                p_data = probe_data[probe][p_trange_inds]
 
             if probe_opts[0] == 'V':
                 # Vector with vocabulary plots
@@ -240,7 +303,7 @@ if show_grphs:
                 plt.gca().set_color_cycle([colormap(i) for i in
                                            np.linspace(0, 0.9, num_classes)])
                 for i in range(num_classes):
-                    plt.plot(t_data,
+                    plt.plot(p_t_data,
                              np.dot(p_data, vocab.vectors.T)[:, i])
                 if len(vocab.keys) < 30 and disp_legend:
                     plot_legend(vocab.keys)
@@ -252,13 +315,13 @@ if show_grphs:
                                                np.linspace(0, 0.9,
                                                            num_dims)])
                     for i in range(num_dims):
-                        plt.plot(t_data, p_data[:, i])
+                        plt.plot(p_t_data, p_data[:, i])
                     if disp_legend:
                         plot_legend(map(str, range(num_dims)))
                 else:
                     # If number of dimensions > max_lines, limit to max_lines
                     # (To avoid excessive memory usage)
-                    plt.plot(t_data, p_data[:, :max_lines])
+                    plt.plot(p_t_data, p_data[:, :max_lines])
             elif probe_opts[0] == 's':
                 # Spike display options
                 height = 0.75  # Height of 1 spike
@@ -284,7 +347,7 @@ if show_grphs:
                      np.linspace(0, 0.8, disp_neuron_count)])
 
                 # Triple the trange (spike plotting oddities)
-                strange = ma.array(t_data).repeat(3)
+                strange = ma.array(p_t_data).repeat(3)
 
                 # Plot the spike plot
                 for nn in range(disp_neuron_count):
@@ -295,8 +358,13 @@ if show_grphs:
                     plt.plot(strange, sdata)
 
                 # Display a legend if specified?
+                # Note: Spike probes may only record from a subset of the
+                #       probed neurons, so map the indices back to the
+                #       indices of the probed neurons
                 if disp_legend:
-                    plot_legend(map(str, spike_ind_sorted + 1))
+                    neuron_inds = neuron_inds_dict.get(
+                        probe, np.arange(total_neuron_count))
+                    plot_legend(map(str, neuron_inds[spike_ind_sorted] + 1))
 
                 plt.ylim(0, disp_neuron_count + 1)
             elif probe_opts[0] == 'i':
@@ -322,7 +390,7 @@ if show_grphs:
                 # Plot the images
                 for im_ind in im_timeline:
                     im_data = p_data[im_ind, :]
-                    im_time = t_data[im_ind]
+                    im_time = p_t_data[im_ind]
                     plt.imshow(process_im_data(im_data, im_shape),
                                cmap=get_cmap(im_shape),
                                interpolation='nearest', aspect=args.aspect,
@@ -338,6 +406,8 @@ if show_grphs:
             elif probe_opts[0] == 'p':
                 probes = probe.split('.')
                 probe_path = probe = probes[0]
+                p_trange, p_trange_inds = get_probe_trange(probe_path)
+                p_t_data = p_trange[p_trange_inds]
                 if len(probes) > 1:
                     probe_pen = probes[1]
 
@@ -345,7 +415,7 @@ if show_grphs:
                     pen_d_threshold = 0.5
                     pen_u_threshold = 0.25
 
-                    pen_raw_data = probe_data[probe_pen][trange_inds]
+                    pen_raw_data = probe_data[probe_pen][p_trange_inds]
                     pen_data = np.zeros(shape=pen_raw_data.shape)
 
                     # Anything above pen_d_threshold is considered down
@@ -364,7 +434,7 @@ if show_grphs:
                     pen_change_inds = np.where(np.diff(pen_data))[0] + 1
                     # Split the time data into different chunks corresponding
                     # to each pen state
-                    t_change = np.split(t_data, pen_change_inds)
+                    t_change = np.split(p_t_data, pen_change_inds)
                     # Split the path data into different chunks corresponding
                     # to each pen state
                     path_change = np.split(probe_data[probe_path],
@@ -374,8 +444,8 @@ if show_grphs:
                     # path at the end of the graph
                     pen_change_inds = [0]
                     pen_data = [1]
-                    t_change = [[0], [t_data[-1]]]
-                    path_change = [[0], probe_data[probe_path][trange_inds]]
+                    t_change = [[0], [p_t_data[-1]]]
+                    path_change = [[0], probe_data[probe_path][p_trange_inds]]
 
                 # Get path limits
                 path_x_limit, path_y_limit = path_limits[probe_path]
@@ -574,4 +644,5 @@ if show_anim:
     anim_obj.start(interval=10)
 
 plt.show()
-probe_data.close()
+if hasattr(probe_data, 'close'):
+    probe_data.close()
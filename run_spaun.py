@@ -12,6 +12,7 @@ from _spaun.vocabulator import vocab
 from _spaun.experimenter import experiment
 from _spaun.loggerator import logger
 from _spaun.utils import get_probe_data_filename
+from _spaun.presets import stim_presets, cfg_presets
 
 # ----- Defaults -----
 def_dim = 512
@@ -19,336 +20,14 @@ def_seq = 'A'
 def_i = ''
 def_mpi_p = 128
 
-# ----- Spaun (character & instruction) presets -----
-stim_presets = {}
-
-# Standard Spaun stimulus presets
-# TODO: Add in configuration options into presets as well?
-stim_presets['copy_draw'] = ('A0[#1]?X', '')
-stim_presets['copy_draw_mult'] = ('A0[#1#2#3]?XXX', '')
-stim_presets['digit_recog'] = ('A1[#1]?XXX', '')
-stim_presets['learning'] = ('A2?{X:30}', '')
-stim_presets['memory_3'] = ('A3[123]?XXXX', '')
-stim_presets['memory_4'] = ('A3[1234]?XXXX', '')
-stim_presets['memory_7'] = ('A3[2567589]?XXXXXXXXX', '')
-stim_presets['count_3'] = ('A4[5][3]?XXXXXX', '')
-stim_presets['count_9'] = ('A4[0][9]?XXXXXXXXXXX', '')
-stim_presets['count_3_list'] = ('A4[321][3]?XXXXXXX', '')
-stim_presets['qa_kind'] = ('A5[123]K[3]?X', '')
-stim_presets['qa_pos'] = ('A5[123]P[1]?X', '')
-stim_presets['rvc_simple'] = ('A6[12][2][82][2][42]?XXXXX', '')
-stim_presets['rvc_complex'] = ('A6[8812][12][8842][42][8862][62][8832]?XXXXX',
-                               '')
-stim_presets['induction_simple'] = ('A7[1][2][3][2][3][4][3][4]?X', '')
-stim_presets['induction_incomplete'] = ('A7[1][2][3][2]?XX', '')
-stim_presets['induction_ravens'] = ('A7[1][11][111][2][22][222][3][33]?XXXXX',
-                                    '')
-
-# Darpa adaptive motor presets
-stim_presets['darpa_adapt_motor1'] = ('{A3[#4#2#7#5]?XXXX:8}', '')
-
-# Darpa imagenet presets
-stim_presets['darpa_imagenet1'] = ('{AC[#BOX_TURTLE][#BOX_TURTLE]?X' +
-                                   'AC[#SEWING_MACHINE][#SEWING_MACHINE]?X' +
-                                   'AC[#GUENON][#GUENON]?X' +
-                                   'AC[#TIBETAN_TERRIER][#TIBETAN_TERRIER]?X' +
-                                   'AC[#PERSIAN_CAT][#PERSIAN_CAT]?X:5}', '')
-stim_presets['darpa_imagenet2'] = ('{AC[#BOX_TURTLE][#SEWING_MACHINE]?X' +
-                                   'AC[#BOX_TURTLE][#GUENON]?X' +
-                                   'AC[#BOX_TURTLE][#TIBETAN_TERRIER]?X' +
-                                   'AC[#BOX_TURTLE][#PERSIAN_CAT]?X:5}', '')
-stim_presets['darpa_imagenet3'] = ('{AC[#SEWING_MACHINE][#BOX_TURTLE]?X' +
-                                   'AC[#SEWING_MACHINE][#GUENON]?X' +
-                                   'AC[#SEWING_MACHINE][#TIBETAN_TERRIER]?X' +
-                                   'AC[#SEWING_MACHINE][#PERSIAN_CAT]?X:5}',
-                                   '')
-stim_presets['darpa_imagenet4'] = ('{AC[#GUENON][#BOX_TURTLE]?X' +
-                                   'AC[#GUENON][#SEWING_MACHINE]?X' +
-                                   'AC[#GUENON][#TIBETAN_TERRIER]?X' +
-                                   'AC[#GUENON][#PERSIAN_CAT]?X:5}', '')
-stim_presets['darpa_imagenet5'] = ('{AC[#TIBETAN_TERRIER][#BOX_TURTLE]?X' +
-                                   'AC[#TIBETAN_TERRIER][#SEWING_MACHINE]?X' +
-                                   'AC[#TIBETAN_TERRIER][#GUENON]?X' +
-                                   'AC[#TIBETAN_TERRIER][#PERSIAN_CAT]?X:5}',
-                                   '')
-stim_presets['darpa_imagenet6'] = ('{AC[#PERSIAN_CAT][#BOX_TURTLE]?X' +
-                                   'AC[#PERSIAN_CAT][#SEWING_MACHINE]?X' +
-                                   'AC[#PERSIAN_CAT][#GUENON]?X' +
-                                   'AC[#PERSIAN_CAT][#TIBETAN_TERRIER]?X:5}',
-                                   '')
-
-# Darpa instruction following presets
-stim_resp_i = 'I1: VIS*ONE, DATA*POS1*NIN;I2: VIS*TWO, DATA*POS1*EIG;' + \
-              'I3: VIS*THR, DATA*POS1*SEV;I4: VIS*FOR, DATA*POS1*SIX;' + \
-              'I5: VIS*FIV, DATA*POS1*FIV;I6: VIS*SIX, DATA*POS1*FOR;' + \
-              'I7: VIS*SEV, DATA*POS1*THR;I8: VIS*EIG, DATA*POS1*TWO;' + \
-              'I9: VIS*NIN, DATA*POS1*ONE;I0: VIS*ZER, DATA*POS1*ZER'
-stim_presets['darpa_instr_stim_resp_2'] = \
-    ('%I1+I2%A9{?1X?2X:5}%I3+I4%A9{?4X?3X:5}', stim_resp_i)
-stim_presets['darpa_instr_stim_resp_3'] = \
-    ('%I1+I2+I3%A9{?1X?2X?3X:5}%I4+I5+I6%A9{?6X?5X?4X:5}', stim_resp_i)
-stim_presets['darpa_instr_stim_resp_4'] = \
-    ('%I1+I2+I3+I4%A9{?1X?2X?3X?4X:5}%I0+I9+I8+I7%A9{?0X?9X?8X?7X:5}',
-     stim_resp_i)
-stim_presets['darpa_instr_stim_resp_5'] = \
-    ('%I1+I2+I3+I4+I5%A9{?1X?2X?3X?4X?5X:5}' +
-     '%I0+I9+I8+I7+I6%A9{?0X?9X?8X?7X?6X:5}', stim_resp_i)
-stim_presets['darpa_instr_stim_resp_6'] = \
-    ('%I1+I2+I3+I4+I5+I6%A9{?1X?2X?3X?4X?5X?6X:5}' +
-     '%I0+I9+I8+I7+I6+I5%A9{?0X?9X?8X?7X?6X?5X:5}', stim_resp_i)
-stim_presets['darpa_instr_stim_resp_7'] = \
-    ('%I1+I2+I3+I4+I5+I6+I7%A9{?1X?2X?3X?4X?5X?6X?7X:5}' +
-     '%I0+I9+I8+I7+I6+I5+I4%A9{?0X?9X?8X?7X?6X?5X?4X:5}', stim_resp_i)
-stim_presets['darpa_instr_stim_resp_8'] = \
-    ('%I1+I2+I3+I4+I5+I6+I7+I8%A9{?1X?2X?3X?4X?5X?6X?7X?8X:5}' +
-     '%I0+I9+I8+I7+I6+I5+I4+I3%A9{?0X?9X?8X?7X?6X?5X?4X?3X:5}', stim_resp_i)
-
-stim_task_i = 'I1: VIS*ONE, TASK*F;I2: VIS*TWO, TASK*C;' + \
-              'I3: VIS*THR, TASK*M + DEC*REV; I4: VIS*FOR, TASK*W;' + \
-              'I5: VIS*FIV, TASK*M; I6: VIS*SIX, TASK*V;' + \
-              'I7: VIS*SEV, TASK*A;I8: VIS*EIG, TASK*REACT+STATE*DIRECT'
-stim_presets['darpa_instr_stim_task_2'] = \
-    ('%I1+I2%{M1.[1][2][3][2][3][4][3][4]?XM2.[0][3]?XXXX:5}' +
-     '%I3+I4%{M3.[321]?XXXM4.[0]?X:5}', stim_task_i)
-stim_presets['darpa_instr_stim_task_3'] = \
-    ('%I1+I2+I3%{M1.[1][2][3][2][3][4][3][4]?XM2.[0][3]?XXXXM3.[321]?XXX:5}' +
-     '%I4+I5+I6%{M4.[0]?XM5.[123]?XXXM6.[13][3][12][2][11]?X:5}', stim_task_i)
-stim_presets['darpa_instr_stim_task_4'] = \
-    ('%I1+I2+I3+I4%{M1.[1][2][3][2][3][4][3][4]?XM2.[0][3]?XXXX' +
-     'M3.[321]?XXXM4.[9]?X:5}%I3+I4+I5+I6%{M3.[987]?XXXM4[0]?X' +
-     'M5.[123]?XXXM6.[13][3][12][2][11]?X:5}', stim_task_i)
-stim_presets['darpa_instr_stim_task_5'] = \
-    ('%I1+I2+I3+I4+I5%{M1.[1][2][3][2][3][4][3][4]?XM2.[0][3]?XXXX' +
-     'M3.[321]?XXXM4.[9]?XM5.[123]?XXX:5}%I4+I5+I6+I7+I8%{M4[0]?X' +
-     'M5.[123]?XXXM6.[13][3][12][2][11]?XM7.[123]P[3]?XM8.?1X?2X:5}',
-     stim_task_i)
-stim_presets['darpa_instr_stim_task_6'] = \
-    ('%I1+I2+I3+I4+I5+I6%{M1.[1][2][3][2][3][4][3][4]?XM2.[0][3]?XXXX' +
-     'M3.[321]?XXXM4.[9]?XM5.[123]?XXXM6.[39][9][38][8][37]?X:5}' +
-     '%I3+I4+I5+I6+I7+I8%{M3.[876]?XXXM4[0]?XM5.[456]?XXX' +
-     'M6.[13][3][12][2][11]?XM7.[123]P[3]?XM8.?1X?2X:5}', stim_task_i)
-
-seq_task_i = 'I1: POS1, TASK*F;I2: POS2, TASK*C;' + \
-             'I3: POS3, TASK*M + DEC*REV; I4: POS4, TASK*W;' + \
-             'I5: POS5, TASK*M; I6: POS6, TASK*V;' + \
-             'I7: POS7, TASK*A;I8: POS8, TASK*REACT+STATE*DIRECT'
-stim_presets['darpa_instr_seq_task_2'] = \
-    ('%I1+I2%{MP1.[1][2][3][2][3][4][3][4]?XMP2.[0][3]?XXXX:5}' +
-     '%I3+I4%{MP3.[321]?XXXMP4.[0]?X:5}', seq_task_i)
-stim_presets['darpa_instr_seq_task_3'] = \
-    ('%I1+I2+I5%{MP1.[1][2][3][2][3][4][3][4]?XMP2.[0][3]?XXXX' +
-     'MP5.[123]?XXX:5}%I3+I4+I6%{MP6.[21][1][24][4][26][6][28]?' +
-     'XXMP4.[0]?XMP3.[321]?XXX:5}', seq_task_i)
-stim_presets['darpa_instr_seq_task_4'] = \
-    ('%I1+I2+I5+I7%{MP1.[1][2][3][2][3][4][3][4]?XMP2.[0][3]?XXXX' +
-     'MP5.[123]?XXXMP7.[123]K[3]?X:5}%I3+I4+I6+I8%{MP8.?1X?2X' +
-     'MP6.[21][1][24][4][26][6][28]?XXMP4.[0]?XMP3.[321]?XXX:5}', seq_task_i)
-stim_presets['darpa_instr_seq_task_5'] = \
-    ('%I1+I2+I5+I7+I3%{MP1.[1][2][3][2][3][4][3][4]?XMP2.[0][3]?XXXX' +
-     'MP5.[123]?XXXMP7.[123]K[3]?XMP3.[456]?XXX:5}' +
-     '%I3+I4+I6+I8+I2%{MP2.[0][1]?XXMP8.?1X?2X' +
-     'MP6.[21][1][24][4][26][6][28]?XXMP4.[0]?XMP3.[321]?XXX:5}', seq_task_i)
-stim_presets['darpa_instr_seq_task_6'] = \
-    ('%I1+I2+I5+I7+I3+I4%{MP1.[1][2][3][2][3][4][3][4]?XMP2.[0][3]?XXXX' +
-     'MP5.[123]?XXXMP7.[123]K[3]?XMP3.[456]?XXXMP4.[5]?X:5}' +
-     '%I3+I4+I6+I8+I2+I5%{MP5.[456]?XXXMP2.[0][1]?XXMP8.?1X?2X' +
-     'MP6.[21][1][24][4][26][6][28]?XXMP4.[0]?XMP3.[321]?XXX:5}', seq_task_i)
-
-stim_presets['darpa_instr_stim_resp_demo1'] = \
-    ('%I1+I2%A9?4X?9X%I1+I2+I3%A9?5XXX',
-     'I1: VIS*FOR, DATA*POS1*TWO; I2: VIS*NIN, DATA*POS1*THR;' +
-     'I3: VIS*FIV, DATA*(POS1*FOR + POS2*TWO + POS3*THR)')
-stim_presets['darpa_instr_stim_resp_demo2'] = \
-    ('%I1+I2%A9?4X?9X%I3+I4%A9?4X?9X',
-     'I1: VIS*FOR, DATA*POS1*TWO; I2: VIS*NIN, DATA*POS1*THR;' +
-     'I3: VIS*FOR, DATA*POS1*ONE; I4: VIS*NIN, DATA*POS1*EIG')
-stim_presets['darpa_instr_stim_task_demo1'] = \
-    ('%I1+I4%M1[#2]?XM2[427]?XXX',
-     'I1: VIS*ONE, TASK*W; I2: VIS*TWO, TASK*R;' +
-     'I3: VIS*ONE, TASK*M + DEC*FWD; I4: VIS*TWO, TASK*M + DEC*REV')
-stim_presets['darpa_instr_stim_task_demo2'] = \
-    ('%I1+I2%M1[<3725>]?XM2[<3725>]?X%I3+I4%M2[427]?XXX',
-     'I1: VIS*ONE, TASK*W; I2: VIS*TWO, TASK*R;' +
-     'I3: VIS*ONE, TASK*M + DEC*FWD; I4: VIS*TWO, TASK*M + DEC*REV')
-stim_presets['darpa_instr_seq_task_demo'] = \
-    ('%I1+I2+I3%MP3[<3725>]?XMP1[427]?XXXV[<3725>]?X',
-     'I1: POS3, TASK*W; I2: POS2, TASK*R;I3: POS1, TASK*M + DEC*FWD')
-
-# def_seq = 'A1[1]?XXA1[22]?XX'
-# def_seq = '{A1[R]?X:5}'
-# def_seq = '{A3[{R:7}]?{X:8}:5}'
-# def_seq = '{A3[{R:7}]?{X:8}:160}'
-# def_seq = 'A3[{R:7}]?{X:8}'
-# def_seq = '%I1+I2%MP1.5[123]?XXXMP1.8[123]?XXX'
-# def_i = 'I1: 0.5*POS1 + 0.5*VIS*FOR, TASK*M + DEC*FWD;' + \
-#         'I2: 0.5*POS1 + 0.5*VIS*EIG, TASK*M + DEC*REV'
-
-# Darpa instruction following + imagenet + adaptive motor presets
-stim_presets['darpa_combined1'] = \
-    ('%I1+I2+I3%{A9?#POLICE_VAN,X?#PUCK,X?#GREY_WHALE,X:5}' +
-     '%I4+I5+I6%{A9?#ORGAN,X?#GREY_WHALE,X?#HALF_TRACK,X:5}' +
-     'A3[938]?XXXA3[456]?XXX',
-     'I1: VIS*GREY_WHALE, DATA*POS1*NIN;' +
-     'I2: VIS*POLICE_VAN, DATA*POS1*SEV;' +
-     'I3: VIS*PUCK, DATA*POS1*THR;' +
-     'I4: VIS*GREY_WHALE, DATA*POS1*EIG;' +
-     'I5: VIS*HALF_TRACK, DATA*POS1*TWO;' +
-     'I6: VIS*ORGAN, DATA*POS1*ONE')
-stim_presets['darpa_combined2'] = \
-    ('%I1+I2+I3%{A9?#1,X?#2,X?#3,X:5}' +
-     '%I4+I5+I6%{A9?#4,X?#3,X?#5,X:5}' +
-     'A3[938]?XXXA3[456]?XXX',
-     'I1: VIS*ONE, DATA*POS1*NIN;' +
-     'I2: VIS*TWO, DATA*POS1*SEV;' +
-     'I3: VIS*THR, DATA*POS1*THR;' +
-     'I4: VIS*FOR, DATA*POS1*EIG;' +
-     'I5: VIS*THR, DATA*POS1*TWO;' +
-     'I6: VIS*FIV, DATA*POS1*ONE')
-stim_presets['darpa_combined_test'] = \
-    ('%I1+I2+I3%{A9?#POLICE_VAN,X?#PUCK,X?#GREY_WHALE,X:1}',
-     'I1: VIS*GREY_WHALE, DATA*POS1*NIN;' +
-     'I2: VIS*POLICE_VAN, DATA*POS1*SEV;' +
-     'I3: VIS*PUCK, DATA*POS1*THR;' +
-     'I4: VIS*GREY_WHALE, DATA*POS1*EIG;' +
-     'I5: VIS*HALF_TRACK, DATA*POS1*TWO;' +
-     'I6: VIS*ORGAN, DATA*POS1*ONE')
-stim_presets['darpa_combined_test2'] = \
-    ('%I1+I2+I3%{A9?#POLICE_VAN,X?#PUCK,X?#GREY_WHALE,X:4}',
-     'I1: VIS*GREY_WHALE, DATA*POS1*NIN;' +
-     'I2: VIS*POLICE_VAN, DATA*POS1*SEV;' +
-     'I3: VIS*PUCK, DATA*POS1*THR;' +
-     'I4: VIS*GREY_WHALE, DATA*POS1*EIG;' +
-     'I5: VIS*HALF_TRACK, DATA*POS1*TWO;' +
-     'I6: VIS*ORGAN, DATA*POS1*ONE')
-stim_presets['darpa_combined_test3'] = \
-    ('%I1+I2+I3%{A9?#1,X?#2,X?#3,X:5}',
-     'I1: VIS*ONE, DATA*POS1*NIN;' +
-     'I2: VIS*TWO, DATA*POS1*SEV;' +
-     'I3: VIS*THR, DATA*POS1*THR;' +
-     'I4: VIS*FOR, DATA*POS1*EIG;' +
-     'I5: VIS*THR, DATA*POS1*TWO;' +
-     'I6: VIS*FIV, DATA*POS1*ONE')
-stim_presets['CBC_combined'] = \
-    ('%I1+I2+I3%{A9?#POLICE_VAN,X?#PUCK,X?#GREY_WHALE,X:1}' +
-     '%I4+I5+I6%{A9?#ORGAN,X?#GREY_WHALE,X?#HALF_TRACK,X:1}',
-     'I1: VIS*GREY_WHALE, DATA*POS1*NIN;' +
-     'I2: VIS*POLICE_VAN, DATA*POS1*SEV;' +
-     'I3: VIS*PUCK, DATA*POS1*THR;' +
-     'I4: VIS*GREY_WHALE, DATA*POS1*EIG;' +
-     'I5: VIS*HALF_TRACK, DATA*POS1*TWO;' +
-     'I6: VIS*ORGAN, DATA*POS1*ONE')
-
-# Thesis instruction following delayed instr stim list task (single task, changing list length)
-stim_resp_i = 'I1: VIS*ONE, DATA*(POS1*NIN + POS2*EIG + POS3*SEV + POS4*SIX);' + \
-              'I2: VIS*TWO, DATA*(POS1*NIN + POS2*EIG + POS3*SEV + POS4*SIX + POS5*FIV);' + \
-              'I3: VIS*THR, DATA*(POS1*NIN + POS2*EIG + POS3*SEV + POS4*SIX + POS5*FIV + POS6*FOR);' + \
-              'I4: VIS*FOR, DATA*(POS1*NIN + POS2*EIG + POS3*SEV + POS4*SIX + POS5*FIV + POS6*FOR + POS7*THR);' + \
-              'I5: VIS*FIV, DATA*(POS1*ZER + POS2*ONE + POS3*TWO + POS4*THR);' + \
-              'I6: VIS*SIX, DATA*(POS1*ZER + POS2*ONE + POS3*TWO + POS4*THR + POS5*FOR);' + \
-              'I7: VIS*SEV, DATA*(POS1*ZER + POS2*ONE + POS3*TWO + POS4*THR + POS5*FOR + POS6*FIV);' + \
-              'I8: VIS*EIG, DATA*(POS1*ZER + POS2*ONE + POS3*TWO + POS4*THR + POS5*FOR + POS6*FIV + POS7*SIX)'
-stim_presets['delay_instr_stim_resp_4'] = \
-    ('%I1%{M1.?XXXXX:5}%I5%{M5.?XXXXX:5}', stim_resp_i)
-stim_presets['delay_instr_stim_resp_5'] = \
-    ('%I2%{M2.?XXXXXX:5}%I6%{M6.?XXXXXX:5}', stim_resp_i)
-stim_presets['delay_instr_stim_resp_6'] = \
-    ('%I3%{M3.?XXXXXXX:5}%I7%{M7.?XXXXXXX:5}', stim_resp_i)
-stim_presets['delay_instr_stim_resp_7'] = \
-    ('%I4%{M4.?XXXXXXXX:5}%I8%{M8.?XXXXXXXX:5}', stim_resp_i)
-
-# -------------------------- Thesis Presets -----------------------------------
-# Thesis instruction following custom tasks test
-stim_resp_i = 'I1: POS1, TASK*A;' + \
-              'I2: POS2, TASK*A + STATE*QAK;' + \
-              'I3: POS3, TASK*A + STATE*QAP'
-stim_presets['instr_custom0'] = \
-    ('%I1+I2+I3%MP1.[2764]P[3]?XV.[2]?XV.[2]?X', stim_resp_i)
-
-stim_resp_i = 'I1: POS1, TASK*V;' + \
-              'I2: POS2, TASK*M;' + \
-              'I3: POS3, TASK*V + STATE*TRANS1'
-stim_presets['instr_custom1'] = \
-    ('%I1+I2+I3%MP1.[1][3][2][4]V.[472]V.?XXX', stim_resp_i)
-
-stim_resp_i = 'I1: POS1, TASK*M;' + \
-              'I2: POS2, TASK*C + STATE*CNT0;' + \
-              'I3: POS3, TASK*A'
-stim_presets['instr_custom2'] = \
-    ('%I1+I2+I3%MP1.[326]V.[3]?XXXXXV.P[2]?X', stim_resp_i)
-
-stim_resp_i = 'I1: POS1, TASK*V;' + \
-              'I2: POS2, TASK*A;' + \
-              'I3: POS3, TASK*F + STATE*TRANS1;' + \
-              'I4: POS4, TASK*F + STATE*TRANS2'
-stim_presets['instr_custom3'] = \
-    ('%I1+I2+I3+I4%MP1.[1][3][2][4]V.[472]P[2]?XXV.?XXXXV.?XX', stim_resp_i)
-
-# Thesis demo graphs
-stim_resp_i = 'I1: VIS*ONE, DATA*POS1*EIG;' + \
-              'I2: VIS*TWO, DATA*POS1*ONE;' + \
-              'I3: VIS*ONE, DATA*POS1*TWO;' + \
-              'I4: VIS*TWO, DATA*POS1*EIG'
-stim_presets['instr_demo_stage2'] = \
-    ('%I1+I2%A9?1X?2X%I3+I4%A9?1X?2X', stim_resp_i)
-stim_presets['instr_demo_stage3'] = \
-    ('%I1+I2%M1?X2?X%I3+I4%M1?X2?X', stim_resp_i)
-
-stim_resp_i = 'I1: VIS*ONE, TASK*M;' + \
-              'I2: VIS*TWO, TASK*A;' + \
-              'I3: VIS*ONE, TASK*C'
-stim_presets['instr_demo_stage4'] = \
-    ('%I1+I2%M1.[523]?XXXXM2.[679]P[2]?XX%I3%M1.[5][2]?XXXX', stim_resp_i)
-
-stim_resp_i = 'I1: POS1, TASK*C;' + \
-              'I2: POS2, TASK*M'
-stim_presets['instr_demo_stage5'] = \
-    ('%I1+I2%MP2.[154]?XXXMP1.[6][1]?XXV.[83]?XX', stim_resp_i)
-
-# ----- Configuration presets -----
-cfg_presets = {}
-cfg_presets['mtr_adapt_qvelff'] = ["mtr_dyn_adaptation=True",
-                                   "mtr_forcefield='QVelForcefield'"]
-cfg_presets['mtr_adapt_constff'] = ["mtr_dyn_adaptation=True",
-                                    "mtr_forcefield='ConstForcefield'"]
-
-cfg_presets['vis_imagenet'] = ["stim_module='imagenet'",
-                               "vis_module='lif_imagenet'"]
-cfg_presets['vis_imagenet_wta'] = ["stim_module='imagenet'",
-                                   "vis_module='lif_imagenet_wta'"]
-
-# Darpa adaptive motor demo configs
-cfg_presets['darpa_adapt_qvelff_demo'] = \
-    ["mtr_dyn_adaptation=True", "mtr_forcefield='QVelForcefield'",
-     "probe_graph_config='ProbeCfgDarpaMotor'"]
-cfg_presets['darpa_adapt_constff_demo'] = \
-    ["mtr_dyn_adaptation=True", "mtr_forcefield='ConstForcefield'",
-     "probe_graph_config='ProbeCfgDarpaMotor'"]
-
-# Darpa imagenet demo configs
-cfg_presets['darpa_vis_imagenet'] = \
-    ["stim_module='imagenet'", "vis_module='lif_imagenet'",
-     "probe_graph_config='ProbeCfgDarpaVisionImagenet'"]
-cfg_presets['darpa_vis_imagenet_wta'] = \
-    ["stim_module='imagenet'", "vis_module='lif_imagenet_wta'",
-     "probe_graph_config='ProbeCfgDarpaVisionImagenet'"]
-
-# Darpa imagenet + instruction following + adaptive motor configs
-cfg_presets['darpa_combined_demo'] = \
-    ["mtr_dyn_adaptation=True", "mtr_forcefield='QVelForcefield'",
-     "stim_module='imagenet'", "vis_module='lif_imagenet'",
-     "probe_graph_config='ProbeCfgDarpaImagenetAdaptMotor'"]
-cfg_presets['darpa_combined_noadapt_demo'] = \
-    ["mtr_dyn_adaptation=False", "mtr_forcefield='QVelForcefield'",
-     "stim_module='imagenet'", "vis_module='lif_imagenet'",
-     "probe_graph_config='ProbeCfgDarpaImagenetAdaptMotor'"]
-cfg_presets['cbc_combined_noadapt_demo'] = \
-    ["mtr_dyn_adaptation=False",
-     "stim_module='imagenet'", "vis_module='lif_imagenet'",
-     "probe_graph_config='ProbeCfgVisMtrMemSpikes'"]
-
-# ----- Definite maximum probe time (if est_sim_time > max_probe_time,
-#       disable probing)
+# ----- Spaun (character & instruction) and configuration presets -----
+# Note: See _spaun/presets.py
+
+# ----- Maximum in-memory probe time (if est_sim_time > max_probe_time, the
+#       simulation is run in chunks of def_probe_chunk_time seconds, and the
+#       probe data is written to disk after each chunk)
 max_probe_time = 80
+def_probe_chunk_time = 10
 
 # ----- Add current directory to system path ---
 cur_dir = os.getcwd()
@@ -376,6 +55,12 @@ parser.add_argument(
          'E.g. For all modules, provide "SVPREWTDMI". Note: Provide a "-" ' +
          'as the first character to exclude all modules listed. E.g. To ' +
          'exclude instruction processing module, provide "-I". ')
+parser.add_argument(
+    '--prune', action='store_true',
+    help='Supply to build only the Spaun modules (see --modules) and basal ' +
+         'ganglia actions needed by the tasks in the stimulus sequence. ' +
+         'Note: Stimulus sequences with instructions (or instructed tasks) ' +
+         'are not pruned, since instructions can switch Spaun to any task.')
 
 parser.add_argument(
     '-t', type=float, default=-1,
@@ -385,6 +70,12 @@ parser.add_argument(
     '-n', type=int, default=1,
     help='Number of batches to run (each batch is a new model).')
 
+parser.add_argument(
+    '--jobs', type=int, default=1,
+    help='Number of batches (see -n) to run in parallel. Each batch is run ' +
+         'in its own process, with its own seed, log file and probe data ' +
+         'file.')
+
 parser.add_argument(
     '-s', type=str, default=def_seq,
     help='Stimulus sequence. Use digits to use canonical digits, prepend a ' +
@@ -433,6 +124,30 @@ parser.add_argument(
 parser.add_argument(
     '--noprobes', action='store_true',
     help='Supply to disable probes.')
+parser.add_argument(
+    '--probe_chunk_time', type=float, default=-1,
+    help='Simulation time (in seconds) to run between writes of the ' +
+         'recorded probe data to disk. Probe data written in chunks is ' +
+         'removed from memory. If undefined, probe data is only written in ' +
+         'chunks (of %gs) if the run time exceeds %gs.' %
+         (def_probe_chunk_time, max_probe_time))
+parser.add_argument(
+    '--telemetry_chunk_time', type=float, default=-1,
+    help='Simulation time (in seconds) to run between records of the run ' +
+         'telemetry (simulation time, wall time, realtime factor, process ' +
+         'RSS and current task), written as a CSV file next to the log ' +
+         'file. Use 0 to record the telemetry after every stimulus ' +
+         'presentation interval. Disabled if undefined.')
+parser.add_argument(
+    '--eta', action='store_true',
+    help='Supply to print the run progress and estimated time remaining ' +
+         'after each telemetry chunk (see --telemetry_chunk_time).')
+parser.add_argument(
+    '--early_stop', action='store_true',
+    help='Supply to stop the simulation run once all of the responses ' +
+         'expected by the stimulus sequence have been produced and the ' +
+         'motor system is idle (instead of running for the estimated ' +
+         'simulation time, which allows for worst-case response times).')
 parser.add_argument(
     '--probeio', action='store_true',
     help='Supply to generate probe data for spaun inputs and outputs.' +
@@ -455,6 +170,32 @@ parser.add_argument(
 parser.add_argument(
     '--enable_cache', action='store_true',
     help='Supply to use nengo caching system when building the nengo model.')
+parser.add_argument(
+    '--share_ens_params', action='store_true',
+    help='Supply to build ensembles with the same parameters (number of ' +
+         'neurons, radius, distributions, etc.) with the same encoders, ' +
+         'gains and biases, and to share the decoders solved for them. ' +
+         'Reduces the build time and memory usage at the cost of neural ' +
+         'heterogeneity. (Reference and OCL backends only)')
+parser.add_argument(
+    '--build_jobs', type=int, default=1,
+    help='Number of worker processes used to solve for the connection ' +
+         'decoders when building the model. Decoders are identical to the ' +
+         'ones solved with one process, but are not cached by the nengo ' +
+         'decoder cache. Note: When combined with --jobs, the batches ' +
+         'already run in worker processes, so the decoders are solved ' +
+         'serially within each batch. (Reference and OCL backends only)')
+
+parser.add_argument(
+    '--model_cache', action='store_true',
+    help='Supply to cache the built model on disk. Subsequent runs with the ' +
+         'same configuration, vocabulary, seed and modules (the stimulus ' +
+         'sequence may differ) load the built model from the cache instead ' +
+         'of rebuilding it. (ref and ocl backends only)')
+parser.add_argument(
+    '--model_cache_dir', type=str, default=None,
+    help='Directory to store the cached built models in. Defaults to ' +
+         '"model_cache" in the data directory.')
 
 parser.add_argument(
     '--ocl', action='store_true',
@@ -516,6 +257,21 @@ parser.add_argument(
          "individually provided using --config). Appends to list of " +
          "configuration options provided through --config.")
 
+parser.add_argument(
+    '--profile', action='store_true',
+    help='Supply to profile the construction and build of each Spaun ' +
+         'module (and its selector, associative memory, circular ' +
+         'convolution and memory block sub-networks). The profile data is ' +
+         'written (in JSON format) next to the log file.')
+
+parser.add_argument(
+    '--node_timing', action='store_true',
+    help='Supply to record the number of calls and run time of each Python ' +
+         'node (output function) during the simulation run. The node ' +
+         'timing table (slowest node first) is printed and written next ' +
+         'to the log file. Models built with and without node timing are ' +
+         'cached separately (see --model_cache).')
+
 parser.add_argument(
     '--debug', action='store_true',
     help='Supply to output debug stuff.')
@@ -543,6 +299,10 @@ if args.spinn:
 
 print("BACKEND: %s" % cfg.backend.upper())
 
+# ----- Build configurations -----
+if args.share_ens_params:
+    cfg.share_ens_params = True
+
 # ----- Stimulus sequence settings -----
 if args.stim_preset in stim_presets:
     stim_seq_str, instr_seq_str = stim_presets[args.stim_preset]
@@ -560,14 +320,17 @@ if args.config_presets is not None:
         if preset_name in cfg_presets:
             config_list += cfg_presets[preset_name]
 
-# ----- Batch runs -----
-for n in range(args.n):
+
+# ----- Single batch run -----
+def run_batch(n):
     print("\n======================== RUN %i OF %i ========================" %
           (n + 1, args.n))
 
     # ----- Seeeeeeeed -----
+    # Note: Batch index is added to the time-based seed so that runs started
+    #       in parallel (see --jobs) do not end up with the same seed.
     if args.seed < 0:
-        seed = int(time.time())
+        seed = int(time.time()) + n
     else:
         seed = args.seed
 
@@ -603,7 +366,9 @@ for n in range(args.n):
 
     # ----- Spaun imports -----
     from _spaun.utils import get_total_n_neurons
-    from _spaun.spaun_main import Spaun
+    from _spaun.spaun_main import Spaun, spaun_module_names
+    from _spaun.spaun_main import get_task_modules
+    from _spaun.profiler import profiler, get_max_rss_bytes, RunTelemetry
 
     from _spaun.modules.stim import stim_data
     from _spaun.modules.vision import vis_data
@@ -637,7 +402,26 @@ for n in range(args.n):
 
         cfg.spaun_modules = used_modules
 
+    # ----- Spaun module and action pruning -----
+    if args.prune:
+        tasks = experiment.get_tasks()
+        if tasks is not None:
+            # Note: Sorted so that the model cache key is deterministic
+            cfg.spaun_tasks = sorted(tasks)
+            cfg.spaun_modules = get_task_modules(tasks, cfg.spaun_modules)
+            print("PRUNED MODEL: tasks %s, modules %s" %
+                  (', '.join(cfg.spaun_tasks), cfg.spaun_modules))
+        else:
+            print("PRUNED MODEL: tasks could not be determined from the " +
+                  "stimulus sequence, building the full model.")
+
     # ----- Configure output log files -----
+    # Note: Parallel runs with a fixed seed would otherwise write to the same
+    #       probe data and log files, so the batch index is added to the tag.
+    tag = args.tag
+    if args.jobs > 1 and args.seed >= 0:
+        tag = '_'.join([str(s) for s in [args.tag, 'run%i' % n] if s != ''])
+
     if cfg.use_mpi:
         sys.path.append('C:\\Users\\xchoo\\GitHub\\nengo_mpi')
 
@@ -646,9 +430,9 @@ for n in range(args.n):
         mpi_saveext = mpi_save[-1]
 
         cfg.probe_data_filename = get_probe_data_filename(mpi_savename,
-                                                          suffix=args.tag)
+                                                          suffix=tag)
     else:
-        cfg.probe_data_filename = get_probe_data_filename(suffix=args.tag)
+        cfg.probe_data_filename = get_probe_data_filename(suffix=tag)
 
     # ----- Initalize looger and write header data -----
     logger.initialize(cfg.data_dir, cfg.probe_data_filename[:-4] + '_log.txt')
@@ -666,41 +450,102 @@ for n in range(args.n):
     # ----- Raw stimulus seq -----
     print("RAW STIM SEQ: %s" % (str(experiment.raw_seq_str)))
 
-    # ----- Spaun proper -----
-    model = Spaun()
-
-    # ----- Display stimulus seq -----
-    print("PROCESSED RAW STIM SEQ: %s" % (str(experiment.raw_seq_list)))
-    print("STIMULUS SEQ: %s" % (str(experiment.stim_seq_list)))
-
     # ----- Calculate runtime -----
     # Note: Moved up here so that we have data to disable probes if necessary
     runtime = args.t if args.t > 0 else experiment.get_est_simtime()
 
-    # ----- Set up probes -----
-    from _spaun import probes as probe_module
-
     make_probes = not args.noprobes
-    if runtime > max_probe_time and make_probes:
-        print(">>> !!! WARNING !!! EST RUNTIME > %0.2fs - DISABLING PROBES" %
-              max_probe_time)
-        make_probes = False
+    make_anim_probes = args.showanim or args.showiofig or args.probeio
+
+    probe_chunk_time = args.probe_chunk_time
+    if probe_chunk_time <= 0 and runtime > max_probe_time:
+        probe_chunk_time = def_probe_chunk_time
+    if probe_chunk_time > 0 and (make_probes or make_anim_probes):
+        print(">>> EST RUNTIME: %0.2fs - WRITING PROBE DATA IN %0.2fs CHUNKS" %
+              (runtime, probe_chunk_time))
+    anim_probe_data_filename = cfg.probe_data_filename[:-4] + '_anim.npz'
+
+    # ----- Built model cache -----
+    cached_model_data = None
+    if args.model_cache:
+        from _spaun import model_cache
+
+        model_cache_dir = args.model_cache_dir
+        if model_cache_dir is None:
+            model_cache_dir = os.path.join(cfg.data_dir, 'model_cache')
+
+        # Note: The node timing option is part of the key, since the node
+        #       output functions are only wrapped for timing when Spaun is
+        #       constructed (see profiler.make_node)
+        model_cache_key = model_cache.get_model_cache_key(
+            make_probes and cfg.probe_graph_config,
+            make_anim_probes and cfg.probe_anim_config,
+            args.node_timing and 'node_timing')
+        cached_model_data = model_cache.load_built_model(model_cache_dir,
+                                                         model_cache_key)
+        print("MODEL CACHE KEY: %s (%s)" %
+              (model_cache_key,
+               'HIT' if cached_model_data is not None else 'MISS'))
+
+    # ----- Enable build profiling -----
+    if args.profile:
+        profiler.reset()
+        profiler.enabled = True
+
+    # ----- Enable python node timing -----
+    # Note: Must be enabled before Spaun is constructed (the node output
+    #       functions are wrapped on node creation)
+    profiler.node_timing = args.node_timing
+
+    if cached_model_data is None:
+        # ----- Spaun proper -----
+        model = Spaun()
+
+        # ----- Set up probes -----
+        from _spaun import probes as probe_module
+
+        if make_probes:
+            default_probe_config = getattr(probe_module,
+                                           cfg.probe_graph_config)
+            probe_cfg = default_probe_config(model, vocab, cfg.sim_dt,
+                                             cfg.data_dir,
+                                             cfg.probe_data_filename)
+
+        # ----- Set up animation probes -----
+        if make_anim_probes:
+            default_anim_config = getattr(probe_module, cfg.probe_anim_config)
+            probe_anim_cfg = default_anim_config(model, vocab,
+                                                 cfg.sim_dt, cfg.data_dir,
+                                                 anim_probe_data_filename)
+    else:
+        # ----- Spaun proper (and probes) from the model cache -----
+        model = cached_model_data['network']
+        logger.write('# Built model loaded from model cache: %s\n' %
+                     model_cache.get_model_cache_filename(model_cache_dir,
+                                                          model_cache_key))
+
+        # Probe configurations need to be pointed to this run's data files
+        if make_probes:
+            probe_cfg = cached_model_data['probe_cfg']
+            probe_cfg.v = vocab
+            probe_cfg.set_data_filename(cfg.data_dir,
+                                        cfg.probe_data_filename)
+            probe_cfg.write_config_to_file()
+        if make_anim_probes:
+            probe_anim_cfg = cached_model_data['probe_anim_cfg']
+            probe_anim_cfg.v = vocab
+            probe_anim_cfg.set_data_filename(cfg.data_dir,
+                                             anim_probe_data_filename)
+            probe_anim_cfg.write_config_to_file()
+
+    # ----- Display stimulus seq -----
+    print("PROCESSED RAW STIM SEQ: %s" % (str(experiment.raw_seq_list)))
+    print("STIMULUS SEQ: %s" % (str(experiment.stim_seq_list)))
 
     if make_probes:
         print("PROBE FILENAME: %s" % cfg.probe_data_filename)
-        default_probe_config = getattr(probe_module, cfg.probe_graph_config)
-        probe_cfg = default_probe_config(model, vocab, cfg.sim_dt,
-                                         cfg.data_dir,
-                                         cfg.probe_data_filename)
-
-    # ----- Set up animation probes -----
-    if args.showanim or args.showiofig or args.probeio:
-        anim_probe_data_filename = cfg.probe_data_filename[:-4] + '_anim.npz'
-        default_anim_config = getattr(probe_module, cfg.probe_anim_config)
+    if make_anim_probes:
         print("ANIM PROBE FILENAME: %s" % anim_probe_data_filename)
-        probe_anim_cfg = default_anim_config(model, vocab,
-                                             cfg.sim_dt, cfg.data_dir,
-                                             anim_probe_data_filename)
 
     # ----- Neuron count debug -----
     print("MODEL N_NEURONS:  %i" % (get_total_n_neurons(model)))
@@ -711,7 +556,8 @@ for n in range(args.n):
     if hasattr(model, 'reward'):
         print("- rewrd n_neurons: %i" % (get_total_n_neurons(model.reward)))
     if hasattr(model, 'bg'):
-        print("- bg    n_neurons: %i" % (get_total_n_neurons(model.bg)))
+        print("- bg    n_neurons: %i (%i actions)" %
+              (get_total_n_neurons(model.bg), model.bg.actions.count))
     if hasattr(model, 'thal'):
         print("- thal  n_neurons: %i" % (get_total_n_neurons(model.thal)))
     if hasattr(model, 'enc'):
@@ -734,6 +580,37 @@ for n in range(args.n):
     print("START BUILD")
     timestamp = time.time()
 
+    # When the built model has been loaded from the model cache, the
+    # simulator is given the built model instead of the network to build
+    if cached_model_data is None:
+        sim_network = model
+        if args.profile:
+            sim_builder_model = profiler.make_builder_model(
+                dt=cfg.sim_dt, label="%s, dt=%f" % (model, cfg.sim_dt))
+        else:
+            sim_builder_model = None
+
+        # Shared ensemble parameters and parallel decoder solving build
+        # modes (nengo builder only)
+        if (cfg.share_ens_params or args.build_jobs > 1) and \
+           (cfg.use_ref or cfg.use_opencl):
+            from nengo.builder import Model
+            from nengo.cache import get_default_decoder_cache
+            from _spaun import shared_params, parallel_build
+
+            if sim_builder_model is None:
+                sim_builder_model = Model(
+                    dt=cfg.sim_dt, label="%s, dt=%f" % (model, cfg.sim_dt),
+                    decoder_cache=get_default_decoder_cache())
+            if cfg.share_ens_params:
+                shared_params.enable_shared_params(sim_builder_model)
+            if args.build_jobs > 1:
+                parallel_build.enable_parallel_solves(sim_builder_model,
+                                                      args.build_jobs)
+    else:
+        sim_network = None
+        sim_builder_model = cached_model_data['builder_model']
+
     if args.nengo_gui:
         # Set environment variables (for nengo_gui)
         if cfg.use_opencl:
@@ -776,10 +653,12 @@ for n in range(args.n):
                 ctx = cl.Context(pltf.get_devices())
                 print("USING DEVICES:")
                 print('  ' + '\n  '.join(map(str, pltf.get_devices())))
-            sim = nengo_ocl.Simulator(model, dt=cfg.sim_dt, context=ctx,
+            sim = nengo_ocl.Simulator(sim_network, dt=cfg.sim_dt,
+                                      model=sim_builder_model, context=ctx,
                                       profiling=args.ocl_profile)
         else:
-            sim = nengo_ocl.Simulator(model, dt=cfg.sim_dt,
+            sim = nengo_ocl.Simulator(sim_network, dt=cfg.sim_dt,
+                                      model=sim_builder_model,
                                       profiling=args.ocl_profile)
     elif cfg.use_mpi:
         import nengo_mpi
@@ -795,8 +674,8 @@ for n in range(args.n):
 
         if args.mpi_p_auto:
             assignments = {}
-            for n, module in enumerate(model.modules):
-                assignments[module] = n
+            for i, module in enumerate(model.modules):
+                assignments[module] = i
             sim = nengo_mpi.Simulator(model, dt=cfg.sim_dt,
                                       assignments=assignments,
                                       save_file=mpi_savefile)
@@ -806,17 +685,136 @@ for n in range(args.n):
                                       partitioner=partitioner,
                                       save_file=mpi_savefile)
     else:
-        sim = nengo.Simulator(model, dt=cfg.sim_dt)
+        sim = nengo.Simulator(sim_network, dt=cfg.sim_dt,
+                              model=sim_builder_model)
 
     t_build = time.time() - timestamp
     timestamp = time.time()
     print("BUILD FINISHED - build time: %fs" % t_build)
+    print("BUILD PEAK RSS: %0.1f MB" % (get_max_rss_bytes() / 1024.0 ** 2))
+    shared_params_state = getattr(getattr(sim, 'model', None),
+                                  'shared_params', None)
+    if shared_params_state is not None:
+        print("SHARED ENSEMBLE PARAMETERS: %s" %
+              shared_params_state.get_stats_str())
+        shared_params_state.clear()
+    deferred_solves = getattr(getattr(sim, 'model', None),
+                              'deferred_solves', None)
+    if deferred_solves is not None:
+        print("PARALLEL DECODER SOLVES: %s" % deferred_solves.get_stats_str())
+
+    # ----- Write build profile data -----
+    if args.profile and (cfg.use_opencl or cfg.use_ref):
+        profile_filename = os.path.join(
+            cfg.data_dir, cfg.probe_data_filename[:-4] + '_profile.json')
+        profiler.write_profile_data(profile_filename, model, sim.model,
+                                    spaun_module_names)
+        profiler.enabled = False
+        print("BUILD PROFILE FILENAME: %s" % profile_filename)
+        timestamp = time.time()
+
+    # ----- Save built model to the model cache -----
+    if args.model_cache and cached_model_data is None and \
+       (cfg.use_opencl or cfg.use_ref):
+        cache_filename = model_cache.save_built_model(
+            model_cache_dir, model_cache_key, model, sim.model,
+            probe_cfg=probe_cfg if make_probes else None,
+            probe_anim_cfg=probe_anim_cfg if make_anim_probes else None)
+        if cache_filename is not None:
+            print("SAVED BUILT MODEL TO CACHE: %s" % cache_filename)
+        timestamp = time.time()
 
     # ----- Spaun simulation run -----
     experiment.reset()
+    profiler.reset_node_times()
+    t_sim_saved = 0.0
     if cfg.use_opencl or cfg.use_ref:
         print("START SIM - est_runtime: %f" % runtime)
-        sim.run(runtime)
+
+        chunked_probe_cfgs = []
+        if make_probes:
+            chunked_probe_cfgs.append(probe_cfg)
+        if make_anim_probes:
+            chunked_probe_cfgs.append(probe_anim_cfg)
+
+        chunk_probes = probe_chunk_time > 0 and len(chunked_probe_cfgs) > 0
+
+        telemetry = None
+        if args.telemetry_chunk_time >= 0:
+            telemetry_chunk_time = args.telemetry_chunk_time
+            if telemetry_chunk_time == 0:
+                telemetry_chunk_time = experiment.present_interval
+            telemetry_filename = os.path.join(
+                cfg.data_dir, cfg.probe_data_filename[:-4] + '_telemetry.csv')
+            telemetry = RunTelemetry(telemetry_filename, runtime,
+                                     print_eta=args.eta)
+            print("RUN TELEMETRY FILENAME: %s" % telemetry_filename)
+
+        if chunk_probes or telemetry is not None or args.early_stop:
+            # Run the simulation in chunks, writing out (and then discarding)
+            # the probe data recorded in each probe chunk, recording the run
+            # telemetry after each telemetry chunk, and checking (after each
+            # stimulus presentation interval) if the run can be stopped
+            from _spaun.probes import clear_sim_probe_data
+
+            n_steps = int(round(runtime / cfg.sim_dt))
+            probe_chunk_steps = n_steps
+            if chunk_probes:
+                probe_chunk_steps = \
+                    max(int(round(probe_chunk_time / cfg.sim_dt)), 1)
+            telemetry_chunk_steps = n_steps
+            if telemetry is not None:
+                telemetry_chunk_steps = \
+                    max(int(round(telemetry_chunk_time / cfg.sim_dt)), 1)
+                telemetry.start()
+            stop_chunk_steps = n_steps
+            if args.early_stop:
+                stop_chunk_steps = max(
+                    int(round(experiment.present_interval / cfg.sim_dt)), 1)
+
+            step = 0
+            run_done = False
+            while not run_done:
+                next_step = min(
+                    n_steps,
+                    (step // probe_chunk_steps + 1) * probe_chunk_steps,
+                    (step // telemetry_chunk_steps + 1) *
+                    telemetry_chunk_steps,
+                    (step // stop_chunk_steps + 1) * stop_chunk_steps)
+                sim.run_steps(next_step - step)
+                step = next_step
+
+                run_done = step >= n_steps or \
+                    (args.early_stop and
+                     experiment.t_responses_done is not None)
+
+                if chunk_probes and (step % probe_chunk_steps == 0 or
+                                     run_done):
+                    for chunked_probe_cfg in chunked_probe_cfgs:
+                        chunked_probe_cfg.write_simdata_chunk(sim)
+                    clear_sim_probe_data(sim)
+                if telemetry is not None and \
+                   (step % telemetry_chunk_steps == 0 or run_done):
+                    telemetry.record(sim.time, experiment.get_task(sim.time))
+
+            if telemetry is not None:
+                telemetry.close()
+
+            if step < n_steps:
+                t_sim_saved = runtime - step * cfg.sim_dt
+                print("EARLY STOP - final %i expected responses produced " %
+                      experiment.response_cues[-1][1] +
+                      "at t=%0.3fs, stopped at t=%0.3fs " %
+                      (experiment.t_responses_done, step * cfg.sim_dt) +
+                      "(saved %0.3fs of %0.3fs simulation time)" %
+                      (t_sim_saved, runtime))
+                logger.write('\n# Early stop at t=%0.3fs (all expected ' %
+                             (step * cfg.sim_dt) +
+                             'responses produced, saved %0.3fs simulation '
+                             'time)\n' % t_sim_saved)
+                runtime = step * cfg.sim_dt
+        else:
+            sim.run(runtime)
 
         # Close output logging file
         logger.close()
@@ -826,6 +824,17 @@ for n in range(args.n):
             sim.print_profiling()
 
         t_simrun = time.time() - timestamp
+
+        # ----- Write python node timing data -----
+        if args.node_timing:
+            node_times_filename = os.path.join(
+                cfg.data_dir,
+                cfg.probe_data_filename[:-4] + '_node_times.txt')
+            profiler.write_node_times(node_times_filename, t_simrun)
+            print(profiler.get_node_times_str(t_simrun))
+            print("NODE TIMING FILENAME: %s" % node_times_filename)
+            profiler.node_timing = False
+
         print("MODEL N_NEURONS: %i" % (get_total_n_neurons(model)))
         print("FINISHED! - Build time: %fs, Sim time: %fs" % (t_build,
                                                               t_simrun))
@@ -900,7 +909,7 @@ for n in range(args.n):
             import subprocess
             subprocess.Popen(subprocess_call_list)
 
-    if (args.showanim or args.showiofig or args.probeio) and not cfg.use_mpi:
+    if make_anim_probes and not cfg.use_mpi:
         print("WRITING ANIMATION PROBE DATA TO FILE")
         probe_anim_cfg.write_simdata_to_file(sim, experiment)
 
@@ -932,7 +941,7 @@ for n in range(args.n):
             import subprocess
             subprocess.Popen(subprocess_call_list)
 
-    if not (make_probes or args.showanim or args.showiofig or args.probeio):
+    if not (make_probes or make_anim_probes):
         logger.write("\n# run_spaun.py was not instructed to record probe " +
                      "data.")
 
@@ -941,16 +950,113 @@ for n in range(args.n):
     rt_file = open(runtime_filename, 'a')
     rt_file.write('# ---------- TIMESTAMP: %i -----------\n' % timestamp)
     rt_file.write('Backend: %s | Num neurons: %i | Tag: %s | Seed: %i\n' %
-                  (cfg.backend, get_total_n_neurons(model), args.tag,
+                  (cfg.backend, get_total_n_neurons(model), tag,
                    cfg.seed))
     if args.config is not None:
         rt_file.write('Config options: %s\n' % (str(args.config)))
     rt_file.write('Build time: %fs | Model sim time: %fs | ' % (t_build,
                                                                 runtime))
-    rt_file.write('Sim wall time: %fs\n' % (t_simrun))
+    rt_file.write('Sim wall time: %fs' % (t_simrun))
+    if t_sim_saved > 0:
+        rt_file.write(' | Early stop saved sim time: %fs' % t_sim_saved)
+    rt_file.write('\n')
     rt_file.close()
 
+    # ----- Gather run statistics (returned to the batch summary) -----
+    run_stats = {'run': n, 'seed': cfg.seed,
+                 'n_neurons': get_total_n_neurons(model),
+                 'probe_data_filename': cfg.probe_data_filename,
+                 't_build': t_build, 't_sim': runtime, 't_simrun': t_simrun,
+                 't_sim_saved': t_sim_saved}
+
     # ----- Cleanup -----
     model = None
     sim = None
     probe_data = None
+
+    return run_stats
+
+
+def run_batch_worker(n):
+    # Wrapper for run_batch so that the exception traceback of a failed
+    # parallel run gets printed by the worker process (instead of being
+    # swallowed by the process pool).
+    try:
+        return run_batch(n)
+    except Exception:
+        import traceback
+        traceback.print_exc()
+        raise
+
+
+def write_batch_summary(run_stats_list, t_batch):
+    summary_strs = ['# ---------- BATCH SUMMARY: %i RUNS (%i JOBS) ---------' %
+                    (len(run_stats_list), args.jobs)]
+    for run_stats in run_stats_list:
+        summary_strs.append(
+            'Run: %i | Seed: %i | Num neurons: %i | Build time: %fs | ' %
+            (run_stats['run'] + 1, run_stats['seed'], run_stats['n_neurons'],
+             run_stats['t_build']) +
+            'Model sim time: %fs | Sim wall time: %fs' %
+            (run_stats['t_sim'], run_stats['t_simrun']) +
+            ' | Early stop saved sim time: %fs' % run_stats['t_sim_saved'])
+
+    t_builds = [run_stats['t_build'] for run_stats in run_stats_list]
+    t_simruns = [run_stats['t_simrun'] for run_stats in run_stats_list]
+    summary_strs.append('Total build time: %fs | Total sim wall time: %fs' %
+                        (sum(t_builds), sum(t_simruns)))
+    summary_strs.append('Mean build time: %fs | Mean sim wall time: %fs' %
+                        (sum(t_builds) / len(t_builds),
+                         sum(t_simruns) / len(t_simruns)))
+    t_sims = [run_stats['t_sim'] for run_stats in run_stats_list]
+    t_sims_saved = [run_stats['t_sim_saved'] for run_stats in run_stats_list]
+    if sum(t_sims_saved) > 0:
+        summary_strs.append(
+            'Total early stop saved sim time: %fs (%0.1f%% of %fs)' %
+            (sum(t_sims_saved), sum(t_sims_saved) /
+             (sum(t_sims) + sum(t_sims_saved)) * 100,
+             sum(t_sims) + sum(t_sims_saved)))
+    summary_strs.append('Batch wall time: %fs' % t_batch)
+
+    print("\n======================== BATCH SUMMARY ========================")
+    print('\n'.join(summary_strs[1:]))
+
+    runtime_filename = os.path.join(args.data_dir, 'runtimes.txt')
+    rt_file = open(runtime_filename, 'a')
+    rt_file.write('\n'.join(summary_strs) + '\n')
+    rt_file.close()
+
+
+# ----- Batch runs -----
+if __name__ == '__main__':
+    timestamp_batch = time.time()
+
+    if args.jobs > 1 and args.n > 1:
+        import multiprocessing
+
+        if args.nengo_gui:
+            raise RuntimeError('Error - nengo_gui cannot be used with ' +
+                               'parallel batch runs (--jobs > 1).')
+
+        print("RUNNING %i BATCHES WITH %i PARALLEL JOBS" %
+              (args.n, min(args.jobs, args.n)))
+
+        # Note: maxtasksperchild=1 so that each run starts from a fresh
+        #       process (cfg, vocab, experiment & logger are module level
+        #       objects that are modified by each run).
+        pool = multiprocessing.Pool(processes=min(args.jobs, args.n),
+                                    maxtasksperchild=1)
+        try:
+            run_stats_list = list(pool.imap_unordered(run_batch_worker,
+                                                      range(args.n)))
+        finally:
+            pool.close()
+            pool.join()
+        run_stats_list = sorted(run_stats_list, key=lambda r: r['run'])
+    else:
+        run_stats_list = [run_batch(n) for n in range(args.n)]
+
+    t_batch = time.time() - timestamp_batch
+
+    if args.n > 1:
+        write_batch_summary(run_stats_list, t_batch)